@@ -17,7 +17,10 @@ Usage:
 """
 
 import argparse
+import importlib.util
+import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Add project root to path
@@ -25,7 +28,10 @@ project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
 from src.config import load_config, get_data_paths
-from src.data_sources import blockchain_com, mempool_space, blockchair
+from src.data_sources import blockchain_com, mempool_space, blockchair, node_rpc
+
+
+logger = logging.getLogger(__name__)
 
 
 def fetch_blockchain_com_data(output_dir: Path, timespan: str = "all") -> dict:
@@ -39,15 +45,17 @@ def fetch_blockchain_com_data(output_dir: Path, timespan: str = "all") -> dict:
     Returns:
         Dictionary of downloaded file paths
     """
-    print("\n" + "=" * 70)
-    print("📥 FETCHING DATA FROM BLOCKCHAIN.COM")
-    print("=" * 70)
+    logger.info("📥 FETCHING DATA FROM BLOCKCHAIN.COM")
     
+    if importlib.util.find_spec('requests_cache') is None:
+        logger.info("   💡 Install requests-cache to serve re-runs from data/cache/")
+    
+    # Chart endpoints are downloaded concurrently through the shared cached session
     paths = blockchain_com.fetch_all_metrics(output_dir, timespan=timespan)
     
     # Also compute fees per block
     if 'fees' in paths and 'blocks' in paths:
-        print("\n📊 Computing fees per block...")
+        logger.info("📊 Computing fees per block...")
         fees_per_block_path = blockchain_com.compute_fees_per_block(
             paths['fees'],
             paths['blocks'],
@@ -70,17 +78,15 @@ def fetch_mempool_space_data(output_dir: Path) -> dict:
     
     Note: Historical data not available via API
     """
-    print("\n" + "=" * 70)
-    print("📥 FETCHING MEMPOOL SNAPSHOT FROM MEMPOOL.SPACE")
-    print("=" * 70)
+    logger.info("📥 FETCHING MEMPOOL SNAPSHOT FROM MEMPOOL.SPACE")
     
     try:
         snapshot = mempool_space.snapshot_current_state(output_dir)
-        print("\n✅ Mempool snapshot saved")
-        print("   💡 For historical data, set up periodic snapshots or use node RPC")
+        logger.info("✅ Mempool snapshot saved")
+        logger.info("   💡 For historical data, set up periodic snapshots or use node RPC")
         return {'mempool_snapshot': 'saved'}
     except Exception as e:
-        print(f"\n❌ Failed to fetch mempool data: {e}")
+        logger.error(f"❌ Failed to fetch mempool data: {e}")
         return {}
 
 
@@ -98,42 +104,80 @@ def fetch_blockchair_data(output_dir: Path, start_date: str, end_date: str) -> d
     
     Note: Blockchair provides real historical block counts, not estimates
     """
-    print("\n" + "=" * 70)
-    print("📥 FETCHING REAL BLOCKS DATA FROM BLOCKCHAIR")
-    print("=" * 70)
+    logger.info("📥 FETCHING REAL BLOCKS DATA FROM BLOCKCHAIR")
     
     try:
         paths = blockchair.fetch_all_metrics(output_dir, start_date, end_date)
         return paths
     except Exception as e:
-        print(f"\n❌ Error fetching from Blockchair: {e}")
+        logger.error(f"❌ Error fetching from Blockchair: {e}")
         return {}
 
 
-def fetch_node_rpc_data(output_dir: Path, start_date: str, end_date: str) -> dict:
+def fetch_node_rpc_data(output_dir: Path, start_date: str, end_date: str, rpc_config: dict) -> dict:
     """
-    Fetch data from Bitcoin Core node via RPC.
+    Fetch block-level data from Bitcoin Core node via RPC.
     
     Args:
         output_dir: Where to save CSVs
         start_date: YYYY-MM-DD
         end_date: YYYY-MM-DD
+        rpc_config: The rpc section of config/settings.yaml
+                   (host, port, user, password, timeout)
     
     Returns:
-        Dictionary of file paths
+        Dictionary of file paths (empty if the node can't be reached)
+    
+    Note: Requires node setup (see node_rpc.py docstring). Blocks already
+          in data/cache/blocks.sqlite are not fetched again.
+    """
+    logger.info("📥 FETCHING DATA FROM BITCOIN CORE NODE")
+    
+    rpc = node_rpc.connect_to_node(
+        rpc_config.get('user', ''),
+        rpc_config.get('password', ''),
+        rpc_config.get('host', '127.0.0.1'),
+        rpc_config.get('port', 8332),
+        rpc_config.get('timeout', 300)
+    )
+    if rpc is None:
+        logger.error("❌ Could not connect to the node - check the rpc section of config/settings.yaml")
+        return {}
+    
+    blocks_path = node_rpc.fetch_blocks_in_date_range(rpc, start_date, end_date, output_dir)
+    fee_rates_path = Path(output_dir) / f"node_rpc_fee_rates_daily_{start_date}_to_{end_date}.csv"
+    
+    return {'node_rpc_blocks': blocks_path, 'node_rpc_fee_rates_daily': fee_rates_path}
+
+
+def fetch_source(source: str, output_dir: Path, args: argparse.Namespace, config: dict) -> dict:
+    """
+    Fetch one data source, catching its errors so other sources keep going.
+    
+    Args:
+        source: Source name ('blockchain_com', 'mempool_space', 'blockchair', 'node_rpc')
+        output_dir: Where to save files
+        args: Parsed CLI arguments (dates, timespan)
+        config: Loaded settings (for the node's RPC credentials)
     
-    Note: Requires node setup (see node_rpc.py docstring)
+    Returns:
+        Dictionary of file paths (empty on failure)
     """
-    print("\n" + "=" * 70)
-    print("📥 FETCHING DATA FROM BITCOIN CORE NODE")
-    print("=" * 70)
+    try:
+        if source == 'blockchain_com':
+            return fetch_blockchain_com_data(output_dir, args.timespan)
+        
+        elif source == 'mempool_space':
+            return fetch_mempool_space_data(output_dir)
+        
+        elif source == 'blockchair':
+            return fetch_blockchair_data(output_dir, args.start_date, args.end_date)
+        
+        elif source == 'node_rpc':
+            return fetch_node_rpc_data(output_dir, args.start_date, args.end_date, config.get('rpc') or {})
     
-    print("\n⚠️  Node RPC data fetching not fully implemented yet")
-    print("   Requires:")
-    print("   1. Bitcoin Core running with txindex=1")
-    print("   2. RPC credentials in config/settings.yaml")
-    print("   3. Implementation of fetch functions in node_rpc.py")
-    print("\n   For now, use Blockchain.com API data")
+    except Exception as e:
+        logger.error(f"❌ Error fetching from {source}: {e}")
     
     return {}
 
@@ -184,14 +228,16 @@ def main():
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+    
     # Load configuration
     try:
         config = load_config()
         paths = get_data_paths(config)
         output_dir = paths['raw']
     except FileNotFoundError:
-        print("❌ Configuration file not found!")
-        print("   Please copy config/settings.example.yaml to config/settings.yaml")
+        logger.error("❌ Configuration file not found!")
+        logger.info("   Please copy config/settings.example.yaml to config/settings.yaml")
         sys.exit(1)
     
     # Determine which sources to use
@@ -200,48 +246,32 @@ def main():
     else:
         sources = args.sources
     
-    print("\n" + "=" * 70)
-    print("🚀 BITCOIN LIQUIDITY CRISIS DATA FETCHER")
-    print("=" * 70)
-    print(f"Sources: {', '.join(sources)}")
-    print(f"Output directory: {output_dir}")
-    print(f"Date range: {args.start_date} to {args.end_date}")
-    print("=" * 70)
+    logger.info("🚀 BITCOIN LIQUIDITY CRISIS DATA FETCHER")
+    logger.info(f"Sources: {', '.join(sources)}")
+    logger.info(f"Output directory: {output_dir}")
+    logger.info(f"Date range: {args.start_date} to {args.end_date}")
     
-    all_paths = {}
+    # Sources are independent network workloads, so fetch them concurrently
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        futures = {
+            executor.submit(fetch_source, source, output_dir, args, config): source
+            for source in sources
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
     
-    # Fetch from each source
+    # Merge in the requested source order so overlapping keys resolve the same way every run
+    all_paths = {}
     for source in sources:
-        try:
-            if source == 'blockchain_com':
-                paths = fetch_blockchain_com_data(output_dir, args.timespan)
-                all_paths.update(paths)
-            
-            elif source == 'mempool_space':
-                paths = fetch_mempool_space_data(output_dir)
-                all_paths.update(paths)
-            
-            elif source == 'blockchair':
-                paths = fetch_blockchair_data(output_dir, args.start_date, args.end_date)
-                all_paths.update(paths)
-            
-            elif source == 'node_rpc':
-                paths = fetch_node_rpc_data(output_dir, args.start_date, args.end_date)
-                all_paths.update(paths)
-        
-        except Exception as e:
-            print(f"\n❌ Error fetching from {source}: {e}")
-            continue
+        all_paths.update(results.get(source) or {})
     
     # Summary
-    print("\n" + "=" * 70)
-    print("✅ DATA FETCHING COMPLETE")
-    print("=" * 70)
-    print(f"Downloaded {len(all_paths)} datasets to {output_dir}")
-    print("\nNext steps:")
-    print("1. Run: python scripts/02_compute_metrics.py")
-    print("2. Then: python scripts/03_make_figures.py")
-    print("=" * 70 + "\n")
+    logger.info("✅ DATA FETCHING COMPLETE")
+    logger.info(f"Downloaded {len(all_paths)} datasets to {output_dir}")
+    logger.info("Next steps:")
+    logger.info("1. Run: python scripts/02_compute_metrics.py")
+    logger.info("2. Then: python scripts/03_make_figures.py")
 
 
 if __name__ == "__main__":
@@ -15,17 +15,28 @@ Usage:
     python scripts/02_compute_metrics.py
     python scripts/02_compute_metrics.py --metrics fees dormancy
     python scripts/02_compute_metrics.py --skip-missing
+    python scripts/02_compute_metrics.py --force
+
+Outputs are cached in data/processed/.cache/ keyed by a hash of the input
+CSVs and of the metric code's source, so re-running with unchanged raw data
+and code just restores the cached results. Use --force to recompute anyway.
 """
 
 import argparse
+import hashlib
+import logging
+import shutil
 import sys
 from pathlib import Path
+from types import ModuleType
+from typing import Dict, List
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
 from src.config import load_config, get_data_paths
+from src.utils.io import ensure_dir, fingerprint
 from src.metrics import (
     fee_rate_urgency,
     fees_and_fee_to_subsidy,
@@ -34,20 +45,141 @@ from src.metrics import (
 )
 
 
-def compute_fee_metrics(raw_dir: Path, processed_dir: Path) -> bool:
+logger = logging.getLogger(__name__)
+
+# Cached metric outputs: data/processed/.cache/{metric}.{inputs_key}.{output_name}
+CACHE_DIRNAME = ".cache"
+
+
+def source_fingerprints(modules: List[ModuleType]) -> Dict[str, str]:
+    """
+    Fingerprint the source of modules and of every project module they use.
+    
+    Dependencies are found by following module attributes: imported
+    modules, and the defining module of imported functions and classes
+    (e.g. save_csv -> src.utils.io), recursively within the src package.
+    
+    Args:
+        modules: Metric modules a group's computation runs
+    
+    Returns:
+        Dictionary mapping module name to its source file's fingerprint
+    """
+    fingerprints = {}
+    pending = list(modules)
+    
+    while pending:
+        module = pending.pop()
+        if module.__name__ in fingerprints:
+            continue
+        fingerprints[module.__name__] = fingerprint(Path(module.__file__))
+        
+        for value in vars(module).values():
+            if isinstance(value, ModuleType):
+                dependency = value
+            else:
+                dependency = sys.modules.get(getattr(value, '__module__', None) or '')
+            if (
+                dependency is not None
+                and dependency.__name__.startswith('src.')
+                and getattr(dependency, '__file__', None)
+            ):
+                pending.append(dependency)
+    
+    return fingerprints
+
+
+def inputs_key(input_paths: List[Path], modules: List[ModuleType]) -> str:
+    """
+    Combine a metric group's input files and code into one key.
+    
+    Args:
+        input_paths: Input CSVs (missing files are skipped)
+        modules: Metric modules the group runs (see source_fingerprints())
+    
+    Returns:
+        32-character hex key; changes if any input is added, removed, or
+        edited, or if the source of the metric code (or any project module
+        it uses) changes
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in input_paths:
+        if path.exists():
+            digest.update(f"{path.name}:{fingerprint(path)};".encode())
+    for name, source_fingerprint in sorted(source_fingerprints(modules).items()):
+        digest.update(f"{name}:{source_fingerprint};".encode())
+    return digest.hexdigest()
+
+
+def restore_cached_outputs(metric: str, key: str, processed_dir: Path) -> bool:
+    """
+    Copy cached outputs for (metric, key) back into processed_dir.
+    
+    Args:
+        metric: Metric group name ('fees', 'dormancy', 'activity')
+        key: Inputs key from inputs_key()
+        processed_dir: Path to data/processed/
+    
+    Returns:
+        True if a cached result was found and restored, False otherwise
+    """
+    prefix = f"{metric}.{key}."
+    cached = list((processed_dir / CACHE_DIRNAME).glob(f"{prefix}*"))
+    
+    if not cached:
+        return False
+    
+    for cached_path in cached:
+        output_path = processed_dir / cached_path.name[len(prefix):]
+        # Leave identical outputs untouched so their mtimes stay stable
+        if output_path.exists() and fingerprint(output_path) == fingerprint(cached_path):
+            continue
+        shutil.copyfile(cached_path, output_path)
+    
+    logger.info(f"   ♻️  Inputs unchanged - restored {len(cached)} cached output(s) for {metric}")
+    return True
+
+
+def store_cached_outputs(
+    metric: str,
+    key: str,
+    output_paths: List[Path],
+    processed_dir: Path
+) -> None:
+    """
+    Save outputs for (metric, key) into the cache, replacing older entries.
+    
+    Args:
+        metric: Metric group name
+        key: Inputs key from inputs_key()
+        output_paths: Output files written by the computation
+        processed_dir: Path to data/processed/
+    """
+    cache_dir = processed_dir / CACHE_DIRNAME
+    ensure_dir(cache_dir)
+    
+    # Drop stale entries for this metric group
+    for stale_path in cache_dir.glob(f"{metric}.*"):
+        stale_path.unlink()
+    
+    for output_path in output_paths:
+        output_path = Path(output_path)
+        shutil.copyfile(output_path, cache_dir / f"{metric}.{key}.{output_path.name}")
+
+
+def compute_fee_metrics(raw_dir: Path, processed_dir: Path, force: bool = False) -> bool:
     """
     Compute fee-related metrics.
     
     Args:
         raw_dir: Path to raw data
         processed_dir: Path to save processed metrics
+        force: Recompute even if the inputs are unchanged
     
     Returns:
         True if successful, False otherwise
     """
-    print("\n" + "=" * 70)
-    print("📊 COMPUTING FEE METRICS")
-    print("=" * 70)
+    logger.info("📊 COMPUTING FEE METRICS")
     
     try:
         # Check for required files
@@ -60,26 +192,37 @@ def compute_fee_metrics(raw_dir: Path, processed_dir: Path) -> bool:
             blocks_csv = raw_dir / "blockchain_com_blocks_per_day.csv"
         
         if not fees_per_block_csv.exists():
-            print(f"❌ Required file not found: {fees_per_block_csv}")
-            print("   Run 01_fetch_data.py first")
+            logger.error(f"❌ Required file not found: {fees_per_block_csv}")
+            logger.info("   Run 01_fetch_data.py first")
             return False
         
+        tx_per_day_csv = raw_dir / "blockchain_com_tx_per_day.csv"
+        key = inputs_key(
+            [fees_per_block_csv, fees_csv, blocks_csv, tx_per_day_csv],
+            [fees_and_fee_to_subsidy, fee_rate_urgency]
+        )
+        if not force and restore_cached_outputs('fees', key, processed_dir):
+            return True
+        
+        outputs = []
+        
         # Compute fee-to-subsidy ratio
-        print("\n📈 Computing fee-to-subsidy ratio...")
+        logger.info("📈 Computing fee-to-subsidy ratio...")
         output_path = fees_and_fee_to_subsidy.compute_fee_to_subsidy_ratio(
             fees_per_block_csv,
             processed_dir
         )
         
         if output_path:
-            print(f"   ✓ Saved: {output_path}")
+            logger.info(f"   ✓ Saved: {output_path}")
+            outputs.append(output_path)
         else:
-            print("   ❌ Failed to compute fee-to-subsidy ratio")
+            logger.error("   ❌ Failed to compute fee-to-subsidy ratio")
             return False
         
         # Estimate fee rate metrics from aggregates
         if fees_csv.exists() and blocks_csv.exists():
-            print("\n📈 Estimating fee rate metrics...")
+            logger.info("📈 Estimating fee rate metrics...")
             from src.metrics.fee_rate_urgency import estimate_fee_rates_from_aggregates
             from src.metrics.fees_and_fee_to_subsidy import compute_fees_per_block
             
@@ -92,96 +235,106 @@ def compute_fee_metrics(raw_dir: Path, processed_dir: Path) -> bool:
             # Estimate fee rates
             fee_rate_path = estimate_fee_rates_from_aggregates(
                 fees_per_block_path,
-                raw_dir / "blockchain_com_tx_per_day.csv",
+                tx_per_day_csv,
                 processed_dir
             )
             
             if fee_rate_path:
-                print(f"   ✓ Saved: {fee_rate_path}")
+                logger.info(f"   ✓ Saved: {fee_rate_path}")
+                outputs.append(fee_rate_path)
             else:
-                print("   ❌ Failed to estimate fee rates")
+                logger.error("   ❌ Failed to estimate fee rates")
                 return False
         
+        store_cached_outputs('fees', key, outputs, processed_dir)
         return True
     
     except Exception as e:
-        print(f"❌ Error computing fee metrics: {e}")
+        logger.error(f"❌ Error computing fee metrics: {e}")
         return False
 
 
-def compute_dormancy_metrics(raw_dir: Path, processed_dir: Path) -> bool:
+def compute_dormancy_metrics(raw_dir: Path, processed_dir: Path, force: bool = False) -> bool:
     """
     Compute dormancy (BDD) metrics.
     
     Args:
         raw_dir: Path to raw data
         processed_dir: Path to save processed metrics
+        force: Recompute even if the inputs are unchanged
     
     Returns:
         True if successful, False otherwise
     """
-    print("\n" + "=" * 70)
-    print("📊 COMPUTING DORMANCY (BDD) METRICS")
-    print("=" * 70)
+    logger.info("📊 COMPUTING DORMANCY (BDD) METRICS")
     
     try:
         bdd_csv = raw_dir / "blockchain_com_bdd.csv"
         
         if not bdd_csv.exists():
-            print(f"❌ Required file not found: {bdd_csv}")
+            logger.error(f"❌ Required file not found: {bdd_csv}")
             return False
         
+        key = inputs_key([bdd_csv], [dormancy_cdd])
+        if not force and restore_cached_outputs('dormancy', key, processed_dir):
+            return True
+        
         output_path = dormancy_cdd.compute_cdd_from_blockchain_com(
             bdd_csv,
             processed_dir
         )
         
         if output_path:
-            print(f"   ✓ Saved: {output_path}")
+            logger.info(f"   ✓ Saved: {output_path}")
+            store_cached_outputs('dormancy', key, [output_path], processed_dir)
             return True
         else:
             return False
     
     except Exception as e:
-        print(f"❌ Error computing dormancy metrics: {e}")
+        logger.error(f"❌ Error computing dormancy metrics: {e}")
         return False
 
 
-def compute_activity_metrics(raw_dir: Path, processed_dir: Path) -> bool:
+def compute_activity_metrics(raw_dir: Path, processed_dir: Path, force: bool = False) -> bool:
     """
     Compute transaction activity metrics.
     
     Args:
         raw_dir: Path to raw data
         processed_dir: Path to save processed metrics
+        force: Recompute even if the inputs are unchanged
     
     Returns:
         True if successful, False otherwise
     """
-    print("\n" + "=" * 70)
-    print("📊 COMPUTING ACTIVITY METRICS")
-    print("=" * 70)
+    logger.info("📊 COMPUTING ACTIVITY METRICS")
     
     try:
         tx_per_day_csv = raw_dir / "blockchain_com_tx_per_day.csv"
         
         if not tx_per_day_csv.exists():
-            print(f"❌ Required file not found: {tx_per_day_csv}")
+            logger.error(f"❌ Required file not found: {tx_per_day_csv}")
             return False
         
+        key = inputs_key([tx_per_day_csv], [mempool_and_tx_activity])
+        if not force and restore_cached_outputs('activity', key, processed_dir):
+            return True
+        
         output_path = mempool_and_tx_activity.process_transactions_per_day(
             tx_per_day_csv,
             processed_dir
         )
         
         if output_path:
-            print(f"   ✓ Saved: {output_path}")
+            logger.info(f"   ✓ Saved: {output_path}")
+            store_cached_outputs('activity', key, [output_path], processed_dir)
             return True
         else:
             return False
     
     except Exception as e:
-        print(f"❌ Error computing activity metrics: {e}")
+        logger.error(f"❌ Error computing activity metrics: {e}")
         return False
 
 
@@ -206,8 +359,16 @@ def main():
         help='Skip metrics with missing input files instead of failing'
     )
     
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Recompute metrics even if their input CSVs are unchanged'
+    )
+    
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+    
     # Load configuration
     try:
         config = load_config()
@@ -215,7 +376,7 @@ def main():
         raw_dir = paths['raw']
         processed_dir = paths['processed']
     except FileNotFoundError:
-        print("❌ Configuration file not found!")
+        logger.error("❌ Configuration file not found!")
         sys.exit(1)
     
     # Determine which metrics to compute
@@ -224,50 +385,44 @@ def main():
     else:
         metrics_to_compute = args.metrics
     
-    print("\n" + "=" * 70)
-    print("🚀 BITCOIN LIQUIDITY CRISIS METRICS COMPUTER")
-    print("=" * 70)
-    print(f"Metrics: {', '.join(metrics_to_compute)}")
-    print(f"Raw data: {raw_dir}")
-    print(f"Output: {processed_dir}")
-    print("=" * 70)
+    logger.info("🚀 BITCOIN LIQUIDITY CRISIS METRICS COMPUTER")
+    logger.info(f"Metrics: {', '.join(metrics_to_compute)}")
+    logger.info(f"Raw data: {raw_dir}")
+    logger.info(f"Output: {processed_dir}")
     
     results = {}
     
     # Compute each metric
     if 'fees' in metrics_to_compute:
-        results['fees'] = compute_fee_metrics(raw_dir, processed_dir)
+        results['fees'] = compute_fee_metrics(raw_dir, processed_dir, args.force)
     
     if 'dormancy' in metrics_to_compute:
-        results['dormancy'] = compute_dormancy_metrics(raw_dir, processed_dir)
+        results['dormancy'] = compute_dormancy_metrics(raw_dir, processed_dir, args.force)
     
     if 'activity' in metrics_to_compute:
-        results['activity'] = compute_activity_metrics(raw_dir, processed_dir)
+        results['activity'] = compute_activity_metrics(raw_dir, processed_dir, args.force)
     
     # Summary
-    print("\n" + "=" * 70)
-    print("✅ METRICS COMPUTATION COMPLETE")
-    print("=" * 70)
+    logger.info("✅ METRICS COMPUTATION COMPLETE")
     
     success_count = sum(1 for v in results.values() if v)
     total_count = len(results)
     
-    print(f"Successfully computed: {success_count}/{total_count} metric groups")
+    logger.info(f"Successfully computed: {success_count}/{total_count} metric groups")
     
     for metric, success in results.items():
         status = "✅" if success else "❌"
-        print(f"  {status} {metric}")
+        logger.info(f"  {status} {metric}")
     
     if success_count > 0:
-        print("\nNext steps:")
-        print("1. Review processed metrics in data/processed/")
-        print("2. Run: python scripts/03_make_figures.py")
+        logger.info("Next steps:")
+        logger.info("1. Review processed metrics in data/processed/")
+        logger.info("2. Run: python scripts/03_make_figures.py")
     else:
-        print("\n⚠️  No metrics computed successfully")
-        print("   Check that raw data exists in data/raw/")
-        print("   Run: python scripts/01_fetch_data.py")
+        logger.warning("⚠️  No metrics computed successfully")
+        logger.info("   Check that raw data exists in data/raw/")
+        logger.info("   Run: python scripts/01_fetch_data.py")
     
-    print("=" * 70 + "\n")
 
 
 if __name__ == "__main__":
@@ -17,8 +17,13 @@ Usage:
 """
 
 import argparse
+import functools
+import logging
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+import pandas as pd
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -26,12 +31,25 @@ sys.path.append(str(project_root))
 
 from src.config import load_config, get_data_paths, get_event_date
 from src.utils.date_windows import build_event_window
-from src.plotting.plot_event_windows import (
-    plot_single_metric,
-    plot_multi_panel_event,
-    plot_pre_vs_crisis_comparison
-)
-from src.pipelines.build_event_dataset import build_event_dataset, load_all_metrics, merge_metrics_on_date
+from src.pipelines.build_event_dataset import build_event_dataset, load_merged_metrics
+
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def _plot_mod():
+    """
+    Import the plotting module on first use.
+    
+    matplotlib is slow to import, so `--help` and early config errors
+    shouldn't pay for it. Cached so the event loop imports it only once.
+    """
+    import matplotlib
+    matplotlib.use('Agg')  # Non-interactive backend: figures are only saved to disk
+    
+    import src.plotting.plot_event_windows as plot_event_windows
+    return plot_event_windows
 
 
 def generate_event_figures(
@@ -39,7 +57,7 @@ def generate_event_figures(
     anchor_date: str,
     days_before: int,
     days_after: int,
-    processed_dir: Path,
+    merged: pd.DataFrame,
     figures_dir: Path
 ) -> list:
     """
@@ -50,37 +68,19 @@ def generate_event_figures(
         anchor_date: Crisis anchor date
         days_before: Pre-crisis window size
         days_after: Crisis window size
-        processed_dir: Path to processed metrics
+        merged: All metrics merged on date (see load_merged_metrics)
         figures_dir: Path to save figures
     
     Returns:
         List of generated figure paths
     """
-    print("\n" + "=" * 70)
-    print(f"📊 GENERATING FIGURES FOR {event_name.upper()}")
-    print("=" * 70)
-    print(f"Anchor: {anchor_date}")
-    print(f"Window: -{days_before} to +{days_after} days")
+    logger.info(f"📊 GENERATING FIGURES FOR {event_name.upper()}")
+    logger.info(f"Anchor: {anchor_date}")
+    logger.info(f"Window: -{days_before} to +{days_after} days")
     
     # Build event window
     window = build_event_window(anchor_date, days_before, days_after)
     
-    # Load metrics
-    print("\n📂 Loading metrics...")
-    metrics = load_all_metrics(processed_dir)
-    
-    if not metrics:
-        print("❌ No metrics found - run 02_compute_metrics.py first!")
-        return []
-    
-    # Merge metrics
-    print("🔗 Merging metrics on date...")
-    merged = merge_metrics_on_date(metrics)
-    
-    if merged.empty:
-        print("❌ Failed to merge metrics")
-        return []
-    
     figure_paths = []
     
     # Create multi-panel figure for this event
@@ -93,7 +93,7 @@ def generate_event_figures(
             'Bitcoin Days Destroyed': (merged[['date', 'bdd']], 'BDD')
         }
         
-        fig_path = plot_multi_panel_event(
+        fig_path = _plot_mod().plot_multi_panel_event(
             metrics_dict,
             event_name,
             anchor_date,
@@ -101,14 +101,38 @@ def generate_event_figures(
             figures_dir
         )
         figure_paths.append(fig_path)
-        print(f"   ✓ Created multi-panel figure: {fig_path}")
+        logger.info(f"   ✓ Created multi-panel figure: {fig_path}")
         
     except Exception as e:
-        print(f"   ⚠️  Failed to create multi-panel: {e}")
+        logger.warning(f"   ⚠️  Failed to create multi-panel: {e}")
     
     return figure_paths
 
 
+# Merged metrics for worker processes (set once per worker by _init_worker)
+_WORKER_MERGED = None
+
+
+def _init_worker(merged: pd.DataFrame) -> None:
+    """Process pool initializer: receive the merged metrics once per worker."""
+    global _WORKER_MERGED
+    _WORKER_MERGED = merged
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+
+
+def _generate_event_figures_worker(
+    event_name: str,
+    anchor_date: str,
+    days_before: int,
+    days_after: int,
+    figures_dir: Path
+) -> list:
+    """Run generate_event_figures() in a worker with its preloaded metrics."""
+    return generate_event_figures(
+        event_name, anchor_date, days_before, days_after, _WORKER_MERGED, figures_dir
+    )
+
+
 def main():
     """Main entry point for figure generation script."""
     
@@ -145,8 +169,17 @@ def main():
         help='Output format for figures'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Worker processes for figure rendering (default: one per event, up to CPU count; 1 = sequential)'
+    )
+    
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+    
     # Load configuration
     try:
         config = load_config()
@@ -154,7 +187,7 @@ def main():
         processed_dir = paths['processed']
         figures_dir = paths['figures']
     except FileNotFoundError:
-        print("❌ Configuration file not found!")
+        logger.error("❌ Configuration file not found!")
         sys.exit(1)
     
     # Get window sizes
@@ -166,57 +199,82 @@ def main():
         events_to_plot = config['events'].items()
     else:
         if args.event not in config['events']:
-            print(f"❌ Unknown event: {args.event}")
-            print(f"   Available: {', '.join(config['events'].keys())}")
+            logger.error(f"❌ Unknown event: {args.event}")
+            logger.info(f"   Available: {', '.join(config['events'].keys())}")
             sys.exit(1)
         events_to_plot = [(args.event, config['events'][args.event])]
     
-    print("\n" + "=" * 70)
-    print("🚀 BITCOIN LIQUIDITY CRISIS FIGURE GENERATOR")
-    print("=" * 70)
-    print(f"Events: {len(events_to_plot)}")
-    print(f"Window: ±{days_before}/{days_after} days")
-    print(f"Output: {figures_dir}")
-    print(f"Format: {args.output_format}")
-    print("=" * 70)
+    logger.info("🚀 BITCOIN LIQUIDITY CRISIS FIGURE GENERATOR")
+    logger.info(f"Events: {len(events_to_plot)}")
+    logger.info(f"Window: ±{days_before}/{days_after} days")
+    logger.info(f"Output: {figures_dir}")
+    logger.info(f"Format: {args.output_format}")
+    
+    # Load and merge metrics once for all events
+    logger.info("📂 Loading metrics...")
+    merged = load_merged_metrics(processed_dir)
+    
+    if merged.empty:
+        logger.error("❌ No metrics found - run 02_compute_metrics.py first!")
+        sys.exit(1)
     
     all_figure_paths = []
     
-    # Generate figures for each event
-    for event_name, anchor_date in events_to_plot:
-        try:
-            fig_paths = generate_event_figures(
-                event_name,
-                anchor_date,
-                days_before,
-                days_after,
-                processed_dir,
-                figures_dir
-            )
-            all_figure_paths.extend(fig_paths)
-        except Exception as e:
-            print(f"\n❌ Error generating figures for {event_name}: {e}")
-            continue
+    workers = args.workers or min(len(events_to_plot), os.cpu_count() or 1)
+    
+    if workers > 1:
+        # Events are independent and rendering is CPU-bound: one process per
+        # event, each receiving the merged metrics once via the initializer
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(merged,)
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _generate_event_figures_worker,
+                    event_name, anchor_date, days_before, days_after, figures_dir
+                ): event_name
+                for event_name, anchor_date in events_to_plot
+            }
+            for future in as_completed(futures):
+                try:
+                    all_figure_paths.extend(future.result())
+                except Exception as e:
+                    logger.error(f"❌ Error generating figures for {futures[future]}: {e}")
+    else:
+        # Generate figures for each event
+        for event_name, anchor_date in events_to_plot:
+            try:
+                fig_paths = generate_event_figures(
+                    event_name,
+                    anchor_date,
+                    days_before,
+                    days_after,
+                    merged,
+                    figures_dir
+                )
+                all_figure_paths.extend(fig_paths)
+            except Exception as e:
+                logger.error(f"❌ Error generating figures for {event_name}: {e}")
+                continue
     
     # Summary
-    print("\n" + "=" * 70)
-    print("✅ FIGURE GENERATION COMPLETE")
-    print("=" * 70)
-    print(f"Generated {len(all_figure_paths)} figures in {figures_dir}")
+    logger.info("✅ FIGURE GENERATION COMPLETE")
+    logger.info(f"Generated {len(all_figure_paths)} figures in {figures_dir}")
     
     if all_figure_paths:
-        print("\nSample figures:")
+        logger.info("Sample figures:")
         for path in all_figure_paths[:5]:
-            print(f"  📊 {path}")
+            logger.info(f"  📊 {path}")
         if len(all_figure_paths) > 5:
-            print(f"  ... and {len(all_figure_paths) - 5} more")
+            logger.info(f"  ... and {len(all_figure_paths) - 5} more")
         
-        print("\n💡 Ready to include in your paper!")
+        logger.info("💡 Ready to include in your paper!")
     else:
-        print("\n⚠️  No figures generated")
-        print("   Make sure metrics are computed: python scripts/02_compute_metrics.py")
+        logger.warning("⚠️  No figures generated")
+        logger.info("   Make sure metrics are computed: python scripts/02_compute_metrics.py")
     
-    print("=" * 70 + "\n")
 
 
 if __name__ == "__main__":
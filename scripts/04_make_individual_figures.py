@@ -10,22 +10,85 @@ This script creates individual figures for each crisis showing:
 """
 
 import argparse
+import functools
+import logging
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Optional, Tuple
+import numpy as np
 import pandas as pd
 
 # Add src to path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from src.config import load_config
-from src.pipelines.build_event_dataset import load_all_metrics, merge_metrics_on_date
-from src.plotting.plot_event_windows import plot_individual_crisis
+from src.pipelines.build_event_dataset import load_merged_metrics
+
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def _plot_mod():
+    """
+    Import the plotting module on first use.
+    
+    matplotlib is slow to import, so `--help` and early config errors
+    shouldn't pay for it. Cached so the event loop imports it only once.
+    """
+    import matplotlib
+    matplotlib.use('Agg')  # Non-interactive backend: figures are only saved to disk
+    
+    import src.plotting.plot_event_windows as plot_event_windows
+    return plot_event_windows
+
+
+def window_bounds(
+    dates: np.ndarray,
+    anchor: np.datetime64,
+    days_before: int,
+    days_after: int
+) -> Tuple[int, int]:
+    """
+    Locate an event window in a sorted date array with binary search.
+    
+    Args:
+        dates: Sorted datetime64[ns] array
+        anchor: Crisis anchor date (datetime64[D])
+        days_before: Days before anchor (inclusive)
+        days_after: Days after anchor (inclusive)
+    
+    Returns:
+        (lo, hi) positions such that dates[lo:hi] is the window
+    
+    Example:
+        >>> lo, hi = window_bounds(dates, np.datetime64('2013-03-16', 'D'), 90, 90)
+        >>> event_df = merged_df.iloc[lo:hi]
+    """
+    start = (anchor - np.timedelta64(days_before, 'D')).astype('datetime64[ns]')
+    end = (anchor + np.timedelta64(days_after, 'D')).astype('datetime64[ns]')
+    lo = int(np.searchsorted(dates, start, side='left'))
+    hi = int(np.searchsorted(dates, end, side='right'))
+    return lo, hi
+
+
+def _init_worker() -> None:
+    """Process pool initializer: configure logging in each worker."""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+
+
+def _plot_task(task: dict) -> Optional[Path]:
+    """Render one (event, window) figure; runs in a worker process."""
+    return _plot_mod().plot_individual_crisis(**task)
 
 
 def generate_individual_crisis_figures(
     processed_dir: Path,
     figures_dir: Path,
-    event_name: str = None
+    event_name: str = None,
+    workers: int = None
 ) -> list:
     """
     Generate individual crisis figures with all data points visible.
@@ -34,6 +97,8 @@ def generate_individual_crisis_figures(
         processed_dir: Path to processed data directory
         figures_dir: Path to figures output directory
         event_name: Specific event to generate (if None, generates all)
+        workers: Worker processes for rendering (if None, one per figure up
+                 to the CPU count; 1 renders sequentially in this process)
     
     Returns:
         List of generated figure paths
@@ -44,48 +109,78 @@ def generate_individual_crisis_figures(
     windows = config['windows']
     
     # Load all metrics
-    print("📊 Loading all processed metrics...")
-    metrics = load_all_metrics(processed_dir)
-    merged_df = merge_metrics_on_date(metrics)
+    logger.info("📊 Loading all processed metrics...")
+    merged_df = load_merged_metrics(processed_dir)
     
-    print(f"   ✓ Loaded {len(merged_df)} data points")
-    print(f"   ✓ Date range: {merged_df['date'].min()} to {merged_df['date'].max()}")
+    logger.info(f"   ✓ Loaded {len(merged_df)} data points")
+    logger.info(f"   ✓ Date range: {merged_df['date'].min()} to {merged_df['date'].max()}")
     
-    figure_paths = []
+    # Sort once so every event window is a contiguous slice found by binary search
+    if not merged_df['date'].is_monotonic_increasing:
+        merged_df = merged_df.sort_values('date').reset_index(drop=True)
+    dates = merged_df['date'].to_numpy(dtype='datetime64[ns]')
+    
+    # Parse every anchor once up front; window math below stays in numpy
+    anchors = {key: np.datetime64(value, 'D') for key, value in events.items()}
     
-    # Generate figures for each event
-    for event_key, anchor_date in events.items():
+    # Window configurations generated for every event
+    window_configs = [
+        (windows['standard']['days_before'], windows['standard']['days_after'], "90/90"),
+        (windows['extended']['days_before'], windows['extended']['days_after'], "180/45")
+    ]
+    
+    # Slice every (event, window) up front; each becomes an independent plot task
+    tasks = []
+    for event_key, anchor in anchors.items():
         if event_name and event_key != event_name:
             continue
-            
-        print(f"\n📈 Generating individual figure for {event_key}...")
-        print(f"   Anchor date: {anchor_date}")
         
-        # Generate for both window configurations
-        window_configs = [
-            (windows['standard']['days_before'], windows['standard']['days_after'], "90/90"),
-            (windows['extended']['days_before'], windows['extended']['days_after'], "180/45")
-        ]
+        # Slice the union of all windows once, then take each window as a sub-range
+        outer_lo, outer_hi = window_bounds(
+            dates,
+            anchor,
+            max(cfg[0] for cfg in window_configs),
+            max(cfg[1] for cfg in window_configs)
+        )
+        event_df = merged_df.iloc[outer_lo:outer_hi]
+        event_dates = dates[outer_lo:outer_hi]
         
         for days_before, days_after, window_name in window_configs:
-            print(f"   Creating {window_name} day window figure...")
+            lo, hi = window_bounds(event_dates, anchor, days_before, days_after)
             
-            # Create individual crisis figure
-            fig_path = plot_individual_crisis(
-                df=merged_df,
+            tasks.append(dict(
+                df=event_df.iloc[lo:hi],
                 event_name=f"{event_key}_{window_name.replace('/', '_')}",
-                anchor_date=anchor_date,
+                anchor_date=anchor,
                 days_before=days_before,
                 days_after=days_after,
                 output_dir=figures_dir,
-                title=f"{event_key.replace('_', ' ').title()} Crisis Analysis ({window_name} window)"
-            )
-            
-            if fig_path:
-                figure_paths.append(fig_path)
-                print(f"   ✓ Saved: {fig_path.name}")
-            else:
-                print(f"   ❌ Failed to create figure for {event_key} {window_name}")
+                title=f"{event_key.replace('_', ' ').title()} Crisis Analysis ({window_name} window)",
+                presliced=True
+            ))
+    
+    logger.info(f"📈 Generating {len(tasks)} individual figures...")
+    
+    figure_paths = []
+    
+    if workers is None:
+        workers = min(len(tasks), os.cpu_count() or 1)
+    
+    if workers > 1:
+        # Rendering is CPU-bound; each task only carries its own small slice
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            futures = {executor.submit(_plot_task, task): task['event_name'] for task in tasks}
+            # Collect in submission order so the returned paths are stable
+            results = [(name, future.result()) for future, name in futures.items()]
+    else:
+        results = [(task['event_name'], _plot_task(task)) for task in tasks]
+    
+    for name, fig_path in results:
+        if fig_path:
+            figure_paths.append(fig_path)
+            logger.info(f"   ✓ Saved: {fig_path.name}")
+        else:
+            logger.error(f"   ❌ Failed to create figure for {name}")
     
     return figure_paths
 
@@ -111,50 +206,50 @@ def main():
         default=Path("data/figures"),
         help="Path to figures output directory"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for rendering (default: up to CPU count; 1 = sequential)"
+    )
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+    
     # Ensure directories exist
     args.processed_dir.mkdir(parents=True, exist_ok=True)
     args.figures_dir.mkdir(parents=True, exist_ok=True)
     
-    print("=" * 80)
-    print("🎯 INDIVIDUAL CRISIS FIGURE GENERATION")
-    print("=" * 80)
-    print(f"Event: {args.event}")
-    print(f"Processed data: {args.processed_dir}")
-    print(f"Output: {args.figures_dir}")
-    print()
+    logger.info("🎯 INDIVIDUAL CRISIS FIGURE GENERATION")
+    logger.info(f"Event: {args.event}")
+    logger.info(f"Processed data: {args.processed_dir}")
+    logger.info(f"Output: {args.figures_dir}")
     
     # Generate figures
     try:
         figure_paths = generate_individual_crisis_figures(
             processed_dir=args.processed_dir,
             figures_dir=args.figures_dir,
-            event_name=args.event if args.event != "all" else None
+            event_name=args.event if args.event != "all" else None,
+            workers=args.workers
         )
         
-        print("\n" + "=" * 80)
-        print("✅ INDIVIDUAL FIGURE GENERATION COMPLETE")
-        print("=" * 80)
-        print(f"Generated {len(figure_paths)} individual figures in {args.figures_dir}")
-        print()
+        logger.info("✅ INDIVIDUAL FIGURE GENERATION COMPLETE")
+        logger.info(f"Generated {len(figure_paths)} individual figures in {args.figures_dir}")
         
         if figure_paths:
-            print("Sample figures:")
+            logger.info("Sample figures:")
             for fig_path in figure_paths[:6]:  # Show first 6
-                print(f"  📊 {fig_path}")
+                logger.info(f"  📊 {fig_path}")
             if len(figure_paths) > 6:
-                print(f"  ... and {len(figure_paths) - 6} more")
+                logger.info(f"  ... and {len(figure_paths) - 6} more")
         
-        print("\n💡 These figures show all data points clearly visible!")
-        print("   Each crisis has both 90/90 and 180/45 day window versions")
-        print("=" * 80)
+        logger.info("💡 These figures show all data points clearly visible!")
+        logger.info("   Each crisis has both 90/90 and 180/45 day window versions")
         
     except Exception as e:
-        print(f"\n❌ Error generating individual figures: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"❌ Error generating individual figures: {e}")
         sys.exit(1)
 
 
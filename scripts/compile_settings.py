@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Compile config/settings.yaml into an importable Python module.
+
+Writes src/_settings_compiled.py containing the parsed settings as a
+literal `CONFIG = {...}` dict. load_config() imports it (a cached .pyc,
+no YAML parsing) whenever it was generated from the current settings.yaml;
+if settings.yaml has changed since, the compiled module is ignored and the
+YAML is parsed as usual - so forgetting to re-run this is never wrong,
+only slower.
+
+The generated module contains everything in settings.yaml (including RPC
+credentials) and is git-ignored.
+
+Usage:
+    python scripts/compile_settings.py
+    python scripts/compile_settings.py --config path/to/settings.yaml
+"""
+
+import argparse
+import ast
+import logging
+import os
+import pprint
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.config import get_project_root, load_config
+
+
+logger = logging.getLogger(__name__)
+
+COMPILED_MODULE = get_project_root() / "src" / "_settings_compiled.py"
+
+
+def compile_settings(config_path: Path, output_path: Path = COMPILED_MODULE) -> Path:
+    """
+    Parse a settings file and write it out as a Python module.
+    
+    Args:
+        config_path: Path to settings.yaml
+        output_path: Module to write (default: src/_settings_compiled.py)
+    
+    Returns:
+        Path to the generated module
+    
+    Raises:
+        ValueError: If the settings contain values that aren't Python literals
+    """
+    config_path = Path(config_path).resolve()
+    stat = config_path.stat()
+    config = load_config(config_path)
+    
+    body = pprint.pformat(config, sort_dicts=False)
+    try:
+        ast.literal_eval(body)
+    except ValueError as e:
+        raise ValueError(f"Settings can't be compiled to literals: {e}") from None
+    
+    source = (
+        f"# Generated by scripts/compile_settings.py from {config_path.name} - do not edit.\n"
+        f"# Ignored by load_config() once the source file changes; re-run to refresh.\n"
+        f"SOURCE = {str(config_path)!r}\n"
+        f"SOURCE_KEY = {(stat.st_mtime_ns, stat.st_size)!r}\n"
+        f"\n"
+        f"CONFIG = {body}\n"
+    )
+    
+    tmp_path = output_path.with_name(f"{output_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(source, encoding='utf-8')
+    os.replace(tmp_path, output_path)
+    
+    return output_path
+
+
+def main():
+    """Main entry point for the settings compiler."""
+    parser = argparse.ArgumentParser(
+        description="Compile config/settings.yaml into src/_settings_compiled.py"
+    )
+    parser.add_argument(
+        '--config',
+        type=Path,
+        default=get_project_root() / "config" / "settings.yaml",
+        help='Settings file to compile (default: config/settings.yaml)'
+    )
+    
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+    
+    try:
+        output_path = compile_settings(args.config)
+    except FileNotFoundError as e:
+        logger.error(f"❌ {e}")
+        sys.exit(1)
+    except ValueError as e:
+        logger.error(f"❌ {e}")
+        sys.exit(1)
+    
+    logger.info(f"✓ Compiled {args.config} -> {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,14 +10,27 @@ Usage:
     cfg = load_config()
     print(cfg['events']['cyprus_2013'])  # Access event dates
     print(cfg['windows']['days_before'])  # Access window sizes
+
+The module-level `CONFIG` (or get_config()) is loaded lazily on first
+access, so importing this module never parses settings.yaml by itself.
 """
 
+import functools
 import os
+import pickle
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 import yaml
 
 
+# C loader is ~10x faster than the pure-Python SafeLoader; same safe semantics
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# This file is in src/config.py, so parent is src/, parent.parent is project root.
+# Fixed for the life of the process, so it is computed once.
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
 def get_project_root() -> Path:
     """
     Get the absolute path to the project root directory.
@@ -25,8 +38,43 @@ def get_project_root() -> Path:
     Returns:
         Path object pointing to project root
     """
-    # This file is in src/config.py, so parent is src/, parent.parent is project root
-    return Path(__file__).parent.parent
+    return _PROJECT_ROOT
+
+
+def _read_compiled_config(config_path: Path, key: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+    """Return CONFIG from src/_settings_compiled.py if it was built from this exact file."""
+    try:
+        from src import _settings_compiled
+    except ImportError:
+        return None
+    if _settings_compiled.SOURCE == str(config_path) and _settings_compiled.SOURCE_KEY == key:
+        return _settings_compiled.CONFIG
+    return None
+
+
+def _read_config_cache(cache_path: Path, key: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+    """Return the pickled config if its (mtime_ns, size) header matches key."""
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_key, config = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        return None
+    return config if cached_key == key else None
+
+
+def _write_config_cache(cache_path: Path, key: Tuple[int, int], config: Dict[str, Any]) -> None:
+    """Pickle (key, config) to cache_path atomically; best-effort."""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((key, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Read-only checkout etc. - just parse the YAML next time
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
 
 
 def load_config(config_path: str = None) -> Dict[str, Any]:
@@ -40,6 +88,16 @@ def load_config(config_path: str = None) -> Dict[str, Any]:
     Returns:
         Dictionary containing all configuration settings
     
+    Note:
+        If scripts/compile_settings.py has been run, settings are imported
+        from the generated src/_settings_compiled.py instead of parsed.
+        Otherwise the parsed settings are cached in config/.settings.yaml.cache
+        (pickle). The cache is used only while settings.yaml keeps the same
+        modification time and size, so edits are always picked up.
+        Within a process, results are also memoized, so repeated calls only
+        cost a stat(). The returned dict is shared between calls - don't
+        modify it in place.
+    
     Raises:
         FileNotFoundError: If settings.yaml doesn't exist
         yaml.YAMLError: If YAML is malformed
@@ -57,15 +115,39 @@ def load_config(config_path: str = None) -> Dict[str, Any]:
         config_path = Path(config_path)
     
     # Check if file exists
-    if not config_path.exists():
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Configuration file not found: {config_path}\n"
             f"Did you copy config/settings.example.yaml to config/settings.yaml?"
-        )
+        ) from None
+    
+    return _load_config_cached(str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse and validate a settings file (memoized on path + mtime/size)."""
+    config_path = Path(config_path)
+    
+    key = (mtime_ns, size)
     
-    # Load YAML
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    # Fastest: settings precompiled into src/_settings_compiled.py
+    # (scripts/compile_settings.py). Then the pickled sidecar next to the
+    # YAML. Both are only used while the YAML's mtime and size are unchanged.
+    config = _read_compiled_config(config_path, key)
+    
+    cache_path = config_path.with_name(f".{config_path.name}.cache")
+    if config is None:
+        config = _read_config_cache(cache_path, key)
+    
+    if config is None:
+        # Load YAML (libyaml-backed CSafeLoader when PyYAML was built with it;
+        # bytes let libyaml do its own decoding)
+        with open(config_path, 'rb') as f:
+            config = yaml.load(f, Loader=_YAML_LOADER)
+        _write_config_cache(cache_path, key, config)
     
     # Validate required keys (basic check)
     required_keys = ['data', 'events', 'windows']
@@ -76,6 +158,12 @@ def load_config(config_path: str = None) -> Dict[str, Any]:
     return config
 
 
+def _invalidate() -> None:
+    """Drop memoized configs and data paths (e.g. after editing settings in tests)."""
+    _load_config_cached.cache_clear()
+    _data_paths.cache_clear()
+
+
 def get_data_paths(config: Dict[str, Any]) -> Dict[str, Path]:
     """
     Convert relative data paths in config to absolute Path objects.
@@ -93,12 +181,19 @@ def get_data_paths(config: Dict[str, Any]) -> Dict[str, Path]:
         >>> print(paths['raw'])
         PosixPath('/Users/peytonallworth/projects/.../data/raw')
     """
+    data = config['data']
+    return dict(_data_paths(data['out_raw'], data['out_processed'], data['out_figures']))
+
+
+@functools.lru_cache(maxsize=8)
+def _data_paths(out_raw: str, out_processed: str, out_figures: str) -> Dict[str, Path]:
+    """Build the absolute data paths (memoized on the configured relative paths)."""
     project_root = get_project_root()
     
     return {
-        'raw': project_root / config['data']['out_raw'],
-        'processed': project_root / config['data']['out_processed'],
-        'figures': project_root / config['data']['out_figures']
+        'raw': project_root / out_raw,
+        'processed': project_root / out_processed,
+        'figures': project_root / out_figures
     }
 
 
@@ -126,11 +221,35 @@ def get_event_date(config: Dict[str, Any], event_name: str) -> str:
     return config['events'][event_name]
 
 
-# Convenience: Load config on import (users can call load_config() explicitly if needed)
-try:
-    CONFIG = load_config()
-except FileNotFoundError:
-    # If settings.yaml doesn't exist yet, set CONFIG to None
-    # This allows imports without errors during initial setup
-    CONFIG = None
+# Convenience: lazily loaded default config (users can call load_config() explicitly
+# if needed). Nothing is parsed at import time; `CONFIG` resolves on first access.
+_CONFIG = None
+
+
+def get_config() -> Optional[Dict[str, Any]]:
+    """
+    Get the default configuration, loading it on first use.
+    
+    Returns:
+        Configuration dictionary, or None if config/settings.yaml doesn't
+        exist yet (allows imports without errors during initial setup)
+    
+    Example:
+        >>> cfg = get_config()
+        >>> print(cfg['windows']['days_before'])
+        90
+    """
+    global _CONFIG
+    if _CONFIG is None:
+        try:
+            _CONFIG = load_config()
+        except FileNotFoundError:
+            return None
+    return _CONFIG
+
 
+def __getattr__(name: str) -> Any:
+    # Keeps `from src.config import CONFIG` working without import-time parsing
+    if name == 'CONFIG':
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,118 @@
+"""
+Local cache of per-block results for node_rpc's block scans.
+
+fetch_blocks_in_date_range() spends nearly all of its time on getblock and
+the input lookups behind each block's fee rates. Confirmed blocks don't
+change, so their results are kept in a SQLite file under data/cache/: the
+output row (fees, subsidy, tx count, fee-rate percentiles) plus the block's
+fee-rate QuantileSketch, from which the daily fee-rate CSV is rebuilt.
+
+Entries are keyed by height and store the block hash; callers compare it
+with the node's current hash at that height, so a reorged block is simply
+fetched again. Re-runs over an already-scanned range then cost one batched
+getblockhash call instead of hours of block fetching.
+
+Usage:
+    from src.data_sources._block_cache import BlockCache
+    
+    cache = BlockCache()
+    cached = cache.get_many(heights)        # {height: (hash, row, sketch)}
+    cache.put_many([(block_hash, row, sketch)])
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, Sequence, Tuple
+
+from ..utils.io import ensure_dir
+from ..utils.http_cache import CACHE_DIR
+from ..utils.math_stats import QuantileSketch
+
+
+DEFAULT_PATH = CACHE_DIR / "blocks.sqlite"
+
+# Keys per SELECT ... IN (...) (stays under SQLite's host-parameter limit)
+_QUERY_CHUNK = 500
+
+# Bump when the table layout or the way rows are computed changes
+# (older caches are dropped and rebuilt)
+SCHEMA_VERSION = 1
+
+# Row fields stored alongside the hash and sketch, in column order
+ROW_FIELDS = ('height', 'time', 'fees_btc', 'tx_count', 'subsidy_btc',
+              'fee_to_subsidy', 'median_sat_vb', 'p90_sat_vb')
+
+# (block hash, output row, fee-rate sketch)
+CachedBlock = Tuple[str, Dict, QuantileSketch]
+
+
+class BlockCache:
+    """
+    SQLite-backed height -> (hash, fetch_blocks_in_date_range() row, sketch) cache.
+    
+    Args:
+        path: SQLite file (created if missing)
+    """
+    
+    def __init__(self, path: Path = DEFAULT_PATH):
+        self.path = Path(path)
+        ensure_dir(self.path.parent)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            with self._conn:
+                self._conn.execute("DROP TABLE IF EXISTS blocks")
+                self._conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS blocks ("
+            "height INTEGER PRIMARY KEY, hash TEXT NOT NULL, time INTEGER NOT NULL, "
+            "fees_btc REAL NOT NULL, tx_count INTEGER NOT NULL, subsidy_btc REAL NOT NULL, "
+            "fee_to_subsidy REAL NOT NULL, median_sat_vb REAL NOT NULL, p90_sat_vb REAL NOT NULL, "
+            "fee_rate_sketch BLOB NOT NULL)"
+        )
+    
+    def get_many(self, heights: Sequence[int]) -> Dict[int, CachedBlock]:
+        """
+        Look up cached blocks.
+        
+        Args:
+            heights: Block heights
+        
+        Returns:
+            {height: (block hash, row dict, QuantileSketch)} for the heights
+            that are cached (misses are simply absent)
+        """
+        found = {}
+        for start in range(0, len(heights), _QUERY_CHUNK):
+            chunk = list(heights[start:start + _QUERY_CHUNK])
+            rows = self._conn.execute(
+                f"SELECT hash, {', '.join(ROW_FIELDS)}, fee_rate_sketch FROM blocks "
+                f"WHERE height IN ({','.join('?' * len(chunk))})",
+                chunk
+            )
+            for block_hash, *values, sketch in rows:
+                row = dict(zip(ROW_FIELDS, values))
+                found[row['height']] = (block_hash, row, QuantileSketch.from_bytes(sketch))
+        return found
+    
+    def put_many(self, blocks: Iterable[CachedBlock]) -> None:
+        """
+        Store blocks (one transaction, one commit for the whole batch).
+        
+        Args:
+            blocks: (block hash, row dict with ROW_FIELDS, fee-rate sketch) tuples
+        """
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO blocks (hash, {', '.join(ROW_FIELDS)}, fee_rate_sketch) "
+                f"VALUES ({','.join('?' * (len(ROW_FIELDS) + 2))})",
+                (
+                    (block_hash, *(row[field] for field in ROW_FIELDS), sketch.to_bytes())
+                    for block_hash, row, sketch in blocks
+                )
+            )
+    
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        self._conn.close()
@@ -0,0 +1,124 @@
+"""
+Local cache of transaction output values for node_rpc's block scans.
+
+Computing a transaction's fee needs the value of every output it spends
+(and its coin days destroyed also the funding transaction's block time),
+which node_rpc looks up with getrawtransaction on the funding transaction.
+Nearby blocks keep spending outputs of the same transactions, so a scan
+over a date range re-fetches the same funding transactions many times.
+
+This cache maps txid -> (block time, values in satoshis of all of that
+transaction's outputs), in a SQLite file under data/cache/. Both are fixed
+once the transaction is confirmed, so entries never expire: only txids missing from the cache are sent
+to the node, and re-runs over the same range skip those lookups entirely.
+
+Usage:
+    from src.data_sources._utxo_cache import UTXOValueCache
+    
+    cache = UTXOValueCache()
+    spent = cache.get_many(txids)            # {txid: (time, array('q') of sats)}
+    cache.put_many({txid: (1231006505, [5000000000])})
+"""
+
+import sqlite3
+import threading
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+from ..utils.io import ensure_dir
+from ..utils.http_cache import CACHE_DIR
+
+
+DEFAULT_PATH = CACHE_DIR / "utxo_values.sqlite"
+
+# Keys per SELECT ... IN (...) (stays under SQLite's host-parameter limit)
+_QUERY_CHUNK = 500
+
+# Bump when the table layout changes (older caches are dropped and rebuilt)
+SCHEMA_VERSION = 2
+
+
+class UTXOValueCache:
+    """
+    SQLite-backed txid -> (block time, output values in satoshis) cache.
+    
+    Values are stored as one int64 blob per transaction, so a lookup
+    returns every output of the funding transaction at once. Safe to share
+    between threads (one connection, calls serialized by a lock).
+    
+    Args:
+        path: SQLite file (created if missing)
+    """
+    
+    def __init__(self, path: Path = DEFAULT_PATH):
+        self.path = Path(path)
+        ensure_dir(self.path.parent)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            with self._conn:
+                self._conn.execute("DROP TABLE IF EXISTS tx_outputs")
+                self._conn.execute("DROP TABLE IF EXISTS meta")
+                self._conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tx_outputs "
+            "(txid TEXT PRIMARY KEY, time INTEGER NOT NULL, sats BLOB NOT NULL) WITHOUT ROWID"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+    
+    def get_many(self, txids: Sequence[str]) -> Dict[str, Tuple[int, array]]:
+        """
+        Look up cached output values.
+        
+        Args:
+            txids: Transaction ids
+        
+        Returns:
+            {txid: (block time, array('q') of output values in sats)} for
+            the txids that are cached (misses are simply absent)
+        """
+        found = {}
+        for start in range(0, len(txids), _QUERY_CHUNK):
+            chunk = txids[start:start + _QUERY_CHUNK]
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT txid, time, sats FROM tx_outputs WHERE txid IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+            for txid, time, blob in rows:
+                values = array('q')
+                values.frombytes(blob)
+                found[txid] = (time, values)
+        return found
+    
+    def put_many(self, outputs: Dict[str, Tuple[int, Iterable[int]]]) -> None:
+        """
+        Store output values (one transaction, one commit for the whole dict).
+        
+        Args:
+            outputs: {txid: (block time, output values in sats in vout order)}
+        """
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO tx_outputs (txid, time, sats) VALUES (?, ?, ?)",
+                ((txid, time, array('q', sats).tobytes()) for txid, (time, sats) in outputs.items())
+            )
+    
+    def get_meta(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        """Integer stored under key with set_meta() (e.g. how far a fill pass got), or default."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return default if row is None else row[0]
+    
+    def set_meta(self, key: str, value: int) -> None:
+        """Store an integer under key (kept as long as the cached outputs are)."""
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+    
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
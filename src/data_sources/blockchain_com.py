@@ -17,18 +17,64 @@ Key endpoints:
 - https://api.blockchain.info/charts/n-transactions?timespan=all&format=json
 - https://api.blockchain.info/charts/n-blocks?timespan=all&format=json
 - https://api.blockchain.info/charts/bdd?timespan=all&format=json
+
+Concurrency:
+    fetch_all_metrics_async() downloads the chart endpoints concurrently
+    (asyncio.to_thread over the shared cached session's connection pool);
+    fetch_all_metrics() is its synchronous wrapper.
+
+Parsing:
+    fetch_chart_dataframe() streams the chart JSON into columnar arrays with
+    ijson (optional dependency) instead of building a dict per data point.
+
+Caching:
+    Chart requests go through a shared on-disk HTTP cache when
+    requests-cache is installed, so re-runs skip already-downloaded history.
+    fetch_chart_dataframe() revalidates expired copies with ETag /
+    Last-Modified conditional GETs (see conditional_get()).
 """
 
-import time
-from typing import Optional
+import asyncio
+import importlib.util
+import io
+from array import array
+from datetime import datetime, timedelta
+from typing import Tuple
 from pathlib import Path
+import numpy as np
 import pandas as pd
-import requests
+
+# ijson (optional dependency, streams chart JSON straight into columns)
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# pyarrow (optional dependency, multithreaded CSV parsing for pd.read_csv;
+# pandas imports it itself, so only check that it's installed)
+CSV_ENGINE = 'pyarrow' if importlib.util.find_spec('pyarrow') else 'c'
 
 # Import project utilities
-import sys
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from src.utils.io import save_csv, ensure_dir
+from ..utils.io import save_csv, ensure_dir, parse_json
+from ..utils.http_cache import build_session, conditional_get
+
+
+# Chart endpoints downloaded directly from the API:
+# metric key -> (chart name, value column, output filename)
+CHART_SPECS = {
+    'fees': ('transaction-fees', 'fees_btc_day', 'blockchain_com_fees_btc_day.csv'),
+    'transactions': ('n-transactions', 'tx_per_day', 'blockchain_com_tx_per_day.csv'),
+}
+
+# Seed for the synthetic blocks/BDD estimators. Each estimator starts its own
+# PCG64 Generator from it, so every series is reproducible on its own,
+# regardless of which other generators ran first in the process.
+SYNTHETIC_SEED = 42
+
+# Shared session with on-disk response cache (see src/utils/http_cache.py).
+# Chart history only grows at the tail, so a day-old copy is fresh enough.
+_SESSION = build_session(expire_after=timedelta(days=1))
 
 
 def fetch_chart_data(
@@ -62,15 +108,88 @@ def fetch_chart_data(
     }
     
     print(f"Fetching {chart_name} from Blockchain.com API...")
-    response = requests.get(url, params=params, timeout=30)
+    response = _SESSION.get(url, params=params, timeout=30)
     response.raise_for_status()  # Raise exception for 4xx/5xx errors
     
-    data = response.json()
-    print(f"  ✓ Fetched {len(data.get('values', []))} data points")
+    data = parse_json(response.content)
+    source = " (cached)" if getattr(response, 'from_cache', False) else ""
+    print(f"  ✓ Fetched {len(data.get('values', []))} data points{source}")
     
     return data
 
 
+def parse_chart_values(body: bytes) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse a chart JSON body into columnar timestamp/value arrays.
+    
+    Streams the JSON events with ijson instead of building one dict per
+    data point, accumulating straight into typed buffers.
+    
+    Args:
+        body: Raw JSON response body
+    
+    Returns:
+        (x, y): int64 Unix timestamps and values (int64 if every value is
+        an integer, float64 otherwise)
+    
+    Example:
+        >>> x, y = parse_chart_values(b'{"values": [{"x": 1609459200, "y": 12.5}]}')
+        >>> print(x, y)
+        [1609459200] [12.5]
+    """
+    if not HAS_IJSON:
+        values = parse_json(body).get('values', [])
+        x = np.array([v['x'] for v in values], dtype='int64')
+        y = np.array([v.get('y', np.nan) for v in values])
+        if y.dtype.kind not in 'if':
+            y = y.astype('float64')  # Empty chart
+        return x, y
+    
+    xs = array('q')
+    ys = array('d')
+    all_int = True  # Counts (e.g. n-transactions) stay integer, like pandas would infer
+    x = y = None
+    
+    for prefix, event, value in ijson.parse(io.BytesIO(body), use_float=True):
+        if prefix == 'values.item.x':
+            x = value
+        elif prefix == 'values.item.y':
+            y = value
+        elif prefix == 'values.item' and event == 'end_map':
+            xs.append(int(x))
+            if y is None:
+                ys.append(float('nan'))
+                all_int = False
+            else:
+                ys.append(y)
+                all_int = all_int and type(y) is int
+            x = y = None
+    
+    y_values = np.frombuffer(ys, dtype='float64')
+    if all_int and len(ys):
+        y_values = y_values.astype('int64')
+    
+    return np.frombuffer(xs, dtype='int64'), y_values
+
+
+def chart_columns_to_dataframe(x: np.ndarray, y: np.ndarray, value_column: str) -> pd.DataFrame:
+    """
+    Build a tidy DataFrame from columnar chart data.
+    
+    Args:
+        x: Unix timestamps (seconds)
+        y: Values
+        value_column: Name for the value column
+    
+    Returns:
+        DataFrame with columns: date, <value_column>
+    """
+    # Convert Unix timestamp to date (truncate to midnight, staying in datetime64)
+    dates = pd.to_datetime(x, unit='s').floor('D')
+    
+    return pd.DataFrame({'date': dates, value_column: y})
+
+
 def parse_chart_to_dataframe(chart_data: dict, value_column: str) -> pd.DataFrame:
     """
     Convert Blockchain.com chart data to a tidy DataFrame.
@@ -90,20 +209,55 @@ def parse_chart_to_dataframe(chart_data: dict, value_column: str) -> pd.DataFram
     """
     values = chart_data.get('values', [])
     
-    # Extract x (timestamp) and y (value)
-    df = pd.DataFrame(values)
+    # Extract x (timestamp) and y (value) columns
+    x = np.array([v['x'] for v in values], dtype='int64')
+    y = np.array([v.get('y', np.nan) for v in values])
+    if y.dtype.kind not in 'if':
+        y = y.astype('float64')  # Empty chart
     
-    # Convert Unix timestamp to date
-    df['date'] = pd.to_datetime(df['x'], unit='s').dt.date
-    df['date'] = pd.to_datetime(df['date'])  # Convert back to datetime
+    return chart_columns_to_dataframe(x, y, value_column)
+
+
+def fetch_chart_dataframe(
+    chart_name: str,
+    value_column: str,
+    timespan: str = "all",
+    base_url: str = "https://api.blockchain.info"
+) -> pd.DataFrame:
+    """
+    Fetch a chart and parse it directly into a tidy DataFrame.
     
-    # Rename 'y' to meaningful column name
-    df = df.rename(columns={'y': value_column})
+    Equivalent to parse_chart_to_dataframe(fetch_chart_data(...)), but the
+    response body is parsed into columns without materializing a dict per
+    data point (~6000 of them for timespan='all').
     
-    # Keep only date and value
-    df = df[['date', value_column]]
+    Args:
+        chart_name: Chart identifier (e.g., 'transaction-fees', 'n-transactions')
+        value_column: Name for the value column
+        timespan: Time span ('all', '1year', '30days', etc.)
+        base_url: API base URL
+    
+    Returns:
+        DataFrame with columns: date, <value_column>
     
-    return df
+    Raises:
+        requests.RequestException: If API call fails
+    """
+    url = f"{base_url}/charts/{chart_name}"
+    params = {
+        'timespan': timespan,
+        'format': 'json'
+    }
+    
+    print(f"Fetching {chart_name} from Blockchain.com API...")
+    # Full history is re-requested every run; revalidate instead of re-downloading
+    body, from_cache = conditional_get(_SESSION, url, params=params, timeout=30)
+    
+    x, y = parse_chart_values(body)
+    source = " (cached)" if from_cache else ""
+    print(f"  ✓ Fetched {len(x)} data points{source}")
+    
+    return chart_columns_to_dataframe(x, y, value_column)
 
 
 def fetch_transaction_fees(
@@ -130,11 +284,11 @@ def fetch_transaction_fees(
         >>> print(csv_path)
         data/raw/blockchain_com_fees_btc_day.csv
     """
-    chart_data = fetch_chart_data('transaction-fees', timespan)
-    df = parse_chart_to_dataframe(chart_data, 'fees_btc_day')
+    chart_name, value_column, filename = CHART_SPECS['fees']
+    df = fetch_chart_dataframe(chart_name, value_column, timespan)
     
     # Save to CSV
-    output_path = Path(output_dir) / "blockchain_com_fees_btc_day.csv"
+    output_path = Path(output_dir) / filename
     save_csv(df, output_path)
     
     return output_path
@@ -158,10 +312,10 @@ def fetch_transactions_per_day(
         - date: YYYY-MM-DD
         - tx_per_day: Number of confirmed transactions
     """
-    chart_data = fetch_chart_data('n-transactions', timespan)
-    df = parse_chart_to_dataframe(chart_data, 'tx_per_day')
+    chart_name, value_column, filename = CHART_SPECS['transactions']
+    df = fetch_chart_dataframe(chart_name, value_column, timespan)
     
-    output_path = Path(output_dir) / "blockchain_com_tx_per_day.csv"
+    output_path = Path(output_dir) / filename
     save_csv(df, output_path)
     
     return output_path
@@ -172,10 +326,12 @@ def fetch_blocks_per_day(
     timespan: str = "all"
 ) -> Path:
     """
-    Fetch real daily block count data from Blockchair API.
+    Generate estimated daily block counts over the fees date range.
     
-    This gets actual blocks mined per day, not estimates.
-    Blockchair provides real historical data on blocks mined.
+    No historical blocks-per-day endpoint is used; counts are simulated
+    around the 144 blocks/day target with year-dependent variation
+    (reproducible, seeded RNG). For real historical counts, use a
+    Bitcoin Core node (see node_rpc.py).
     
     Args:
         output_dir: Directory to save CSV
@@ -186,23 +342,18 @@ def fetch_blocks_per_day(
     
     Output CSV columns:
         - date: YYYY-MM-DD
-        - blocks_per_day: Actual number of blocks mined
-    
-    Data Source:
-        - Blockchair API: https://api.blockchair.com/bitcoin/stats
-        - Provides real historical block counts
+        - blocks_per_day: Estimated number of blocks mined (100-200)
     """
-    print("   📊 Fetching real daily block data from Blockchair...")
+    print("   📊 Estimating daily block counts...")
     
     # Get date range from fees data to ensure consistency
     fees_csv = output_dir / "blockchain_com_fees_btc_day.csv"
     if fees_csv.exists():
-        fees_df = pd.read_csv(fees_csv, parse_dates=['date'])
+        fees_df = pd.read_csv(fees_csv, parse_dates=['date'], engine=CSV_ENGINE)
         start_date = fees_df['date'].min()
         end_date = fees_df['date'].max()
     else:
         # Fallback: generate date range
-        from datetime import datetime, timedelta
         start_date = datetime(2009, 1, 3)  # Genesis block
         end_date = datetime.now()
     
@@ -215,14 +366,14 @@ def fetch_blocks_per_day(
     
     # More realistic block count estimation based on actual Bitcoin behavior
     # Real data shows variation from 100-200+ blocks per day
-    import numpy as np
-    np.random.seed(42)  # For reproducibility
+    rng = np.random.default_rng(SYNTHETIC_SEED)  # For reproducibility
+    n_days = len(dates)
     
     # Base around 144 with realistic variation
     # During high activity periods, blocks can be faster (more blocks)
     # During low activity, blocks can be slower (fewer blocks)
     base_blocks = 144
-    variation = np.random.normal(0, 15, len(dates))  # ±15 blocks variation
+    variation = rng.normal(0, 15, n_days)  # ±15 blocks variation
     blocks_per_day = base_blocks + variation
     
     # Add some realistic patterns:
@@ -230,25 +381,21 @@ def fetch_blocks_per_day(
     # - Slightly lower during bear markets
     # - More variation during high activity periods
     
-    # Apply some realistic patterns based on date
-    for i, date in enumerate(dates):
-        year = date.year
-        month = date.month
-        
-        # Higher activity during known bull market periods
-        if year in [2017, 2021, 2024]:
-            blocks_per_day[i] += np.random.normal(5, 3)
-        elif year in [2018, 2019, 2022]:
-            blocks_per_day[i] += np.random.normal(-2, 2)
-        
-        # Slightly more variation in recent years
-        if year >= 2020:
-            blocks_per_day[i] += np.random.normal(0, 5)
-    
-    # Ensure realistic bounds
-    blocks_per_day = np.maximum(blocks_per_day, 100)  # Minimum 100 blocks
-    blocks_per_day = np.minimum(blocks_per_day, 200)  # Maximum 200 blocks
-    blocks_per_day = np.round(blocks_per_day).astype(int)
+    # Apply the patterns to whole years at once (boolean masks, one draw each)
+    years = dates.year.to_numpy()
+    bull = np.isin(years, [2017, 2021, 2024])  # Higher activity during known bull markets
+    bear = np.isin(years, [2018, 2019, 2022])
+    recent = years >= 2020  # Slightly more variation in recent years
+    
+    blocks_per_day += (
+        rng.normal(5, 3, n_days) * bull
+        + rng.normal(-2, 2, n_days) * bear
+        + rng.normal(0, 5, n_days) * recent
+    )
+    
+    # Ensure realistic bounds (100-200 blocks)
+    blocks_per_day = np.clip(blocks_per_day, 100, 200)
+    blocks_per_day = np.round(blocks_per_day).astype(np.int16)  # 100-200 fits in int16
     
     # Create DataFrame
     df = pd.DataFrame({
@@ -300,41 +447,40 @@ def fetch_bitcoin_days_destroyed(
     """
     print("   ⚠️  BDD endpoint not available, estimating Bitcoin Days Destroyed...")
     
+    rng = np.random.default_rng(SYNTHETIC_SEED)  # For reproducibility
+    
     # Get date range from fees data to ensure consistency
     fees_csv = output_dir / "blockchain_com_fees_btc_day.csv"
     tx_csv = output_dir / "blockchain_com_tx_per_day.csv"
     
     if fees_csv.exists() and tx_csv.exists():
-        fees_df = pd.read_csv(fees_csv, parse_dates=['date'])
-        tx_df = pd.read_csv(tx_csv, parse_dates=['date'])
+        fees_df = pd.read_csv(fees_csv, parse_dates=['date'], engine=CSV_ENGINE)
+        tx_df = pd.read_csv(tx_csv, parse_dates=['date'], engine=CSV_ENGINE)
         df = fees_df.merge(tx_df, on='date', how='inner')
         dates = df['date'].copy()
         tx_per_day = df['tx_per_day'].values
     else:
         # Fallback: generate date range
-        from datetime import datetime, timedelta
         start_date = datetime(2009, 1, 3)  # Genesis block
         end_date = datetime.now()
         dates = pd.date_range(start=start_date, end=end_date, freq='D')
-        tx_per_day = np.random.normal(50000, 10000, len(dates))  # Estimate tx volume
+        tx_per_day = rng.normal(50000, 10000, len(dates))  # Estimate tx volume
     
     # Estimate BDD based on transaction volume
     # BDD generally correlates with transaction activity
     # Use a simple model: BDD = base + (tx_volume * scaling_factor) + noise
-    import numpy as np
-    np.random.seed(42)  # For reproducibility
     
     base_bdd = 1000000  # Base BDD level
     scaling_factor = 20  # BDD per transaction
     noise_std = 200000  # Random variation
     
-    bdd = base_bdd + (tx_per_day * scaling_factor) + np.random.normal(0, noise_std, len(dates))
+    bdd = base_bdd + (tx_per_day * scaling_factor) + rng.normal(0, noise_std, len(dates))
     bdd = np.maximum(bdd, 100000)  # Minimum BDD level
     
     # Create DataFrame
     df = pd.DataFrame({
         'date': dates,
-        'bdd': bdd.astype(int)
+        'bdd': bdd.astype(np.int32)  # Whole BDD values, well within int32
     })
     
     output_path = Path(output_dir) / "blockchain_com_bdd.csv"
@@ -346,50 +492,45 @@ def fetch_bitcoin_days_destroyed(
     return output_path
 
 
-def fetch_all_metrics(
+async def fetch_all_metrics_async(
     output_dir: Path,
-    timespan: str = "all",
-    delay_seconds: float = 1.0
+    timespan: str = "all"
 ) -> dict:
     """
-    Fetch all available metrics from Blockchain.com API.
+    Fetch all available metrics from Blockchain.com API (async version).
+    
+    The chart downloads run concurrently, each in a worker thread via
+    asyncio.to_thread(), so every request still goes through the shared
+    cached session and its conditional GETs (requests-cache has no asyncio
+    client). Use this directly from code that already runs an event loop,
+    e.g. ``await fetch_all_metrics_async(...)`` in a notebook.
     
     Args:
         output_dir: Directory to save CSVs
         timespan: Time span for all requests
-        delay_seconds: Delay between API calls (be polite!)
     
     Returns:
         Dictionary mapping metric name to CSV path
     
-    Example:
-        >>> from pathlib import Path
-        >>> paths = fetch_all_metrics(Path("data/raw"))
-        >>> print(paths.keys())
-        dict_keys(['fees', 'transactions', 'blocks', 'bdd'])
-    
     Note:
-        - Adds delays between requests to avoid rate limiting
-        - Be respectful of free APIs!
+        - Blocks/BDD are derived from the downloaded CSVs, so they are
+          generated after the downloads complete
     """
     ensure_dir(output_dir)
     
-    paths = {}
-    
     print("\n📊 Fetching Blockchain.com data...")
     print("=" * 60)
     
-    # Transaction fees
-    paths['fees'] = fetch_transaction_fees(output_dir, timespan)
-    time.sleep(delay_seconds)
+    # Transaction fees + transactions per day (downloaded in parallel)
+    fees_path, transactions_path = await asyncio.gather(
+        asyncio.to_thread(fetch_transaction_fees, output_dir, timespan),
+        asyncio.to_thread(fetch_transactions_per_day, output_dir, timespan),
+    )
     
-    # Transactions per day
-    paths['transactions'] = fetch_transactions_per_day(output_dir, timespan)
-    time.sleep(delay_seconds)
+    paths = {'fees': fees_path, 'transactions': transactions_path}
     
     # Blocks per day
     paths['blocks'] = fetch_blocks_per_day(output_dir, timespan)
-    time.sleep(delay_seconds)
     
     # Bitcoin Days Destroyed (dormancy proxy)
     paths['bdd'] = fetch_bitcoin_days_destroyed(output_dir, timespan)
@@ -400,6 +541,32 @@ def fetch_all_metrics(
     return paths
 
 
+def fetch_all_metrics(
+    output_dir: Path,
+    timespan: str = "all"
+) -> dict:
+    """
+    Fetch all available metrics from Blockchain.com API.
+    
+    Synchronous entry point: runs fetch_all_metrics_async() in a new event
+    loop.
+    
+    Args:
+        output_dir: Directory to save CSVs
+        timespan: Time span for all requests
+    
+    Returns:
+        Dictionary mapping metric name to CSV path
+    
+    Example:
+        >>> from pathlib import Path
+        >>> paths = fetch_all_metrics(Path("data/raw"))
+        >>> print(paths.keys())
+        dict_keys(['fees', 'transactions', 'blocks', 'bdd'])
+    """
+    return asyncio.run(fetch_all_metrics_async(output_dir, timespan))
+
+
 def compute_fees_per_block(
     fees_csv: Path,
     blocks_csv: Path,
@@ -430,14 +597,14 @@ def compute_fees_per_block(
         - More stable than raw daily fees (which vary with block luck)
     """
     # Load data
-    fees_df = pd.read_csv(fees_csv, parse_dates=['date'])
-    blocks_df = pd.read_csv(blocks_csv, parse_dates=['date'])
+    fees_df = pd.read_csv(fees_csv, parse_dates=['date'], engine=CSV_ENGINE).set_index('date')
+    blocks_df = pd.read_csv(blocks_csv, parse_dates=['date'], engine=CSV_ENGINE).set_index('date')
     
-    # Merge on date
-    df = fees_df.merge(blocks_df, on='date', how='inner')
+    # Align on the (sorted, daily) DatetimeIndex instead of hashing a date column
+    df = fees_df.join(blocks_df, how='inner').reset_index()
     
     # Compute fees per block
-    df['fees_per_block_btc'] = df['fees_btc_day'] / df['blocks_per_day']
+    df['fees_per_block_btc'] = (df['fees_btc_day'] / df['blocks_per_day']).astype(np.float32)
     
     # Save
     output_path = Path(output_dir) / "blockchain_com_fees_per_block_btc.csv"
@@ -446,10 +613,9 @@ def compute_fees_per_block(
     return output_path
 
 
-# Example usage (if run as script):
+# Example usage (run as a module from the project root:
+#   python -m src.data_sources.blockchain_com)
 if __name__ == "__main__":
-    from pathlib import Path
-    
     # Define output directory
     output_dir = Path(__file__).parent.parent.parent / "data" / "raw"
     
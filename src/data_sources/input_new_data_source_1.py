@@ -19,9 +19,7 @@ from typing import Optional
 from pathlib import Path
 import pandas as pd
 
-import sys
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from src.utils.io import save_csv, ensure_dir
+from ..utils.io import save_csv, ensure_dir
 
 
 def fetch_to_csv(
@@ -142,6 +140,8 @@ When implementing this module, consider:
    - Version API endpoints in comments
 """
 
+# Example usage (run as a module from the project root:
+#   python -m src.data_sources.input_new_data_source_1)
 if __name__ == "__main__":
     print("Custom Data Source 1 - Not yet implemented")
     print("Edit this file to add your data source logic!")
@@ -14,9 +14,7 @@ from typing import Optional
 from pathlib import Path
 import pandas as pd
 
-import sys
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from src.utils.io import save_csv
+from ..utils.io import save_csv
 
 
 def fetch_to_csv(
@@ -45,6 +43,8 @@ def fetch_to_csv(
     return None
 
 
+# Example usage (run as a module from the project root:
+#   python -m src.data_sources.input_new_data_source_3)
 if __name__ == "__main__":
     print("Custom Data Source 3 - Not yet implemented")
 
@@ -24,19 +24,33 @@ Alternative Approach:
    - More reliable for historical crisis analysis
 """
 
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from pathlib import Path
 import pandas as pd
-import requests
 
-import sys
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from src.utils.io import save_csv, save_json, ensure_dir
+from ..utils.io import save_csv, append_jsonl, ensure_dir, parse_json
+from ..utils.http_cache import build_session
+
+
+# Shared keep-alive session: snapshot_current_state() makes back-to-back calls
+# to the same host. Live data, so responses are never cached.
+_SESSION = build_session(cached=False, pool_maxsize=8)
+
+DEFAULT_BASE_URL = "https://mempool.space/api"
+
+# Endpoints for the default base URL, built once at import
+MEMPOOL_URL = f"{DEFAULT_BASE_URL}/mempool"
+FEES_URL = f"{DEFAULT_BASE_URL}/v1/fees/recommended"
+
+# Snapshots accumulate in one append-only JSON Lines file (one line per run)
+SNAPSHOTS_FILENAME = "mempool_snapshots.jsonl"
 
 
 def fetch_current_mempool_info(
-    base_url: str = "https://mempool.space/api"
+    base_url: str = DEFAULT_BASE_URL
 ) -> dict:
     """
     Fetch current mempool statistics.
@@ -62,20 +76,20 @@ def fetch_current_mempool_info(
     
     API Endpoint: GET /mempool
     """
-    url = f"{base_url}/mempool"
+    url = MEMPOOL_URL if base_url == DEFAULT_BASE_URL else f"{base_url}/mempool"
     
     print(f"Fetching current mempool info from {url}...")
-    response = requests.get(url, timeout=15)
+    response = _SESSION.get(url, timeout=15)
     response.raise_for_status()
     
-    data = response.json()
+    data = parse_json(response.content)
     print(f"  ✓ Mempool size: {data.get('size', 0):,} vbytes")
     
     return data
 
 
 def fetch_fee_estimates(
-    base_url: str = "https://mempool.space/api"
+    base_url: str = DEFAULT_BASE_URL
 ) -> dict:
     """
     Fetch current fee rate estimates for different confirmation priorities.
@@ -99,13 +113,13 @@ def fetch_fee_estimates(
         - Higher sat/vB = faster confirmation (higher priority)
         - During crises, we expect large spreads (urgency!)
     """
-    url = f"{base_url}/v1/fees/recommended"
+    url = FEES_URL if base_url == DEFAULT_BASE_URL else f"{base_url}/v1/fees/recommended"
     
     print(f"Fetching fee estimates from {url}...")
-    response = requests.get(url, timeout=15)
+    response = _SESSION.get(url, timeout=15)
     response.raise_for_status()
     
-    data = response.json()
+    data = parse_json(response.content)
     
     # Response format: {"fastestFee": 150, "halfHourFee": 100, "hourFee": 80, ...}
     print(f"  ✓ Fastest fee: {data.get('fastestFee')} sat/vB")
@@ -115,15 +129,16 @@ def fetch_fee_estimates(
 
 def snapshot_current_state(output_dir: Path) -> dict:
     """
-    Take a snapshot of current mempool + fee state and save to JSON.
+    Take a snapshot of current mempool + fee state and append it to
+    output_dir/mempool_snapshots.jsonl.
     
     Args:
-        output_dir: Directory to save snapshot
+        output_dir: Directory holding the snapshots file
     
     Returns:
         Dictionary with timestamp and data
     
-    Output JSON structure:
+    Output record (one JSON object per line):
         {
             "timestamp": "2024-01-15T12:00:00",
             "mempool": {...},
@@ -142,9 +157,12 @@ def snapshot_current_state(output_dir: Path) -> dict:
     
     timestamp = datetime.utcnow().isoformat()
     
-    # Fetch data
-    mempool_info = fetch_current_mempool_info()
-    fee_estimates = fetch_fee_estimates()
+    # Fetch data (independent requests: overlap the two round-trips)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        mempool_future = executor.submit(fetch_current_mempool_info)
+        fees_future = executor.submit(fetch_fee_estimates)
+        mempool_info = mempool_future.result()
+        fee_estimates = fees_future.result()
     
     # Combine into snapshot
     snapshot = {
@@ -153,10 +171,9 @@ def snapshot_current_state(output_dir: Path) -> dict:
         'fees': fee_estimates
     }
     
-    # Save with timestamp in filename
-    filename = f"mempool_snapshot_{timestamp.replace(':', '-')}.json"
-    output_path = Path(output_dir) / filename
-    save_json(snapshot, output_path)
+    # Append to the running log (one line per snapshot, no per-run files);
+    # plain string paths, no Path objects on this per-run path
+    append_jsonl(snapshot, os.path.join(os.fspath(output_dir), SNAPSHOTS_FILENAME))
     
     return snapshot
 
@@ -223,7 +240,8 @@ def fetch_historical_fee_rates_placeholder(
     return None
 
 
-# Example usage
+# Example usage (run as a module from the project root:
+#   python -m src.data_sources.mempool_space)
 if __name__ == "__main__":
     from pathlib import Path
     
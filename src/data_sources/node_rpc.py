@@ -13,7 +13,7 @@ This module connects to a local or remote Bitcoin Core node via RPC to fetch:
        server=1
        rpcuser=YOUR_USER
        rpcpassword=YOUR_PASSWORD
-   - python-bitcoinrpc package installed
+   - requests package installed (already required by the other adapters)
 
 WHY USE A NODE?
    - Complete historical data back to genesis block
@@ -37,43 +37,226 @@ SETUP GUIDE:
    4. Restart Bitcoin Core and wait for txindex to build (takes hours)
    5. Update config/settings.yaml with your RPC credentials
 
+BATCHING:
+   Calls are sent as JSON-RPC batches (a list of requests in one HTTP POST)
+   over a keep-alive session, so scanning thousands of blocks costs a few
+   round-trips per thousand calls instead of one per call.
+   fetch_blocks_in_date_range_async() additionally keeps several blocks in
+   flight at once over an aiohttp connection pool (optional dependency);
+   fetch_blocks_in_date_range() does the same with a thread pool.
+   run_async() runs the async variant on uvloop when it is installed. Its
+   pool is opened (and the hostname resolved) while the height search runs,
+   and connections are kept alive across the whole scan (bitcoind has no
+   unix socket, so a warm loopback connection is the cheapest transport).
+   
+   Nodes running Bitcoin Core 23.0+ return the outputs each input spends
+   inline with getblock verbosity=3, so fee rates need no getrawtransaction
+   lookups at all; older nodes fall back to batched lookups (verbosity=2).
+
+CACHING (data/cache/):
+   - utxo_values.sqlite: funding-transaction outputs (_utxo_cache.py)
+   - blocks.sqlite: finished per-block results (_block_cache.py), so
+     re-running a scanned date range only re-checks block hashes
+
+RAW BLOCK FILES:
+   With the node's data directory on local disk, fetch_blocks_in_date_range(
+   None, ..., datadir=...) skips RPC and parses blk*.dat directly
+   (raw_blocks.py).
+
 ALTERNATIVES IF NO NODE:
    - Use Blockchain.com API (limited granularity, see blockchain_com.py)
    - Import pre-computed CSV files from community sources
 """
 
-from typing import Dict, List, Optional, Tuple
+import asyncio
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 from pathlib import Path
-from datetime import datetime
+import numpy as np
 import pandas as pd
+import requests
 
-# Bitcoin RPC library (optional dependency)
+# aiohttp (optional dependency, used for concurrent RPC calls)
 try:
-    from bitcoinrpc.authproxy import AuthServiceProxy, JSONRPCException
-    HAS_RPC = True
+    import aiohttp
+    HAS_AIOHTTP = True
 except ImportError:
-    HAS_RPC = False
-    print("⚠️  python-bitcoinrpc not installed. Install with: pip install python-bitcoinrpc")
+    HAS_AIOHTTP = False
+
+# uvloop (optional dependency, faster event loop for run_async())
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+from ..utils.io import save_csv, parse_json, encode_json
+from ..utils.math_stats import QuantileSketch, partition_percentiles
+from ..utils.http_cache import build_session
+from ._utxo_cache import UTXOValueCache
+from ._block_cache import BlockCache, CachedBlock
+
+
+SATS_PER_BTC = 100_000_000
+
+# Consensus subsidy schedule: 50 BTC, halved every 210,000 blocks
+INITIAL_SUBSIDY_SAT = 50 * SATS_PER_BTC
+HALVING_INTERVAL = 210_000
+
+# Calls per JSON-RPC batch POST (small responses: hashes, headers, raw txs)
+RPC_BATCH_SIZE = 1000
+
+# Idle seconds before the async pool closes a kept-alive connection or
+# re-resolves the node's hostname (aiohttp's defaults are 15s and 10s;
+# cache lookups between windows can take longer)
+KEEPALIVE_TIMEOUT = 600
+
+# Blocks per getblock batch: verbosity=2/3 blocks are 1-3 MB of JSON each
+BLOCK_BATCH_SIZE = 10
+
+# Blocks per block-cache window (one lookup and one write transaction each)
+BLOCK_CACHE_WINDOW = 1000
+
+# Blocks checked beyond the binary-searched ends of a time range: block
+# times may run up to ~2h (about 12 blocks) out of order, doubled for margin
+TIMESTAMP_SLACK_BLOCKS = 24
 
-import sys
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from src.utils.io import save_csv
+# First Bitcoin Core version (getnetworkinfo 'version') with getblock verbosity=3
+PREVOUT_VERBOSITY_MIN_VERSION = 230000
+
+
+class RPCError(Exception):
+    """Error returned by bitcoind for one call of a JSON-RPC request."""
+    
+    def __init__(self, method: str, error: dict):
+        self.method = method
+        self.code = error.get('code')
+        super().__init__(f"{method}: {error.get('message')} (code {self.code})")
+
+
+class NodeRPC:
+    """
+    Minimal Bitcoin Core JSON-RPC client with request batching.
+    
+    Single calls read like python-bitcoinrpc's AuthServiceProxy
+    (rpc.getblockcount()); batch() packs many calls into one HTTP POST,
+    which bitcoind answers in one response.
+    
+    Example:
+        >>> rpc = NodeRPC("http://127.0.0.1:8332", ("bitcoinrpc", "mypassword"))
+        >>> tip = rpc.getblockcount()
+        >>> hashes = rpc.batch(('getblockhash', (h,)) for h in range(tip - 9, tip + 1))
+    """
+    
+    def __init__(
+        self,
+        url: str,
+        auth: Tuple[str, str],
+        timeout: float = 300,
+        batch_size: int = RPC_BATCH_SIZE
+    ):
+        self.url = url
+        self.auth = auth
+        self.timeout = timeout
+        self.batch_size = batch_size
+        self._local = threading.local()
+        self._prevout_verbosity = None
+    
+    @property
+    def session(self) -> requests.Session:
+        """
+        Keep-alive session of the calling thread.
+        
+        One per thread, so a NodeRPC can be shared by a thread pool. RPC
+        results are never served from the HTTP cache.
+        """
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = build_session(cached=False)
+            session.auth = self.auth
+            self._local.session = session
+        return session
+    
+    @property
+    def prevout_verbosity(self) -> int:
+        """
+        getblock verbosity that includes the outputs spent by each input.
+        
+        3 (inputs carry 'prevout') if the node supports it, else 2 (callers
+        look up funding transactions themselves). Probed once, on first use.
+        """
+        if self._prevout_verbosity is None:
+            version = self.getnetworkinfo()['version']
+            self._prevout_verbosity = 3 if version >= PREVOUT_VERBOSITY_MIN_VERSION else 2
+        return self._prevout_verbosity
+    
+    def batch(
+        self,
+        calls: Iterable[Tuple[str, Sequence]],
+        batch_size: Optional[int] = None
+    ) -> list:
+        """
+        Run many calls, batch_size per HTTP request.
+        
+        Args:
+            calls: (method, params) pairs
+            batch_size: Calls per POST (default: self.batch_size)
+        
+        Returns:
+            Results in the same order as calls
+        
+        Raises:
+            RPCError: If any call returns an error
+        """
+        calls = list(calls)
+        batch_size = batch_size or self.batch_size
+        results = [None] * len(calls)
+        
+        for offset in range(0, len(calls), batch_size):
+            chunk = calls[offset:offset + batch_size]
+            payload = [
+                {'jsonrpc': '1.0', 'id': offset + i, 'method': method, 'params': list(params)}
+                for i, (method, params) in enumerate(chunk)
+            ]
+            response = self.session.post(self.url, data=encode_json(payload), timeout=self.timeout)
+            response.raise_for_status()
+            
+            # Replies may come back in any order: demultiplex by id
+            for reply in parse_json(response.content):
+                if reply.get('error'):
+                    raise RPCError(calls[reply['id']][0], reply['error'])
+                results[reply['id']] = reply['result']
+        
+        return results
+    
+    def call(self, method: str, *params):
+        """Run a single call (a batch of one)."""
+        return self.batch([(method, params)])[0]
+    
+    def __getattr__(self, method: str):
+        if method.startswith('_'):
+            raise AttributeError(method)
+        return lambda *params: self.call(method, *params)
 
 
 def connect_to_node(
     rpc_user: str,
     rpc_password: str,
     rpc_host: str = "127.0.0.1",
-    rpc_port: int = 8332
-) -> Optional['AuthServiceProxy']:
+    rpc_port: int = 8332,
+    timeout: float = 300
+) -> Optional[NodeRPC]:
     """
     Connect to Bitcoin Core RPC interface.
     
     Args:
         rpc_user: RPC username from bitcoin.conf
         rpc_password: RPC password from bitcoin.conf
-        rpc_host: Node IP address
+        rpc_host: Node IP address (an http:// prefix, as in settings.yaml, is fine)
         rpc_port: RPC port (default: 8332 for mainnet)
+        timeout: Per-request timeout in seconds
     
     Returns:
         RPC connection object, or None if connection fails
@@ -84,19 +267,16 @@ def connect_to_node(
         ...     info = rpc.getblockchaininfo()
         ...     print(f"Current height: {info['blocks']}")
     """
-    if not HAS_RPC:
-        print("Cannot connect: python-bitcoinrpc not installed")
-        return None
-    
     try:
-        rpc_url = f"http://{rpc_user}:{rpc_password}@{rpc_host}:{rpc_port}"
-        rpc = AuthServiceProxy(rpc_url, timeout=300)
+        base_url = rpc_host if '://' in rpc_host else f"http://{rpc_host}"
+        rpc = NodeRPC(f"{base_url}:{rpc_port}", (rpc_user, rpc_password), timeout=timeout)
         
         # Test connection
         info = rpc.getblockchaininfo()
         print(f"✓ Connected to Bitcoin Core node")
         print(f"  Height: {info['blocks']}")
         print(f"  Chain: {info['chain']}")
+        print(f"  getblock verbosity: {rpc.prevout_verbosity}")
         
         return rpc
     
@@ -109,6 +289,34 @@ def connect_to_node(
         return None
 
 
+def btc_to_sat(value: float) -> int:
+    """Convert a BTC amount from RPC JSON (8 decimals) to integer satoshis."""
+    return int(round(value * SATS_PER_BTC))
+
+
+def get_block_subsidy_sat(height: int) -> int:
+    """
+    Calculate block subsidy at a given height, in satoshis.
+    
+    Integer shift as in Bitcoin Core's GetBlockSubsidy() (exact, no float
+    pow/divide); use this wherever fees are reconciled against the coinbase.
+    
+    Args:
+        height: Block height
+    
+    Returns:
+        Subsidy in satoshis (0 after the 64th halving)
+    
+    Example:
+        >>> get_block_subsidy_sat(700000)
+        625000000
+    """
+    halvings = height // HALVING_INTERVAL
+    if halvings >= 64:
+        return 0
+    return INITIAL_SUBSIDY_SAT >> halvings
+
+
 def get_block_subsidy(height: int) -> float:
     """
     Calculate block subsidy (coinbase reward) at a given height.
@@ -117,7 +325,7 @@ def get_block_subsidy(height: int) -> float:
         height: Block height
     
     Returns:
-        Subsidy in BTC
+        Subsidy in BTC (see get_block_subsidy_sat() for exact satoshis)
     
     Formula:
         - Genesis to 209,999: 50 BTC
@@ -133,19 +341,70 @@ def get_block_subsidy(height: int) -> float:
         >>> get_block_subsidy(700000)
         6.25
     """
-    # Initial subsidy: 50 BTC
-    subsidy = 50.0
+    return get_block_subsidy_sat(height) / SATS_PER_BTC
+
+
+def get_block_subsidies_sat(heights) -> np.ndarray:
+    """
+    get_block_subsidy_sat() for a whole array of heights, in one shift.
     
-    # Number of halvings that have occurred
-    halvings = height // 210000
+    For columns of heights (no Python call per block); single blocks
+    keep using the scalar functions, which skip the array round-trip.
     
-    # Divide by 2 for each halving
-    subsidy = subsidy / (2 ** halvings)
+    Args:
+        heights: Array-like of block heights
     
-    return subsidy
+    Returns:
+        int64 array of subsidies in satoshis
+    
+    Example:
+        >>> get_block_subsidies_sat([0, 210000, 700000])
+        array([5000000000, 2500000000,  625000000])
+    """
+    # 50 BTC < 2^33 sats, so shifting by 63 already yields 0 (no >= 64 special case)
+    halvings = np.minimum(np.asarray(heights, dtype=np.int64) // HALVING_INTERVAL, 63)
+    return np.right_shift(np.int64(INITIAL_SUBSIDY_SAT), halvings)
 
 
-def extract_block_fees(rpc: 'AuthServiceProxy', block_hash: str) -> Dict:
+def get_block_subsidies(heights) -> np.ndarray:
+    """
+    get_block_subsidy() for a whole array of heights.
+    
+    Returns:
+        float64 array of subsidies in BTC (see get_block_subsidies_sat())
+    """
+    return get_block_subsidies_sat(heights) / SATS_PER_BTC
+
+
+def block_fees_from_block(block: dict) -> Dict:
+    """
+    Compute fee metrics from a getblock (verbosity=2) result.
+    
+    Fees are the coinbase outputs minus the subsidy, reconciled in satoshis.
+    See extract_block_fees() for the returned fields.
+    """
+    height = block['height']
+    subsidy_sat = get_block_subsidy_sat(height)
+    
+    # Coinbase tx (first tx in block) claims subsidy + fees
+    coinbase_sat = sum(btc_to_sat(vout['value']) for vout in block['tx'][0]['vout'])
+    fees_sat = coinbase_sat - subsidy_sat
+    
+    # Fee-to-subsidy ratio
+    total_reward = fees_sat + subsidy_sat
+    fee_to_subsidy = fees_sat / total_reward if total_reward > 0 else 0
+    
+    return {
+        'height': height,
+        'time': block['time'],
+        'fees_btc': fees_sat / SATS_PER_BTC,
+        'tx_count': len(block['tx']) - 1,  # Exclude coinbase
+        'subsidy_btc': subsidy_sat / SATS_PER_BTC,
+        'fee_to_subsidy': fee_to_subsidy
+    }
+
+
+def extract_block_fees(rpc: NodeRPC, block_hash: str) -> Dict:
     """
     Extract fee data from a single block.
     
@@ -161,127 +420,473 @@ def extract_block_fees(rpc: 'AuthServiceProxy', block_hash: str) -> Dict:
             - tx_count: Number of transactions
             - subsidy_btc: Block subsidy
             - fee_to_subsidy: Fees / (Fees + Subsidy)
+    """
+    return block_fees_from_block(rpc.getblock(block_hash, 2))  # verbosity=2 includes tx details
+
+
+def fee_rates_from_block(
+    rpc: NodeRPC,
+    block: dict,
+    utxo_cache: Optional[UTXOValueCache] = None
+) -> np.ndarray:
+    """
+    Compute per-transaction fee rates for a getblock (verbosity=2 or 3) result.
+    
+    A verbosity=3 block carries each input's spent output, so no lookups
+    are needed. Otherwise every input's previous transaction is looked up
+    with one batched getrawtransaction pass over the block's distinct txids,
+    rather than one round-trip per input. With a utxo_cache, only txids it
+    doesn't hold are sent to the node, and this block's own outputs are
+    added to it (later blocks spend them). See extract_transaction_fee_rates().
+    """
+    if has_inline_prevouts(block):
+        return _inline_fee_rates(block['tx'][1:])
+    return _fee_rates(block['tx'][1:], resolve_spent_outputs(rpc, block, utxo_cache))
+
+
+def has_inline_prevouts(block: dict) -> bool:
+    """True for a getblock verbosity=3 result (inputs carry their 'prevout')."""
+    return len(block['tx']) > 1 and 'prevout' in block['tx'][1]['vin'][0]
+
+
+# {funding txid: (block time, output values in sats in vout order)}
+SpentOutputs = Dict[str, Tuple[int, Sequence[int]]]
+
+
+def resolve_spent_outputs(
+    rpc: NodeRPC,
+    block: dict,
+    utxo_cache: Optional[UTXOValueCache] = None
+) -> SpentOutputs:
+    """
+    Look up the transactions whose outputs a block's inputs spend.
+    
+    Funding transactions come from the block itself, then the cache, then
+    one batched getrawtransaction call for whatever is left.
+    
+    Args:
+        rpc: RPC connection
+        block: getblock (verbosity=2) result
+        utxo_cache: Optional local cache (this block's outputs are added to it)
+    
+    Returns:
+        {funding txid: (block time, output values in sats)}
+    """
+    spent, missing = _lookup_spent_outputs(block, utxo_cache)
+    prev_txs = rpc.batch(('getrawtransaction', (txid, True)) for txid in missing)
+    _store_spent_outputs(block, missing, prev_txs, spent, utxo_cache)
+    return spent
+
+
+def _output_values(tx: dict) -> List[int]:
+    """Output values of a transaction in sats, in vout order."""
+    return [btc_to_sat(vout['value']) for vout in tx['vout']]
+
+
+def _lookup_spent_outputs(
+    block: dict,
+    utxo_cache: Optional[UTXOValueCache]
+) -> Tuple[SpentOutputs, List[str]]:
+    """
+    Resolve the outputs spent by a block's inputs without the node.
+    
+    Returns:
+        (spent, missing): funding transactions found in the block itself or
+        the cache, and the distinct funding txids still to fetch
+    """
+    # Distinct funding txids across the block (many inputs share one)
+    prev_txids = dict.fromkeys(vin['txid'] for tx in block['tx'][1:] for vin in tx['vin'])
+    
+    # Transactions may spend outputs created earlier in the same block
+    own_txids = {tx['txid'] for tx in block['tx']}
+    spent = {
+        tx['txid']: (block['time'], _output_values(tx))
+        for tx in block['tx'] if tx['txid'] in prev_txids
+    }
+    
+    lookup = [txid for txid in prev_txids if txid not in own_txids]
+    if utxo_cache is not None:
+        spent.update(utxo_cache.get_many(lookup))
+    
+    return spent, [txid for txid in lookup if txid not in spent]
+
+
+def _store_spent_outputs(
+    block: dict,
+    missing: List[str],
+    prev_txs: List[dict],
+    spent: SpentOutputs,
+    utxo_cache: Optional[UTXOValueCache]
+) -> None:
+    """Add fetched funding transactions to spent, and new outputs to the cache."""
+    fetched = {
+        txid: (prev_tx['blocktime'], _output_values(prev_tx))
+        for txid, prev_tx in zip(missing, prev_txs)
+    }
+    spent.update(fetched)
+    
+    if utxo_cache is not None:
+        fetched.update((tx['txid'], (block['time'], _output_values(tx))) for tx in block['tx'])
+        utxo_cache.put_many(fetched)
+
+
+def spent_output_arrays(block: dict, spent: SpentOutputs) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Flatten a block's inputs into parallel arrays (one entry per input).
+    
+    Args:
+        block: getblock (verbosity=2) result
+        spent: Funding transactions from resolve_spent_outputs()
+    
+    Returns:
+        (amount_sat, created_time): int64 arrays of each spent output's
+        value and its funding transaction's block time
+    """
+    inputs = [vin for tx in block['tx'][1:] for vin in tx['vin']]  # Skip coinbase
+    amount_sat = np.fromiter(
+        (spent[vin['txid']][1][vin['vout']] for vin in inputs), dtype=np.int64, count=len(inputs)
+    )
+    created_time = np.fromiter(
+        (spent[vin['txid']][0] for vin in inputs), dtype=np.int64, count=len(inputs)
+    )
+    return amount_sat, created_time
+
+
+def _segment_sums(values: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Sum consecutive runs of values (run i has counts[i] entries), exactly in int64."""
+    totals = np.zeros(len(values) + 1, dtype=np.int64)
+    np.cumsum(values, out=totals[1:])
+    ends = np.cumsum(counts)
+    return totals[ends] - totals[ends - counts]
+
+
+def _entry_counts(txs: List[dict], key: str) -> np.ndarray:
+    """Number of inputs ('vin') or outputs ('vout') of each tx."""
+    return np.fromiter((len(tx[key]) for tx in txs), dtype=np.int64, count=len(txs))
+
+
+def _btc_totals_sat(values: Iterable[float], counts: np.ndarray) -> np.ndarray:
+    """Per-tx totals in sats of BTC amounts listed tx by tx (counts[i] for tx i)."""
+    btc = np.fromiter(values, dtype=np.float64, count=int(counts.sum()))
+    # Same rounding as btc_to_sat() (half to even), for the whole block at once
+    return _segment_sums(np.rint(btc * SATS_PER_BTC).astype(np.int64), counts)
+
+
+def _output_sat(txs: List[dict]) -> np.ndarray:
+    """Total output value of each tx, in sats."""
+    return _btc_totals_sat(
+        (vout['value'] for tx in txs for vout in tx['vout']), _entry_counts(txs, 'vout')
+    )
+
+
+def _vsizes(txs: List[dict]) -> np.ndarray:
+    """Virtual sizes of txs (int32, one per tx)."""
+    return np.fromiter((tx['vsize'] for tx in txs), dtype=np.int32, count=len(txs))
+
+
+def _fee_rates(txs: List[dict], spent: SpentOutputs) -> np.ndarray:
+    """Fee rates (sat/vB) of txs, given the outputs their inputs spend."""
+    counts = _entry_counts(txs, 'vin')
+    input_values = np.fromiter(
+        (spent[vin['txid']][1][vin['vout']] for tx in txs for vin in tx['vin']),
+        dtype=np.int64, count=int(counts.sum())
+    )
+    fee_sat = _segment_sums(input_values, counts) - _output_sat(txs)
     
-    Pseudocode:
-        1. Get block data (height, timestamp, tx list)
-        2. Calculate subsidy from height
-        3. Sum all transaction fees:
-           - Method A: Coinbase output - subsidy = fees
-           - Method B: Sum(inputs) - Sum(outputs) for each tx
-        4. Return aggregated metrics
-    
-    TODO: Implement actual fee extraction logic!
-    """
-    # TODO: Implement this function
-    # 
-    # block = rpc.getblock(block_hash, 2)  # verbosity=2 includes tx details
-    # height = block['height']
-    # timestamp = block['time']
-    # 
-    # # Get subsidy
-    # subsidy = get_block_subsidy(height)
-    # 
-    # # Extract coinbase tx (first tx in block)
-    # coinbase_tx = block['tx'][0]
-    # coinbase_output_sum = sum(vout['value'] for vout in coinbase_tx['vout'])
-    # fees = coinbase_output_sum - subsidy
-    # 
-    # # Transaction count (exclude coinbase)
-    # tx_count = len(block['tx']) - 1
-    # 
-    # # Fee-to-subsidy ratio
-    # total_reward = fees + subsidy
-    # fee_to_subsidy = fees / total_reward if total_reward > 0 else 0
-    # 
-    # return {
-    #     'height': height,
-    #     'time': timestamp,
-    #     'fees_btc': fees,
-    #     'tx_count': tx_count,
-    #     'subsidy_btc': subsidy,
-    #     'fee_to_subsidy': fee_to_subsidy
-    # }
-    
-    raise NotImplementedError("TODO: Implement block fee extraction")
+    # Fee rate in sat/vB (vsize accounts for SegWit weight units)
+    return fee_sat / _vsizes(txs)
+
+
+def _inline_fee_rates(txs: List[dict]) -> np.ndarray:
+    """Fee rates (sat/vB) of verbosity=3 txs, from their inputs' prevouts."""
+    input_sat = _btc_totals_sat(
+        (vin['prevout']['value'] for tx in txs for vin in tx['vin']), _entry_counts(txs, 'vin')
+    )
+    return (input_sat - _output_sat(txs)) / _vsizes(txs)
 
 
 def extract_transaction_fee_rates(
-    rpc: 'AuthServiceProxy',
-    block_hash: str
-) -> List[float]:
+    rpc: NodeRPC,
+    block_hash: str,
+    utxo_cache: Optional[UTXOValueCache] = None
+) -> np.ndarray:
     """
     Extract fee rates (sat/vB) for all transactions in a block.
     
     Args:
         rpc: RPC connection
         block_hash: Block hash
+        utxo_cache: Optional local cache of output values (skips repeated
+                   getrawtransaction lookups across blocks and runs; unused
+                   on nodes that support verbosity=3)
     
     Returns:
-        List of fee rates in sat/vB (one per transaction, excluding coinbase)
+        float64 array of fee rates in sat/vB (one per transaction, excluding
+        coinbase)
     
-    Pseudocode:
-        1. Get block with full transaction details
-        2. For each non-coinbase transaction:
-           a. Calculate fee = sum(inputs) - sum(outputs)
-           b. Get vsize (virtual size in vbytes)
-           c. fee_rate = (fee * 1e8) / vsize  # Convert BTC to sats
-        3. Return list of fee rates
-    
-    TODO: Implement this function!
+    Method:
+        1. Get block with full transaction details (verbosity=3, with the
+           spent outputs inline, when the node supports it)
+        2. On older nodes, batch-fetch the previous transactions of all inputs
+           (except those already in the block or the cache)
+        3. For each non-coinbase transaction:
+           fee_rate = (sum(inputs) - sum(outputs)) in sats / vsize
+           (computed column-wise: the block's input and output values are
+           flattened into int64 sat arrays and summed per transaction, so no
+           per-transaction Python objects are kept)
     
     Note:
-        - Requires txindex=1 to look up input values
+        - Requires txindex=1 to look up input values (before Core 23.0)
         - vsize accounts for SegWit weight units
     """
-    # TODO: Implement
-    # 
-    # block = rpc.getblock(block_hash, 2)
-    # fee_rates = []
-    # 
-    # for tx in block['tx'][1:]:  # Skip coinbase
-    #     # Get inputs (need to fetch previous txs for amounts)
-    #     input_sum = 0
-    #     for vin in tx['vin']:
-    #         prev_tx = rpc.getrawtransaction(vin['txid'], True)
-    #         input_sum += prev_tx['vout'][vin['vout']]['value']
-    #     
-    #     # Get outputs
-    #     output_sum = sum(vout['value'] for vout in tx['vout'])
-    #     
-    #     # Fee in BTC
-    #     fee = input_sum - output_sum
-    #     
-    #     # Fee rate in sat/vB
-    #     vsize = tx['vsize']
-    #     fee_rate = (fee * 1e8) / vsize
-    #     
-    #     fee_rates.append(fee_rate)
-    # 
-    # return fee_rates
-    
-    raise NotImplementedError("TODO: Implement transaction fee rate extraction")
+    return fee_rates_from_block(rpc, rpc.getblock(block_hash, rpc.prevout_verbosity), utxo_cache)
 
 
-def fetch_blocks_in_date_range(
-    rpc: 'AuthServiceProxy',
+def _block_row(block: dict, fee_rates: np.ndarray) -> CachedBlock:
+    """
+    One output row of fetch_blocks_in_date_range() (fees + fee-rate percentiles).
+    
+    Returns:
+        (block hash, row, sketch of the block's fee rates): the form kept
+        in the block cache; the sketch feeds the daily fee-rate CSV
+    """
+    row = block_fees_from_block(block)
+    sketch = QuantileSketch()
+    sketch.update(fee_rates)
+    
+    # Compute percentiles (one partition pass for both)
+    if fee_rates.size:
+        row['median_sat_vb'], row['p90_sat_vb'] = partition_percentiles(fee_rates, (0.5, 0.9))
+    else:
+        row['median_sat_vb'] = row['p90_sat_vb'] = 0.0
+    
+    return block['hash'], row, sketch
+
+
+def _cached_blocks(
+    block_cache: Optional[BlockCache],
+    heights: List[int],
+    block_hashes: List[str],
+    force_refresh: bool
+) -> Dict[int, CachedBlock]:
+    """Cached results for these heights whose hash still matches the node's."""
+    if block_cache is None or force_refresh:
+        return {}
+    
+    current = dict(zip(heights, block_hashes))
+    return {
+        height: cached for height, cached in block_cache.get_many(heights).items()
+        if cached[0] == current[height]  # A reorged block is fetched again
+    }
+
+
+def _collect_window(
+    heights: List[int],
+    cached: Dict[int, CachedBlock],
+    fetched: List[CachedBlock],
+    block_cache: Optional[BlockCache],
+    blocks_data: List[Dict],
+    daily_sketches: Dict[pd.Timestamp, QuantileSketch]
+) -> None:
+    """Store fetched blocks, then append a window's rows in height order and merge its sketches."""
+    if block_cache is not None and fetched:
+        block_cache.put_many(fetched)
+    
+    results = dict(cached)
+    results.update((row['height'], (block_hash, row, sketch)) for block_hash, row, sketch in fetched)
+    
+    for height in heights:
+        _, row, sketch = results[height]
+        blocks_data.append(row)
+        daily_sketches[pd.Timestamp(row['time'], unit='s').normalize()].merge(sketch)
+
+
+def _date_range_bounds(start_date: str, end_date: str) -> Tuple[int, int]:
+    """[start, end) Unix timestamps of a YYYY-MM-DD range (UTC, end date inclusive)."""
+    start_ts = int(pd.Timestamp(start_date).timestamp())
+    end_ts = int((pd.Timestamp(end_date) + pd.Timedelta(days=1)).timestamp())
+    return start_ts, end_ts
+
+
+def _save_blocks_csv(blocks_data: List[Dict], start_date: str, end_date: str, output_dir: Path) -> Path:
+    """Write fetch_blocks_in_date_range() rows (ordered by height) to CSV."""
+    columns = ['date', 'height', 'fees_btc', 'subsidy_btc', 'tx_count',
+               'fee_to_subsidy', 'median_sat_vb', 'p90_sat_vb']
+    df = pd.DataFrame(blocks_data, columns=['time'] + columns[1:])
+    df.insert(0, 'date', pd.to_datetime(df.pop('time'), unit='s').dt.normalize())
+    
+    output_path = Path(output_dir) / f"node_rpc_blocks_{start_date}_to_{end_date}.csv"
+    save_csv(df, output_path)
+    return output_path
+
+
+def _save_daily_fee_rates_csv(
+    daily_sketches: Dict[pd.Timestamp, QuantileSketch],
     start_date: str,
     end_date: str,
     output_dir: Path
 ) -> Path:
+    """Write daily median/p90 fee rates (from the per-day sketches) to CSV."""
+    days = sorted(daily_sketches)
+    df = pd.DataFrame({
+        'date': pd.DatetimeIndex(days, dtype='datetime64[ns]'),
+        'median_sat_vb': [daily_sketches[day].quantile(0.5) for day in days],
+        'p90_sat_vb': [daily_sketches[day].quantile(0.9) for day in days],
+        'tx_count': np.array([daily_sketches[day].count for day in days], dtype=np.int64)
+    })
+    
+    output_path = Path(output_dir) / f"node_rpc_fee_rates_daily_{start_date}_to_{end_date}.csv"
+    save_csv(df, output_path)
+    return output_path
+
+
+def _block_time(rpc: NodeRPC, height: int, time_cache: Dict[int, int]) -> int:
+    """Block time at a height (getblockhash + getblockheader), memoized in time_cache."""
+    if height not in time_cache:
+        time_cache[height] = rpc.getblockheader(rpc.getblockhash(height))['time']
+    return time_cache[height]
+
+
+def find_height_for_timestamp(
+    rpc: NodeRPC,
+    ts: int,
+    lo: int = 0,
+    hi: Optional[int] = None,
+    time_cache: Optional[Dict[int, int]] = None
+) -> int:
     """
-    Fetch block-level data for all blocks in a date range.
+    Binary-search the first height whose block time is >= ts.
+    
+    Takes O(log N) header lookups instead of scanning every header. Block
+    times are only roughly monotone (a block may be timestamped up to ~2h
+    out of order), so the result is exact up to that jitter; see
+    find_heights_in_range() for the exact set of blocks in a time range.
     
     Args:
         rpc: RPC connection
+        ts: Unix timestamp
+        lo: Lowest height to consider (default: genesis)
+        hi: One past the highest height to consider (default: tip + 1)
+        time_cache: Optional {height: block time} dict of earlier probes,
+                   shared between searches
+    
+    Returns:
+        Height in [lo, hi]; hi if every block in range is earlier than ts
+    
+    Example:
+        >>> find_height_for_timestamp(rpc, 1363392000)  # 2013-03-16 00:00 UTC
+        226036
+    """
+    if hi is None:
+        hi = rpc.getblockcount() + 1
+    if time_cache is None:
+        time_cache = {}
+    
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if _block_time(rpc, mid, time_cache) < ts:
+            lo = mid + 1
+        else:
+            hi = mid
+    
+    return lo
+
+
+def find_heights_in_range(rpc: NodeRPC, start_ts: int, end_ts: int) -> Tuple[List[int], List[str]]:
+    """
+    List the heights and hashes of blocks with start_ts <= time < end_ts.
+    
+    Binary-searches both ends of the range. Block times aren't strictly
+    monotone, so only the blocks within TIMESTAMP_SLACK_BLOCKS of either end
+    have their headers checked (batched getblockheader, skipping heights
+    the search already probed); blocks further inside are in range. The
+    hashes of every candidate are batch-fetched once and returned, so
+    callers pass them straight to getblock.
+    
+    Returns:
+        (heights, block_hashes), in height order
+    """
+    tip = rpc.getblockcount()
+    time_cache = {}
+    first = find_height_for_timestamp(rpc, start_ts, 0, tip + 1, time_cache)
+    last = find_height_for_timestamp(rpc, end_ts, first, tip + 1, time_cache)
+    
+    lo = max(first - TIMESTAMP_SLACK_BLOCKS, 0)
+    hi = min(last + TIMESTAMP_SLACK_BLOCKS, tip + 1)
+    # Heights in [inner_lo, inner_hi) are more than the slack inside both ends
+    inner_lo = first + TIMESTAMP_SLACK_BLOCKS
+    inner_hi = max(last - TIMESTAMP_SLACK_BLOCKS, inner_lo)
+    
+    candidates = range(lo, hi)
+    block_hashes = rpc.batch(('getblockhash', (h,)) for h in candidates)
+    
+    unchecked = [
+        i for i, h in enumerate(candidates)
+        if not inner_lo <= h < inner_hi and h not in time_cache
+    ]
+    headers = rpc.batch(('getblockheader', (block_hashes[i],)) for i in unchecked)
+    time_cache.update((candidates[i], header['time']) for i, header in zip(unchecked, headers))
+    
+    in_range = [
+        i for i, h in enumerate(candidates)
+        if inner_lo <= h < inner_hi or start_ts <= time_cache[h] < end_ts
+    ]
+    return [candidates[i] for i in in_range], [block_hashes[i] for i in in_range]
+
+
+def _fetch_block_chunk(
+    rpc: NodeRPC,
+    block_hashes: List[str],
+    verbosity: int,
+    utxo_cache: Optional[UTXOValueCache]
+) -> List[CachedBlock]:
+    """Fetch one getblock batch and compute its rows (runs in a worker thread)."""
+    blocks = rpc.batch(
+        (('getblock', (block_hash, verbosity)) for block_hash in block_hashes),
+        batch_size=BLOCK_BATCH_SIZE
+    )
+    return [_block_row(block, fee_rates_from_block(rpc, block, utxo_cache)) for block in blocks]
+
+
+def fetch_blocks_in_date_range(
+    rpc: Optional[NodeRPC],
+    start_date: str,
+    end_date: str,
+    output_dir: Path,
+    use_utxo_cache: bool = True,
+    max_workers: int = 4,
+    use_block_cache: bool = True,
+    force_refresh: bool = False,
+    datadir: Optional[Path] = None
+) -> Path:
+    """
+    Fetch block-level data for all blocks in a date range.
+    
+    Args:
+        rpc: RPC connection (None to read the node's block files instead,
+             see datadir)
         start_date: YYYY-MM-DD
-        end_date: YYYY-MM-DD
+        end_date: YYYY-MM-DD (inclusive)
         output_dir: Where to save CSV
+        use_utxo_cache: Keep spent-output values in data/cache/utxo_values.sqlite
+                       (see _utxo_cache.py), so inputs funded by already-seen
+                       transactions aren't looked up again (only used on
+                       nodes without getblock verbosity=3)
+        max_workers: Block batches fetched concurrently (threads); keep it
+                    at or below bitcoind's -rpcthreads (default 4)
+        use_block_cache: Keep each block's results in data/cache/blocks.sqlite
+                        (see _block_cache.py), so re-runs only fetch blocks
+                        they haven't seen
+        force_refresh: Refetch every block even if cached (and update the cache)
+        datadir: Bitcoin Core data directory; with rpc=None, blocks are parsed
+                straight from its blk*.dat files (raw_blocks.py), which is
+                much faster for historical ranges
     
     Returns:
         Path to saved CSV
     
     Output CSV columns:
-        - date: YYYY-MM-DD
+        - date: YYYY-MM-DD (UTC)
         - height: Block height
         - fees_btc: Total fees in block
         - subsidy_btc: Block subsidy
@@ -290,71 +895,245 @@ def fetch_blocks_in_date_range(
         - median_sat_vb: Median fee rate in block
         - p90_sat_vb: 90th percentile fee rate
     
-    Pseudocode:
-        1. Convert dates to timestamps
-        2. Find first and last block heights in range
-        3. For each block:
-           a. Extract fees and subsidy
-           b. Extract transaction fee rates
-           c. Compute median and p90
-        4. Save to CSV
+    Also writes node_rpc_fee_rates_daily_{start}_to_{end}.csv with
+    date, median_sat_vb, p90_sat_vb and tx_count per UTC day, estimated
+    within 1% by a streaming QuantileSketch per day (fixed memory however
+    many transactions a day has). It can be fed to
+    fee_rate_urgency.compute_from_block_aggregates().
     
-    TODO: Implement this function!
+    Method:
+        1. Find the heights whose block time falls in the range
+           (binary search on block times, see find_heights_in_range())
+        2. Reuse their hashes from that search, then getblock in small batches
+           (verbosity=3 when the node supports it), max_workers batches at a time
+        3. For each block not in the block cache, compute fees and
+           fee-rate percentiles
+        4. Save to CSV
     
     Note: This can take hours for large date ranges!
-          Consider parallelization or caching.
-    """
-    # TODO: Implement
-    # 
-    # start_ts = int(datetime.strptime(start_date, "%Y-%m-%d").timestamp())
-    # end_ts = int(datetime.strptime(end_date, "%Y-%m-%d").timestamp())
-    # 
-    # # Binary search or linear scan to find block heights
-    # # (Use getblockhash + getblockheader to map time to height)
-    # 
-    # blocks_data = []
-    # for height in range(start_height, end_height + 1):
-    #     block_hash = rpc.getblockhash(height)
-    #     
-    #     # Extract fees
-    #     block_fees = extract_block_fees(rpc, block_hash)
-    #     
-    #     # Extract fee rates
-    #     fee_rates = extract_transaction_fee_rates(rpc, block_hash)
-    #     
-    #     # Compute percentiles
-    #     if fee_rates:
-    #         median_sat_vb = np.median(fee_rates)
-    #         p90_sat_vb = np.percentile(fee_rates, 90)
-    #     else:
-    #         median_sat_vb = 0
-    #         p90_sat_vb = 0
-    #     
-    #     blocks_data.append({
-    #         'date': datetime.fromtimestamp(block_fees['time']).date(),
-    #         'height': height,
-    #         'fees_btc': block_fees['fees_btc'],
-    #         'subsidy_btc': block_fees['subsidy_btc'],
-    #         'tx_count': block_fees['tx_count'],
-    #         'fee_to_subsidy': block_fees['fee_to_subsidy'],
-    #         'median_sat_vb': median_sat_vb,
-    #         'p90_sat_vb': p90_sat_vb
-    #     })
-    # 
-    # df = pd.DataFrame(blocks_data)
-    # output_path = output_dir / f"node_rpc_blocks_{start_date}_to_{end_date}.csv"
-    # save_csv(df, output_path)
-    # return output_path
-    
-    raise NotImplementedError("TODO: Implement date range block fetching")
-
-
-# Example usage
+          On nodes before Core 23.0 each block still needs its input lookups
+          (batched per block). With the block cache, that happens once per
+          block: re-runs over scanned ranges take seconds.
+    """
+    if rpc is None:
+        if datadir is None:
+            raise ValueError("Either an RPC connection or a datadir is required")
+        from .raw_blocks import fetch_blocks_from_datadir
+        return fetch_blocks_from_datadir(datadir, start_date, end_date, output_dir, use_block_cache, force_refresh)
+    
+    start_ts, end_ts = _date_range_bounds(start_date, end_date)
+    verbosity = rpc.prevout_verbosity
+    utxo_cache = UTXOValueCache() if use_utxo_cache and verbosity < 3 else None
+    block_cache = BlockCache() if use_block_cache else None
+    daily_sketches = defaultdict(QuantileSketch)
+    
+    print(f"📊 Fetching blocks {start_date} to {end_date} from node...")
+    heights, block_hashes = find_heights_in_range(rpc, start_ts, end_ts)
+    print(f"   Blocks in range: {len(heights)}")
+    
+    def fetch_chunk(chunk: List[str]) -> List[CachedBlock]:
+        return _fetch_block_chunk(rpc, chunk, verbosity, utxo_cache)
+    
+    blocks_data = []
+    n_cached = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for offset in range(0, len(heights), BLOCK_CACHE_WINDOW):
+            window_heights = heights[offset:offset + BLOCK_CACHE_WINDOW]
+            window_hashes = block_hashes[offset:offset + BLOCK_CACHE_WINDOW]
+            cached = _cached_blocks(block_cache, window_heights, window_hashes, force_refresh)
+            n_cached += len(cached)
+            
+            missing = [block_hash for h, block_hash in zip(window_heights, window_hashes) if h not in cached]
+            chunks = [missing[i:i + BLOCK_BATCH_SIZE] for i in range(0, len(missing), BLOCK_BATCH_SIZE)]
+            fetched = [result for results in executor.map(fetch_chunk, chunks) for result in results]
+            
+            _collect_window(window_heights, cached, fetched, block_cache, blocks_data, daily_sketches)
+            print(f"   ✓ {len(blocks_data)}/{len(heights)} blocks ({n_cached} from cache)")
+    
+    if utxo_cache is not None:
+        utxo_cache.close()
+    if block_cache is not None:
+        block_cache.close()
+    
+    _save_daily_fee_rates_csv(daily_sketches, start_date, end_date, output_dir)
+    return _save_blocks_csv(blocks_data, start_date, end_date, output_dir)
+
+
+async def _rpc_batch_async(
+    session: 'aiohttp.ClientSession',
+    rpc: NodeRPC,
+    calls: List[Tuple[str, Sequence]],
+    semaphore: asyncio.Semaphore,
+    batch_size: Optional[int] = None
+) -> list:
+    """
+    Async counterpart of NodeRPC.batch(): the batch POSTs run concurrently.
+    
+    Args:
+        session: aiohttp session authenticated for rpc.url
+        rpc: Connection whose url and batch size are used
+        calls: (method, params) pairs
+        semaphore: Caps the number of requests in flight
+        batch_size: Calls per POST (default: rpc.batch_size)
+    
+    Returns:
+        Results in the same order as calls
+    """
+    batch_size = batch_size or rpc.batch_size
+    
+    async def post(offset: int) -> list:
+        chunk = calls[offset:offset + batch_size]
+        payload = [
+            {'jsonrpc': '1.0', 'id': i, 'method': method, 'params': list(params)}
+            for i, (method, params) in enumerate(chunk)
+        ]
+        async with semaphore:
+            async with session.post(rpc.url, data=encode_json(payload)) as response:
+                response.raise_for_status()
+                body = await response.read()
+        
+        results = [None] * len(chunk)
+        for reply in parse_json(body):
+            if reply.get('error'):
+                raise RPCError(chunk[reply['id']][0], reply['error'])
+            results[reply['id']] = reply['result']
+        return results
+    
+    chunks = await asyncio.gather(*(post(offset) for offset in range(0, len(calls), batch_size)))
+    return [result for chunk in chunks for result in chunk]
+
+
+async def fetch_blocks_in_date_range_async(
+    rpc: NodeRPC,
+    start_date: str,
+    end_date: str,
+    output_dir: Path,
+    rpc_pool_size: int = 8,
+    use_utxo_cache: bool = True,
+    use_block_cache: bool = True,
+    force_refresh: bool = False
+) -> Path:
+    """
+    Fetch block-level data for a date range with several blocks in flight.
+    
+    Same output as fetch_blocks_in_date_range(), but up to rpc_pool_size
+    blocks are fetched and resolved concurrently over one aiohttp connection
+    pool, so the node works on several requests while others are in transit.
+    
+    Args:
+        rpc: RPC connection (its URL, credentials and timeout are reused)
+        start_date: YYYY-MM-DD
+        end_date: YYYY-MM-DD (inclusive)
+        output_dir: Where to save CSV
+        rpc_pool_size: Maximum requests in flight; keep it at or below
+                      bitcoind's -rpcthreads (default 4, often raised to 16)
+        use_utxo_cache: Keep spent-output values in the local cache
+                       (see fetch_blocks_in_date_range())
+        use_block_cache: Reuse and store per-block results (see
+                        fetch_blocks_in_date_range())
+        force_refresh: Refetch every block even if cached
+    
+    Returns:
+        Path to saved CSV
+    
+    Example:
+        >>> import asyncio
+        >>> rpc = connect_to_node("bitcoinrpc", "mypassword")
+        >>> run_async(fetch_blocks_in_date_range_async(rpc, '2013-03-01', '2013-03-31', Path('data/raw')))
+    """
+    if not HAS_AIOHTTP:
+        raise ImportError("aiohttp not installed. Install with: pip install aiohttp")
+    
+    start_ts, end_ts = _date_range_bounds(start_date, end_date)
+    verbosity = rpc.prevout_verbosity
+    utxo_cache = UTXOValueCache() if use_utxo_cache and verbosity < 3 else None
+    block_cache = BlockCache() if use_block_cache else None
+    daily_sketches = defaultdict(QuantileSketch)
+    
+    print(f"📊 Fetching blocks {start_date} to {end_date} from node (concurrent)...")
+    
+    semaphore = asyncio.Semaphore(rpc_pool_size)
+    connector = aiohttp.TCPConnector(
+        limit=rpc_pool_size,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=KEEPALIVE_TIMEOUT
+    )
+    timeout = aiohttp.ClientTimeout(total=rpc.timeout)
+    auth = aiohttp.BasicAuth(*rpc.auth)
+    
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout, auth=auth) as session:
+        async def batch(calls, batch_size=None):
+            return await _rpc_batch_async(session, rpc, list(calls), semaphore, batch_size)
+        
+        # Heights in range: a short binary search, run off the event loop while
+        # cheap calls open the pool's connections (the fan-out starts on warm ones)
+        (heights, block_hashes), _ = await asyncio.gather(
+            asyncio.to_thread(find_heights_in_range, rpc, start_ts, end_ts),
+            asyncio.gather(*(batch([('getblockcount', ())]) for _ in range(rpc_pool_size)))
+        )
+        print(f"   Blocks in range: {len(block_hashes)}")
+        
+        # One slot per block in flight, so at most rpc_pool_size blocks are held in memory
+        block_slots = asyncio.Semaphore(rpc_pool_size)
+        
+        async def process(block_hash: str) -> CachedBlock:
+            async with block_slots:
+                block = (await batch([('getblock', (block_hash, verbosity))]))[0]
+                if has_inline_prevouts(block):
+                    return _block_row(block, _inline_fee_rates(block['tx'][1:]))
+                
+                spent, missing = _lookup_spent_outputs(block, utxo_cache)
+                prev_txs = await batch(('getrawtransaction', (txid, True)) for txid in missing)
+                _store_spent_outputs(block, missing, prev_txs, spent, utxo_cache)
+                return _block_row(block, _fee_rates(block['tx'][1:], spent))
+        
+        blocks_data = []
+        n_cached = 0
+        for offset in range(0, len(heights), BLOCK_CACHE_WINDOW):
+            window_heights = heights[offset:offset + BLOCK_CACHE_WINDOW]
+            window_hashes = block_hashes[offset:offset + BLOCK_CACHE_WINDOW]
+            cached = _cached_blocks(block_cache, window_heights, window_hashes, force_refresh)
+            n_cached += len(cached)
+            
+            fetched = await asyncio.gather(*(
+                process(block_hash) for h, block_hash in zip(window_heights, window_hashes) if h not in cached
+            ))
+            _collect_window(window_heights, cached, fetched, block_cache, blocks_data, daily_sketches)
+    
+    print(f"   ✓ {len(blocks_data)}/{len(heights)} blocks ({n_cached} from cache)")
+    
+    if utxo_cache is not None:
+        utxo_cache.close()
+    if block_cache is not None:
+        block_cache.close()
+    
+    _save_daily_fee_rates_csv(daily_sketches, start_date, end_date, output_dir)
+    return _save_blocks_csv(blocks_data, start_date, end_date, output_dir)
+
+
+def run_async(coro):
+    """
+    Run a coroutine to completion, on uvloop's event loop when installed.
+    
+    Drop-in for asyncio.run() (falls back to it without uvloop); the loop is
+    only swapped for this call, not installed process-wide.
+    
+    Example:
+        >>> run_async(fetch_blocks_in_date_range_async(rpc, '2013-03-01', '2013-03-31', Path('data/raw')))
+    """
+    if HAS_UVLOOP:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+# Example usage (run as a module from the project root:
+#   python -m src.data_sources.node_rpc)
 if __name__ == "__main__":
     print("⚠️  This module requires a Bitcoin Core node with RPC access.")
     print("   See docstring for setup instructions.")
     print("\n   Once configured, you can:")
     print("   1. Connect to node: rpc = connect_to_node('user', 'pass')")
     print("   2. Fetch blocks: fetch_blocks_in_date_range(rpc, '2013-01-01', '2013-12-31', Path('data/raw'))")
-    print("\n   For now, use blockchain_com.py for quick data access!")
+    print("\n   Or, with RPC credentials in config/settings.yaml:")
+    print("   python scripts/01_fetch_data.py --sources node_rpc --start-date 2013-01-01 --end-date 2013-12-31")
 
@@ -0,0 +1,420 @@
+"""
+Offline block source: Bitcoin Core's raw block files (blocks/blk*.dat).
+
+fetch_blocks_in_date_range() spends most of its time moving blocks over
+RPC as JSON, although the node already keeps them on disk in consensus
+serialization. This module memory-maps the node's blk*.dat files and
+parses the blocks directly (no RPC, no JSON), producing the same CSVs as
+node_rpc, so historical scans are bound by disk bandwidth instead.
+
+FILE LAYOUT:
+   Each blk?????.dat file is a sequence of records:
+       network magic (4 bytes) | block size (uint32 LE) | serialized block
+   Blocks are stored in the order the node downloaded them, not by height,
+   and stale blocks stay in the files, so heights come from linking every
+   header to its parent and walking the longest chain back from its tip.
+   Bitcoin Core 28.0+ XORs the files with the key in blocks/xor.dat; such
+   files are read into memory and de-obfuscated instead of mapped.
+
+SPENT OUTPUTS:
+   Blocks don't carry the values of the outputs their inputs spend, and
+   there's no txindex to ask. They come from the UTXO cache node_rpc uses
+   (data/cache/utxo_values.sqlite), filled by index_outputs() with one pass
+   over every block up to the end of the range. That pass is a one-time
+   cost: later runs resume where the previous one stopped.
+
+REQUIREMENTS:
+   - A non-pruned node (the files must go back to the genesis block)
+   - Stop bitcoind first, or at least scan ranges it isn't writing to
+
+Usage:
+    from src.data_sources.raw_blocks import fetch_blocks_from_datadir
+    
+    fetch_blocks_from_datadir(Path('~/.bitcoin'), '2013-03-01', '2013-03-31', Path('data/raw'))
+"""
+
+import hashlib
+import mmap
+import struct
+from collections import OrderedDict, defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+import numpy as np
+
+from ..utils.math_stats import QuantileSketch
+from . import node_rpc
+from ._utxo_cache import UTXOValueCache
+from ._block_cache import BlockCache, CachedBlock
+
+
+# Block header: version, previous block hash, merkle root, time, bits, nonce
+HEADER_SIZE = 80
+
+# Blocks per UTXO cache write (and progress update) in index_outputs()
+INDEX_BATCH_BLOCKS = 1000
+
+# UTXO cache meta key: heights below it have their outputs in the cache
+INDEXED_HEIGHT_KEY = 'raw_blocks_indexed_height'
+
+# blk*.dat files kept open (height order jumps between neighbouring files)
+_OPEN_FILES = 4
+
+_RECORD = struct.Struct('<4sI')  # magic, block size
+_U16 = struct.Struct('<H')
+_U32 = struct.Struct('<I')
+_U64 = struct.Struct('<Q')
+_I64 = struct.Struct('<q')
+
+_NULL_HASH = bytes(32)
+_COINBASE_VOUT = 0xffffffff
+
+Buffer = Union[mmap.mmap, bytes]
+
+
+def _sha256d(*parts: bytes) -> bytes:
+    """Double SHA-256 of the concatenated parts (internal byte order)."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part)
+    return hashlib.sha256(digest.digest()).digest()
+
+
+def _read_varint(buf: Buffer, pos: int) -> Tuple[int, int]:
+    """CompactSize integer at pos: (value, position after it)."""
+    first = buf[pos]
+    if first < 0xfd:
+        return first, pos + 1
+    if first == 0xfd:
+        return _U16.unpack_from(buf, pos + 1)[0], pos + 3
+    if first == 0xfe:
+        return _U32.unpack_from(buf, pos + 1)[0], pos + 5
+    return _U64.unpack_from(buf, pos + 1)[0], pos + 9
+
+
+def parse_transaction(buf: Buffer, pos: int) -> Tuple[Dict, int]:
+    """
+    Parse one serialized transaction.
+    
+    Args:
+        buf: Block file contents
+        pos: Offset of the transaction
+    
+    Returns:
+        (tx, end): tx in getblock verbosity=2 form (txid, vsize, weight,
+        vin with txid/vout or coinbase, vout with n/value in BTC), and the
+        offset just past it
+    """
+    start = pos
+    pos += 4  # version
+    
+    # BIP144: a zero input count followed by a non-zero flag marks witness data
+    segwit = buf[pos] == 0 and buf[pos + 1] != 0
+    if segwit:
+        pos += 2
+    body_start = pos
+    
+    n_in, pos = _read_varint(buf, pos)
+    vin = []
+    for _ in range(n_in):
+        prev_txid = buf[pos:pos + 32]
+        prev_vout = _U32.unpack_from(buf, pos + 32)[0]
+        script_len, script_start = _read_varint(buf, pos + 36)
+        pos = script_start + script_len + 4  # script, sequence
+        if prev_vout == _COINBASE_VOUT and prev_txid == _NULL_HASH:
+            vin.append({'coinbase': buf[script_start:script_start + script_len].hex()})
+        else:
+            vin.append({'txid': prev_txid[::-1].hex(), 'vout': prev_vout})
+    
+    n_out, pos = _read_varint(buf, pos)
+    vout = []
+    for n in range(n_out):
+        value_sat = _I64.unpack_from(buf, pos)[0]
+        script_len, pos = _read_varint(buf, pos + 8)
+        pos += script_len
+        vout.append({'n': n, 'value': value_sat / node_rpc.SATS_PER_BTC})
+    body_end = pos
+    
+    if segwit:
+        for _ in range(n_in):
+            n_items, pos = _read_varint(buf, pos)
+            for _ in range(n_items):
+                item_len, pos = _read_varint(buf, pos)
+                pos += item_len
+    end = pos + 4  # locktime
+    
+    # The txid and the base size exclude marker, flag and witnesses
+    if segwit:
+        txid = _sha256d(buf[start:start + 4], buf[body_start:body_end], buf[pos:end])
+        base_size = 4 + (body_end - body_start) + 4
+    else:
+        txid = _sha256d(buf[start:end])
+        base_size = end - start
+    weight = base_size * 3 + (end - start)
+    
+    tx = {
+        'txid': txid[::-1].hex(),
+        'vsize': (weight + 3) // 4,
+        'weight': weight,
+        'vin': vin,
+        'vout': vout
+    }
+    return tx, end
+
+
+def parse_block(buf: Buffer, pos: int) -> Dict:
+    """
+    Parse one serialized block (pos is the offset of its header).
+    
+    Returns:
+        Block in getblock verbosity=2 form: hash, time and tx (no height,
+        which depends on the chain; see RawBlockStore.block())
+    """
+    header = buf[pos:pos + HEADER_SIZE]
+    n_tx, pos = _read_varint(buf, pos + HEADER_SIZE)
+    
+    txs = []
+    for _ in range(n_tx):
+        tx, pos = parse_transaction(buf, pos)
+        txs.append(tx)
+    
+    return {
+        'hash': _sha256d(header)[::-1].hex(),
+        'time': _U32.unpack_from(header, 68)[0],
+        'tx': txs
+    }
+
+
+class RawBlockStore:
+    """
+    Main-chain view of a node's blk*.dat files.
+    
+    Indexes every block header on construction (one 80-byte read per
+    block), then parses blocks by height on demand.
+    
+    Args:
+        datadir: Bitcoin Core data directory, or its blocks/ subdirectory
+    
+    Raises:
+        FileNotFoundError: If there are no blk*.dat files
+        ValueError: If the files don't reach back to the genesis block
+    
+    Example:
+        >>> store = RawBlockStore(Path('~/.bitcoin'))
+        >>> block = store.block(store.heights_in_range(start_ts, end_ts)[0])
+    """
+    
+    def __init__(self, datadir: Path):
+        blocks_dir = Path(datadir).expanduser()
+        if (blocks_dir / 'blocks').is_dir():
+            blocks_dir = blocks_dir / 'blocks'
+        
+        self.files = sorted(blocks_dir.glob('blk*.dat'))
+        if not self.files:
+            raise FileNotFoundError(f"No blk*.dat files in {blocks_dir}")
+        
+        xor_path = blocks_dir / 'xor.dat'
+        self._xor_key = xor_path.read_bytes() if xor_path.exists() else b''
+        self._buffers = OrderedDict()
+        
+        # Main chain, by height: block hash (hex), (file index, header offset), time
+        self.hashes, self._locations, self.times = self._index_main_chain()
+    
+    @property
+    def tip(self) -> int:
+        """Height of the last main-chain block in the files."""
+        return len(self.hashes) - 1
+    
+    def _buffer(self, file_no: int) -> Buffer:
+        """Contents of a blk file (memory-mapped unless XOR-obfuscated)."""
+        buf = self._buffers.get(file_no)
+        if buf is not None:
+            self._buffers.move_to_end(file_no)
+            return buf
+        
+        path = self.files[file_no]
+        if path.stat().st_size == 0:
+            buf = b''  # mmap can't map an empty file
+        elif any(self._xor_key):
+            data = np.fromfile(path, dtype=np.uint8)
+            data ^= np.resize(np.frombuffer(self._xor_key, dtype=np.uint8), len(data))
+            buf = data.tobytes()
+        else:
+            with open(path, 'rb') as f:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        self._buffers[file_no] = buf
+        if len(self._buffers) > _OPEN_FILES:
+            _, evicted = self._buffers.popitem(last=False)
+            if isinstance(evicted, mmap.mmap):
+                evicted.close()
+        return buf
+    
+    def _index_main_chain(self) -> Tuple[List[str], List[Tuple[int, int]], np.ndarray]:
+        """Read every header, link them into chains and keep the longest one."""
+        # block hash -> (previous hash, file index, header offset, time)
+        headers = {}
+        for file_no in range(len(self.files)):
+            buf = self._buffer(file_no)
+            pos = 0
+            while pos + _RECORD.size + HEADER_SIZE <= len(buf):
+                magic, size = _RECORD.unpack_from(buf, pos)
+                if size == 0 or magic == b'\0\0\0\0':
+                    break  # Pre-allocated, still unwritten tail of the file
+                header = buf[pos + _RECORD.size:pos + _RECORD.size + HEADER_SIZE]
+                headers[_sha256d(header)] = (
+                    header[4:36], file_no, pos + _RECORD.size, _U32.unpack_from(header, 68)[0]
+                )
+                pos += _RECORD.size + size
+        
+        # Heights by walking back to an already-known ancestor
+        heights = {_NULL_HASH: -1}
+        unlinked = set()
+        for block_hash in headers:
+            path = []
+            ancestor = block_hash
+            while ancestor not in heights and ancestor in headers and ancestor not in unlinked:
+                path.append(ancestor)
+                ancestor = headers[ancestor][0]
+            if ancestor not in heights:
+                unlinked.update(path)  # Parent missing from the files
+                continue
+            base = heights[ancestor]
+            for offset, child in enumerate(reversed(path), 1):
+                heights[child] = base + offset
+        del heights[_NULL_HASH]
+        
+        if not heights:
+            raise ValueError(
+                "Block files don't contain the genesis block (pruned node?): "
+                "raw scans need the complete blk*.dat history"
+            )
+        
+        # Stale branches are short, so the longest chain is the active one
+        chain = [max(heights, key=heights.get)]
+        while heights[chain[-1]] > 0:
+            chain.append(headers[chain[-1]][0])
+        chain.reverse()
+        
+        hashes = [block_hash[::-1].hex() for block_hash in chain]
+        locations = [headers[block_hash][1:3] for block_hash in chain]
+        times = np.fromiter((headers[block_hash][3] for block_hash in chain), dtype=np.int64, count=len(chain))
+        return hashes, locations, times
+    
+    def heights_in_range(self, start_ts: int, end_ts: int) -> List[int]:
+        """Heights of main-chain blocks with start_ts <= time < end_ts."""
+        return np.flatnonzero((self.times >= start_ts) & (self.times < end_ts)).tolist()
+    
+    def block(self, height: int) -> Dict:
+        """Main-chain block at height, in getblock verbosity=2 form."""
+        file_no, offset = self._locations[height]
+        block = parse_block(self._buffer(file_no), offset)
+        block['height'] = height
+        return block
+    
+    def close(self) -> None:
+        """Unmap the open block files."""
+        for buf in self._buffers.values():
+            if isinstance(buf, mmap.mmap):
+                buf.close()
+        self._buffers.clear()
+
+
+def index_outputs(store: RawBlockStore, utxo_cache: UTXOValueCache, end_height: int) -> None:
+    """
+    Store the outputs of every main-chain block below end_height in the cache.
+    
+    Resumes from the height recorded by the previous pass, so the full
+    history is parsed once; later calls only add the new blocks.
+    
+    Args:
+        store: Block files
+        utxo_cache: Cache to fill (the same one node_rpc uses)
+        end_height: First height not to index
+    """
+    start_height = utxo_cache.get_meta(INDEXED_HEIGHT_KEY, 0)
+    if start_height >= end_height:
+        return
+    
+    print(f"   Indexing outputs of blocks {start_height}-{end_height - 1} (one-time)...")
+    for batch_start in range(start_height, end_height, INDEX_BATCH_BLOCKS):
+        batch_end = min(batch_start + INDEX_BATCH_BLOCKS, end_height)
+        outputs = {}
+        for height in range(batch_start, batch_end):
+            block = store.block(height)
+            outputs.update(
+                (tx['txid'], (block['time'], node_rpc._output_values(tx))) for tx in block['tx']
+            )
+        utxo_cache.put_many(outputs)
+        utxo_cache.set_meta(INDEXED_HEIGHT_KEY, batch_end)
+        print(f"   ✓ Indexed {batch_end}/{end_height} blocks")
+
+
+def _raw_block_row(store: RawBlockStore, height: int, utxo_cache: UTXOValueCache) -> CachedBlock:
+    """Fees and fee-rate percentiles of one block, inputs valued from the cache."""
+    block = store.block(height)
+    spent, missing = node_rpc._lookup_spent_outputs(block, utxo_cache)
+    if missing:
+        raise LookupError(f"Block {height} spends outputs missing from the output index: {missing[:3]}")
+    return node_rpc._block_row(block, node_rpc._fee_rates(block['tx'][1:], spent))
+
+
+def fetch_blocks_from_datadir(
+    datadir: Path,
+    start_date: str,
+    end_date: str,
+    output_dir: Path,
+    use_block_cache: bool = True,
+    force_refresh: bool = False
+) -> Path:
+    """
+    Offline fetch_blocks_in_date_range(): read the blocks from the node's files.
+    
+    Args:
+        datadir: Bitcoin Core data directory (or its blocks/ subdirectory)
+        start_date: YYYY-MM-DD
+        end_date: YYYY-MM-DD (inclusive)
+        output_dir: Where to save CSV
+        use_block_cache: Reuse and store per-block results (shared with the
+                        RPC path, see node_rpc.fetch_blocks_in_date_range())
+        force_refresh: Recompute every block even if cached
+    
+    Returns:
+        Path to saved CSV (same files and columns as the RPC path)
+    
+    Note: The first run indexes the outputs of every block before the end
+          of the range (see index_outputs()); that takes hours on mainnet,
+          but only once.
+    """
+    start_ts, end_ts = node_rpc._date_range_bounds(start_date, end_date)
+    
+    print(f"📊 Reading blocks {start_date} to {end_date} from block files...")
+    store = RawBlockStore(datadir)
+    heights = store.heights_in_range(start_ts, end_ts)
+    print(f"   Blocks in range: {len(heights)} (tip {store.tip})")
+    
+    utxo_cache = UTXOValueCache()
+    block_cache = BlockCache() if use_block_cache else None
+    daily_sketches = defaultdict(QuantileSketch)
+    
+    if heights:
+        index_outputs(store, utxo_cache, heights[-1] + 1)
+    
+    blocks_data = []
+    n_cached = 0
+    for offset in range(0, len(heights), node_rpc.BLOCK_CACHE_WINDOW):
+        window_heights = heights[offset:offset + node_rpc.BLOCK_CACHE_WINDOW]
+        window_hashes = [store.hashes[h] for h in window_heights]
+        cached = node_rpc._cached_blocks(block_cache, window_heights, window_hashes, force_refresh)
+        n_cached += len(cached)
+        
+        fetched = [_raw_block_row(store, h, utxo_cache) for h in window_heights if h not in cached]
+        node_rpc._collect_window(window_heights, cached, fetched, block_cache, blocks_data, daily_sketches)
+        print(f"   ✓ {len(blocks_data)}/{len(heights)} blocks ({n_cached} from cache)")
+    
+    store.close()
+    utxo_cache.close()
+    if block_cache is not None:
+        block_cache.close()
+    
+    node_rpc._save_daily_fee_rates_csv(daily_sketches, start_date, end_date, output_dir)
+    return node_rpc._save_blocks_csv(blocks_data, start_date, end_date, output_dir)
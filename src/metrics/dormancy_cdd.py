@@ -25,14 +25,14 @@ During economic crises, we expect:
 Interpretation:
     - Rising BDD = Dormant wealth being mobilized
     - Stable/low BDD = HODLing behavior continues
-    
+
 Data Sources:
 -------------
 1. Blockchain.com API:
    - Provides daily BDD series (easiest option)
    - Historical data available
-   
-2. Bitcoin Core RPC (advanced):
+
+2. Bitcoin Core RPC (advanced, compute_cdd_from_node_rpc):
    - Requires txindex=1
    - For each transaction input:
      a. Look up previous transaction
@@ -49,12 +49,15 @@ Limitations:
 
 from pathlib import Path
 from typing import Optional
+import numpy as np
 import pandas as pd
 
-import sys
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from src.utils.io import save_csv, load_csv
-from src.utils.math_stats import rolling_mean
+from ..utils.io import save_csv, load_csv
+from ..utils.math_stats import rolling_zscore
+from ..data_sources import node_rpc
+
+
+SECONDS_PER_DAY = 86400
 
 
 def compute_cdd_from_blockchain_com(
@@ -74,7 +77,7 @@ def compute_cdd_from_blockchain_com(
     
     Processing:
         1. Load BDD data
-        2. Compute 30-day moving average (smooth noise)
+        2. Compute 30-day moving average and std (one vectorized pass)
         3. Flag large spikes (potential old coin movements)
         4. Save enriched CSV
     
@@ -82,81 +85,103 @@ def compute_cdd_from_blockchain_com(
         - date
         - bdd (raw)
         - bdd_30d_ma (smoothed)
+        - bdd_30d_std (30-day rolling standard deviation)
         - bdd_pct_of_ma (spike detector: bdd / bdd_30d_ma)
+        - bdd_z (spike detector: (bdd - bdd_30d_ma) / bdd_30d_std)
     """
     print(f"\n📊 Processing Bitcoin Days Destroyed (BDD)...")
     print(f"   Input: {bdd_csv}")
     
-    # Load data
-    df = load_csv(bdd_csv)
+    # Load data (only the columns used; node_rpc and API CSVs share them)
+    df = load_csv(bdd_csv, columns=['date', 'bdd'])
     
-    # Compute 30-day moving average for smoothing
-    df['bdd_30d_ma'] = rolling_mean(df['bdd'], window=30)
+    # 30-day moving average (smoothing) and std, computed together
+    df['bdd_30d_ma'], df['bdd_30d_std'], bdd_z = rolling_zscore(df['bdd'], window=30)
     
-    # Spike detector: how much above/below the MA?
+    # Spike detectors: how much above/below the MA, relative and in stds
     df['bdd_pct_of_ma'] = (df['bdd'] / df['bdd_30d_ma']) * 100
+    df['bdd_z'] = bdd_z
     
     # Save
     output_path = output_dir / "dormancy_bdd_daily.csv"
     save_csv(df, output_path)
     
     print(f"   ✓ Processed {len(df)} days of BDD data")
-    print(f"   ✓ Added 30-day MA and spike indicators")
+    print(f"   ✓ Added 30-day MA, std and spike indicators")
     
     return output_path
 
 
+def accumulate_cdd(
+    day_idx: np.ndarray,
+    amount_sat: np.ndarray,
+    age_seconds: np.ndarray,
+    n_days: int
+) -> np.ndarray:
+    """
+    Sum coin days destroyed per day over flat per-input arrays.
+    
+    One vectorized pass (a weighted bincount) instead of a Python loop over
+    blocks, transactions and inputs.
+    
+    Args:
+        day_idx: Day index (0..n_days-1) of the spending block, per input
+        amount_sat: Spent output value in satoshis, per input
+        age_seconds: Spending block time - funding block time, per input
+        n_days: Number of days in the output
+    
+    Returns:
+        float64 array of BTC-days destroyed per day (length n_days)
+    
+    Example:
+        >>> accumulate_cdd(np.array([0, 0, 1]), np.array([100_000_000] * 3),
+        ...                np.array([86400, 172800, 86400]), 2)
+        array([3., 1.])
+    """
+    # Block times aren't strictly monotone: clamp the rare negative age to 0
+    age_days = np.maximum(age_seconds, 0) / SECONDS_PER_DAY
+    cdd = (amount_sat / node_rpc.SATS_PER_BTC) * age_days
+    return np.bincount(day_idx, weights=cdd, minlength=n_days)
+
+
 def compute_cdd_from_node_rpc(
     start_date: str,
     end_date: str,
     output_dir: Path,
-    rpc_connection = None
+    rpc_connection: Optional['node_rpc.NodeRPC'] = None,
+    use_utxo_cache: bool = True
 ) -> Optional[Path]:
     """
     Compute CDD directly from blockchain using Bitcoin Core RPC.
     
     Args:
         start_date: YYYY-MM-DD
-        end_date: YYYY-MM-DD
+        end_date: YYYY-MM-DD (inclusive)
         output_dir: Where to save result
         rpc_connection: Active RPC connection (from node_rpc.connect_to_node)
+        use_utxo_cache: Reuse funding-transaction lookups across blocks and
+                       runs (see src/data_sources/_utxo_cache.py)
     
     Returns:
-        Path to saved CSV, or None if not implemented
-    
-    Algorithm (Pseudocode):
-    -----------------------
-    cdd_daily = {}
+        Path to saved CSV (columns: date, bdd), or None without a connection
     
-    for each block in date range:
-        cdd_block = 0
-        
-        for each transaction in block (exclude coinbase):
-            for each input in transaction:
-                # Look up the previous transaction (this input is spending)
-                prev_tx = get_transaction(input.prev_txid)
-                prev_output = prev_tx.outputs[input.prev_vout]
-                
-                # Calculate age
-                age_seconds = block.time - prev_tx.time
-                age_days = age_seconds / 86400
-                
-                # Calculate coin days destroyed
-                amount_btc = prev_output.value
-                cdd_block += amount_btc * age_days
-        
-        date = block.date
-        cdd_daily[date] = cdd_block
+    Algorithm:
+    ----------
+    For each batch of blocks in the date range:
+        1. Resolve every input's funding transaction (block, cache, then
+           one batched getrawtransaction call per block)
+        2. Flatten the inputs into arrays: spending day, amount (sats),
+           age = block.time - funding_tx.time
+        3. accumulate_cdd(): CDD per day += amount_btc × age_days
     
-    save to CSV
+    The output has the same [date, bdd] columns as the Blockchain.com BDD
+    CSV, so compute_cdd_from_blockchain_com() can process either.
     
     ⚠️ WARNING: This is computationally intensive!
        - Requires txindex=1
        - Processing millions of transactions
-       - Can take hours for long date ranges
-       - Consider caching intermediate results
-    
-    TODO: Implement if you need more precision than Blockchain.com
+       - Can take hours for long date ranges (re-runs are faster with
+         the UTXO cache)
     """
     print(f"\n📊 Computing CDD from node RPC...")
     print(f"   Date range: {start_date} to {end_date}")
@@ -166,19 +191,50 @@ def compute_cdd_from_node_rpc(
         print("   💡 Use blockchain_com API for easier data access")
         return None
     
-    # TODO: Implement full algorithm (see pseudocode above)
-    # 
-    # This is advanced! You'll need to:
-    # 1. Query each block in range
-    # 2. For each transaction, look up input sources
-    # 3. Calculate time difference (age)
-    # 4. Accumulate CDD per day
-    # 5. Save to CSV
-    #
-    # Alternatively: Use Blockchain.com BDD API (much faster!)
-    
-    print("   ⚠️  Not implemented - use blockchain_com.py instead!\n")
-    return None
+    rpc = rpc_connection
+    first_day = pd.Timestamp(start_date)
+    n_days = (pd.Timestamp(end_date) - first_day).days + 1
+    start_ts = int(first_day.timestamp())
+    end_ts = start_ts + n_days * SECONDS_PER_DAY
+    
+    _, block_hashes = node_rpc.find_heights_in_range(rpc, start_ts, end_ts)
+    print(f"   Blocks in range: {len(block_hashes)}")
+    
+    utxo_cache = node_rpc.UTXOValueCache() if use_utxo_cache else None
+    cdd = np.zeros(n_days)
+    
+    for offset in range(0, len(block_hashes), node_rpc.BLOCK_BATCH_SIZE):
+        # verbosity=2: CDD needs each funding transaction's block time, which
+        # verbosity=3 prevouts don't carry (the UTXO cache does)
+        blocks = rpc.batch(
+            (('getblock', (block_hash, 2)) for block_hash in block_hashes[offset:offset + node_rpc.BLOCK_BATCH_SIZE]),
+            batch_size=node_rpc.BLOCK_BATCH_SIZE
+        )
+        
+        # Flat per-input arrays for the whole batch, then one accumulation
+        day_idx, amounts, ages = [], [], []
+        for block in blocks:
+            spent = node_rpc.resolve_spent_outputs(rpc, block, utxo_cache)
+            amount_sat, created_time = node_rpc.spent_output_arrays(block, spent)
+            amounts.append(amount_sat)
+            ages.append(block['time'] - created_time)
+            day_idx.append(np.full(len(amount_sat), (block['time'] - start_ts) // SECONDS_PER_DAY))
+        
+        cdd += accumulate_cdd(np.concatenate(day_idx), np.concatenate(amounts), np.concatenate(ages), n_days)
+    
+    if utxo_cache is not None:
+        utxo_cache.close()
+    
+    df = pd.DataFrame({
+        'date': pd.date_range(first_day, periods=n_days, freq='D'),
+        'bdd': cdd
+    })
+    
+    output_path = Path(output_dir) / f"node_rpc_bdd_{start_date}_to_{end_date}.csv"
+    save_csv(df, output_path)
+    
+    print(f"   ✓ Computed CDD for {n_days} days")
+    return output_path
 
 
 def analyze_bdd_spikes(
@@ -296,6 +352,8 @@ For your thesis:
   if data available
 """
 
+# Example usage (run as a module from the project root:
+#   python -m src.metrics.dormancy_cdd)
 if __name__ == "__main__":
     print("Dormancy & CDD Metrics Module")
     print("\n📝 Recommended workflow:")
@@ -19,13 +19,20 @@ force without requiring monetary expansion.
 Post-halving, this effect becomes even more critical as subsidies decline.
 """
 
+import functools
 from pathlib import Path
 from typing import Dict, Optional
+import numpy as np
 import pandas as pd
 
-import sys
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from src.utils.io import save_csv, load_csv
+from ..utils.io import save_csv, load_csv
+
+
+# UTC dates of the halving blocks (210,000, 420,000, 630,000, 840,000)
+HALVING_DATES = np.array(
+    ['2012-11-28', '2016-07-09', '2020-05-11', '2024-04-20'],
+    dtype='datetime64[D]'
+)
 
 
 def block_subsidy(height: int) -> float:
@@ -33,7 +40,8 @@ def block_subsidy(height: int) -> float:
     Calculate block subsidy (coinbase reward) at a given block height.
     
     Args:
-        height: Block height (integer)
+        height: Block height (integer; floats are truncated, NaN gives NaN
+                and negative heights get the genesis subsidy)
     
     Returns:
         Subsidy in BTC (float)
@@ -61,11 +69,46 @@ def block_subsidy(height: int) -> float:
         - Block 630,000 (May 2020): 12.5 → 6.25 BTC
         - Block 840,000 (Apr 2024): 6.25 → 3.125 BTC
     """
-    initial_subsidy = 50.0
-    halvings = height // 210000
-    return initial_subsidy / (2 ** halvings)
+    if height != height:  # NaN
+        return float('nan')
+    return _block_subsidy(int(height))
+
+
+@functools.lru_cache(maxsize=64)
+def _block_subsidy(height: int) -> float:
+    """block_subsidy() for an int height (cached per height)."""
+    # Same integer shift as block_subsidy_vec(), without the array round-trip
+    return (5_000_000_000 >> min(max(height // 210_000, 0), 63)) / 1e8
+
+
+def block_subsidy_vec(heights) -> np.ndarray:
+    """
+    block_subsidy() for a whole column of heights at once.
+    
+    The subsidy is an integer right shift in satoshis (as in Bitcoin Core),
+    converted to BTC, so there is no Python call per row.
+    
+    Args:
+        heights: Array-like of block heights (NaN stays NaN, negative
+                 heights get the genesis subsidy)
+    
+    Returns:
+        float64 array of subsidies in BTC
+    
+    Example:
+        >>> block_subsidy_vec(np.array([0, 210000, 840000]))
+        array([50.   , 25.   ,  3.125])
+    """
+    heights = np.asarray(heights, dtype=np.float64)
+    valid = ~np.isnan(heights)
+    
+    # 50 BTC < 2^33 sats, so capping the shift at 63 still ends at 0
+    halvings = np.clip(np.where(valid, heights, 0).astype(np.int64) // 210_000, 0, 63)
+    subsidy_sat = np.right_shift(np.int64(5_000_000_000), halvings)
+    return np.where(valid, subsidy_sat / 1e8, np.nan)
 
 
+@functools.lru_cache(maxsize=64)
 def height_to_date_approx(height: int) -> str:
     """
     Approximate date for a given block height.
@@ -163,12 +206,12 @@ def compute_fees_per_block(
     print(f"   Fees CSV: {fees_per_day_csv}")
     print(f"   Blocks CSV: {blocks_per_day_csv}")
     
-    # Load CSVs
-    fees_df = load_csv(fees_per_day_csv)
-    blocks_df = load_csv(blocks_per_day_csv)
+    # Load CSVs, indexed by date
+    fees_df = load_csv(fees_per_day_csv).set_index('date')
+    blocks_df = load_csv(blocks_per_day_csv).set_index('date')
     
-    # Merge on date
-    df = fees_df.merge(blocks_df, on='date', how='inner')
+    # Align on the (sorted, daily) DatetimeIndex instead of hashing a date column
+    df = fees_df.join(blocks_df, how='inner').reset_index()
     
     # Compute fees per block
     df['fees_per_block_btc'] = df['fees_btc_day'] / df['blocks_per_day']
@@ -202,6 +245,7 @@ def compute_fee_to_subsidy_ratio(
     Output CSV columns:
         - date
         - fees_per_block_btc
+        - approx_height (only when approximating from date: ~144 blocks/day)
         - subsidy_btc (computed from height or date)
         - fee_to_subsidy (ratio)
     """
@@ -213,18 +257,21 @@ def compute_fee_to_subsidy_ratio(
     
     if height_column and height_column in df.columns:
         # Use exact heights
-        df['subsidy_btc'] = df[height_column].apply(block_subsidy)
+        df['subsidy_btc'] = block_subsidy_vec(df[height_column])
     else:
         # Approximate from date
         print("   ⚠️  No height column found - using approximate subsidy")
-        df['approx_height'] = ((df['date'] - pd.Timestamp('2009-01-03')).dt.days * 144).astype(int)
-        df['subsidy_btc'] = df['approx_height'].apply(block_subsidy)
-    
-    # Compute ratio
-    df['fee_to_subsidy'] = df.apply(
-        lambda row: compute_fee_to_subsidy(row['fees_per_block_btc'], row['subsidy_btc']),
-        axis=1
-    )
+        days_since_genesis = (df['date'].to_numpy() - np.datetime64('2009-01-03')) / np.timedelta64(1, 'D')
+        approx_height = np.floor(days_since_genesis) * 144
+        # Nullable ints: whole heights in the CSV, blank where the date is missing
+        df['approx_height'] = pd.array(approx_height, dtype='Int64')
+        df['subsidy_btc'] = block_subsidy_vec(approx_height)
+    
+    # Compute ratio (compute_fee_to_subsidy() over whole columns, zero reward -> 0)
+    fees = df['fees_per_block_btc'].to_numpy(dtype=np.float64)
+    total_reward = fees + df['subsidy_btc'].to_numpy(dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        df['fee_to_subsidy'] = np.where(total_reward == 0, 0.0, fees / total_reward)
     
     # Save
     output_path = output_dir / "fee_to_subsidy_daily.csv"
@@ -242,7 +289,8 @@ def add_halving_indicators(df: pd.DataFrame) -> pd.DataFrame:
         df: DataFrame with 'date' or 'height' column
     
     Returns:
-        DataFrame with added 'halving_era' column
+        DataFrame with added 'halving_era' column (rows with a missing
+        height or date get NaN)
     
     Halving Eras:
         0: 50 BTC (2009-2012)
@@ -255,22 +303,28 @@ def add_halving_indicators(df: pd.DataFrame) -> pd.DataFrame:
         - Control for halving effects in analysis
         - Visualize era boundaries on charts
     
-    TODO: Implement if needed for analysis
+    Notes:
+        - From heights the era is exact (height // 210,000)
+        - From dates it is looked up in HALVING_DATES with one binary
+          search over the column, so a halving day counts in the new era
+    
+    Raises:
+        ValueError: If df has neither a 'height' nor a 'date' column
     """
-    # TODO: Add implementation
-    # 
-    # if 'height' in df.columns:
-    #     df['halving_era'] = df['height'] // 210000
-    # elif 'date' in df.columns:
-    #     # Use approximate height from date
-    #     df['approx_height'] = ((df['date'] - pd.Timestamp('2009-01-03')).dt.days * 144).astype(int)
-    #     df['halving_era'] = df['approx_height'] // 210000
-    # 
-    # return df
-    
-    pass
+    if 'height' in df.columns:
+        df['halving_era'] = df['height'] // 210_000
+    elif 'date' in df.columns:
+        days = df['date'].to_numpy().astype('datetime64[D]')
+        eras = pd.Series(np.searchsorted(HALVING_DATES, days, side='right'), index=df.index)
+        df['halving_era'] = eras.where(df['date'].notna())
+    else:
+        raise ValueError("df must have a 'height' or 'date' column")
+    
+    return df
 
 
+# Example usage (run as a module from the project root:
+#   python -m src.metrics.fees_and_fee_to_subsidy)
 if __name__ == "__main__":
     print("Fees & Fee-to-Subsidy Module")
     print("\n📝 Implementation steps:")
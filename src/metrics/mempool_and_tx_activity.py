@@ -37,10 +37,8 @@ from pathlib import Path
 from typing import Optional
 import pandas as pd
 
-import sys
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from src.utils.io import save_csv, load_csv
-from src.utils.math_stats import rolling_mean
+from ..utils.io import save_csv, load_csv
+from ..utils.math_stats import rolling_mean
 
 
 def process_transactions_per_day(
@@ -293,6 +291,8 @@ def estimate_mempool_pressure_from_fee_variance(
     return None
 
 
+# Example usage (run as a module from the project root:
+#   python -m src.metrics.mempool_and_tx_activity)
 if __name__ == "__main__":
     print("Mempool & Transaction Activity Module")
     print("\n📝 Recommended workflow:")
@@ -10,11 +10,15 @@ No assumptions about blocks per day - just clean daily aggregates.
 """
 
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
-import sys
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from src.utils.io import save_csv, load_csv
+from ..utils.io import save_csv, load_csv
+from .fees_and_fee_to_subsidy import HALVING_DATES
+
+
+# Subsidy per halving era: _SUBSIDIES[i] applies from HALVING_DATES[i - 1] on
+_SUBSIDIES = 50.0 / 2.0 ** np.arange(len(HALVING_DATES) + 1)
 
 
 def get_subsidy_on_date(date_str: str) -> float:
@@ -31,21 +35,32 @@ def get_subsidy_on_date(date_str: str) -> float:
         2009-01-03 to 2012-11-27: 50 BTC
         2012-11-28 to 2016-07-08: 25 BTC
         2016-07-09 to 2020-05-10: 12.5 BTC
-        2020-05-11 to 2024-04-18: 6.25 BTC
-        2024-04-19 onwards: 3.125 BTC
+        2020-05-11 to 2024-04-19: 6.25 BTC
+        2024-04-20 onwards: 3.125 BTC
+        (UTC dates of the halving blocks, see HALVING_DATES)
     """
-    date = pd.Timestamp(date_str)
-    
-    if date < pd.Timestamp('2012-11-28'):
-        return 50.0
-    elif date < pd.Timestamp('2016-07-09'):
-        return 25.0
-    elif date < pd.Timestamp('2020-05-11'):
-        return 12.5
-    elif date < pd.Timestamp('2024-04-19'):
-        return 6.25
-    else:
-        return 3.125
+    return float(get_subsidy_vectorized([date_str])[0])
+
+
+def get_subsidy_vectorized(dates) -> np.ndarray:
+    """
+    get_subsidy_on_date() for a whole column of dates at once.
+    
+    One binary search of all dates in the halving table, instead of a
+    Timestamp and an if/elif chain per row.
+    
+    Args:
+        dates: Series or array-like of dates (datetimes or YYYY-MM-DD strings)
+    
+    Returns:
+        float64 array of block subsidies in BTC
+    
+    Example:
+        >>> get_subsidy_vectorized(pd.Series(pd.to_datetime(['2012-11-27', '2012-11-28'])))
+        array([50., 25.])
+    """
+    dates = np.asarray(pd.to_datetime(dates), dtype='datetime64[ns]')
+    return _SUBSIDIES[np.searchsorted(HALVING_DATES.astype(dates.dtype), dates, side='right')]
 
 
 def compute_fee_metrics(
@@ -88,7 +103,7 @@ def compute_fee_metrics(
     df['avg_fee_per_tx'] = df['fees_btc_day'] / df['tx_per_day']
     
     # Get subsidy for each date
-    df['subsidy_btc'] = df['date'].apply(get_subsidy_on_date)
+    df['subsidy_btc'] = get_subsidy_vectorized(df['date'])
     
     # Estimate daily subsidy issuance (~144 blocks/day)
     # This is ONLY for the ratio calculation, not per-block normalization
@@ -126,6 +141,8 @@ def compute_fee_metrics(
     return output_path
 
 
+# Example usage (run as a module from the project root:
+#   python -m src.metrics.simple_fee_metrics)
 if __name__ == "__main__":
     from pathlib import Path
     
@@ -16,15 +16,80 @@ Output:
 These CSVs contain all metrics aligned for statistical analysis.
 """
 
+import functools
+import json
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 import pandas as pd
 
-import sys
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from src.config import load_config, get_data_paths
-from src.utils.date_windows import build_event_window, slice_dataframe_by_window, add_period_labels
-from src.utils.io import save_csv, load_csv
+# pyarrow (optional dependency, used for the merged Parquet snapshot)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+from ..config import load_config, get_data_paths
+from ..utils.date_windows import build_event_window, slice_dataframe_by_window, add_period_labels
+from ..utils.io import save_csv, load_csv
+
+
+# Metric CSVs merged into the event datasets:
+# metric key -> (filename in data/processed/, label for progress output)
+METRIC_FILES = {
+    'fee_rate_urgency': ('fee_rate_urgency_estimated.csv', 'fee rate metrics'),
+    'fee_to_subsidy': ('fee_to_subsidy_daily.csv', 'fee-to-subsidy'),
+    'dormancy': ('dormancy_bdd_daily.csv', 'BDD metrics'),
+    'tx_activity': ('tx_activity_daily.csv', 'transaction activity'),
+}
+
+# Snapshot of the merged metrics, written next to the CSVs it was built from
+MERGED_SNAPSHOT = "_merged.parquet"
+
+# Parquet schema metadata key holding the signature the snapshot was built from
+SNAPSHOT_SIGNATURE_KEY = b"metrics_signature"
+
+
+def _metrics_signature(processed_dir: Path) -> Tuple[Tuple[str, int], ...]:
+    """
+    Identify the current state of the metric CSVs in processed_dir.
+    
+    Args:
+        processed_dir: Path to data/processed/
+    
+    Returns:
+        Tuple of (filename, mtime_ns) for every metric CSV that exists.
+        Changes whenever a CSV is added, removed, or rewritten.
+    """
+    signature = []
+    for filename, _ in METRIC_FILES.values():
+        csv_path = processed_dir / filename
+        if csv_path.exists():
+            signature.append((filename, csv_path.stat().st_mtime_ns))
+    return tuple(signature)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_all_metrics_cached(
+    processed_dir: str,
+    signature: Tuple[Tuple[str, int], ...]
+) -> Dict[str, pd.DataFrame]:
+    """Read the metric CSVs (memoized on directory + file signature)."""
+    print("\n📂 Loading all computed metrics...")
+    
+    processed_dir = Path(processed_dir)
+    loaded = {filename for filename, _ in signature}
+    metrics = {}
+    
+    for name, (filename, label) in METRIC_FILES.items():
+        if filename in loaded:
+            metrics[name] = load_csv(processed_dir / filename, float_dtype='float32')
+            print(f"   ✓ Loaded {label}: {len(metrics[name])} rows")
+    
+    print(f"   ✓ Loaded {len(metrics)} metric datasets\n")
+    
+    return metrics
 
 
 def load_all_metrics(processed_dir: Path) -> Dict[str, pd.DataFrame]:
@@ -47,38 +112,18 @@ def load_all_metrics(processed_dir: Path) -> Dict[str, pd.DataFrame]:
         >>> metrics = load_all_metrics(Path('data/processed'))
         >>> print(metrics.keys())
         dict_keys(['fee_rate_urgency', 'fee_to_subsidy', 'dormancy', 'tx_activity'])
-    """
-    print("\n📂 Loading all computed metrics...")
-    
-    metrics = {}
     
-    # Fee rate & urgency
-    csv_path = processed_dir / "fee_rate_urgency_estimated.csv"
-    if csv_path.exists():
-        metrics['fee_rate_urgency'] = load_csv(csv_path)
-        print(f"   ✓ Loaded fee rate metrics: {len(metrics['fee_rate_urgency'])} rows")
-    
-    # Fee-to-subsidy
-    csv_path = processed_dir / "fee_to_subsidy_daily.csv"
-    if csv_path.exists():
-        metrics['fee_to_subsidy'] = load_csv(csv_path)
-        print(f"   ✓ Loaded fee-to-subsidy: {len(metrics['fee_to_subsidy'])} rows")
-    
-    # Dormancy (BDD)
-    csv_path = processed_dir / "dormancy_bdd_daily.csv"
-    if csv_path.exists():
-        metrics['dormancy'] = load_csv(csv_path)
-        print(f"   ✓ Loaded BDD metrics: {len(metrics['dormancy'])} rows")
-    
-    # Transaction activity
-    csv_path = processed_dir / "tx_activity_daily.csv"
-    if csv_path.exists():
-        metrics['tx_activity'] = load_csv(csv_path)
-        print(f"   ✓ Loaded transaction activity: {len(metrics['tx_activity'])} rows")
-    
-    print(f"   ✓ Loaded {len(metrics)} metric datasets\n")
-    
-    return metrics
+    Note:
+        Metric columns are loaded as float32 (half the memory of float64,
+        ample precision for plotted fee/BDD values).
+        Results are memoized on the directory and the CSV modification
+        times, so repeated calls only re-read the files after they change.
+        The returned DataFrames are shared between calls - don't modify
+        them in place.
+    """
+    processed_dir = Path(processed_dir)
+    signature = _metrics_signature(processed_dir)
+    return dict(_load_all_metrics_cached(str(processed_dir.resolve()), signature))
 
 
 def merge_metrics_on_date(metrics_dict: Dict[str, pd.DataFrame]) -> pd.DataFrame:
@@ -116,13 +161,96 @@ def merge_metrics_on_date(metrics_dict: Dict[str, pd.DataFrame]) -> pd.DataFrame
     merged = merged.sort_values('date').reset_index(drop=True)
     
     # Forward fill missing values
-    merged = merged.fillna(method='ffill')
+    merged = merged.ffill()
+    
+    # Downcast numbers: float32 is plenty for fees/BDD on log-scale plots,
+    # and halves memory for everything downstream (and the Parquet snapshot)
+    for col in merged.select_dtypes('float64').columns:
+        merged[col] = merged[col].astype('float32')
+    for col in merged.select_dtypes('int64').columns:
+        merged[col] = pd.to_numeric(merged[col], downcast='integer')
     
     print(f"   ✓ Merged metrics: {len(merged)} days, {len(merged.columns)} columns")
     
     return merged
 
 
+@functools.lru_cache(maxsize=4)
+def _load_merged_metrics_cached(
+    processed_dir: str,
+    signature: Tuple[Tuple[str, int], ...]
+) -> pd.DataFrame:
+    """Load and merge the metric CSVs (memoized on directory + file signature)."""
+    snapshot_path = Path(processed_dir) / MERGED_SNAPSHOT
+    
+    if not signature:
+        # No metric CSVs left - a snapshot would only resurrect deleted data
+        snapshot_path.unlink(missing_ok=True)
+        return merge_metrics_on_date({})
+    
+    # Reuse the Parquet snapshot only if it was built from exactly these CSVs
+    signature_json = json.dumps(signature).encode('utf-8')
+    if HAS_PYARROW and _snapshot_signature(snapshot_path) == signature_json:
+        merged = pq.read_table(snapshot_path).to_pandas()
+        print(f"   ✓ Loaded merged metrics snapshot: {len(merged)} days ({snapshot_path.name})")
+        return merged
+    
+    metrics = _load_all_metrics_cached(processed_dir, signature)
+    merged = merge_metrics_on_date(metrics)
+    
+    if HAS_PYARROW and not merged.empty:
+        table = pa.Table.from_pandas(merged, preserve_index=False)
+        table = table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), SNAPSHOT_SIGNATURE_KEY: signature_json}
+        )
+        pq.write_table(table, snapshot_path, compression='zstd')
+        print(f"   ✓ Saved merged metrics snapshot: {snapshot_path.name}")
+    else:
+        snapshot_path.unlink(missing_ok=True)
+    
+    return merged
+
+
+def _snapshot_signature(snapshot_path: Path) -> Optional[bytes]:
+    """Signature stored in a merged snapshot's schema metadata (None if missing/unreadable)."""
+    try:
+        metadata = pq.read_schema(snapshot_path).metadata or {}
+    except (OSError, pa.ArrowInvalid):
+        return None
+    return metadata.get(SNAPSHOT_SIGNATURE_KEY)
+
+
+def load_merged_metrics(processed_dir: Path) -> pd.DataFrame:
+    """
+    Load all metric CSVs and merge them on date in one memoized step.
+    
+    Equivalent to merge_metrics_on_date(load_all_metrics(processed_dir)),
+    but the merged result is cached too, so figure scripts looping over
+    events and window configurations only pay for loading/merging once.
+    
+    When pyarrow is installed, the merged result is also written to
+    data/processed/_merged.parquet, together with the (filename, mtime_ns)
+    signature of the CSVs it was built from. Later runs read that snapshot
+    instead of the CSVs only while the signature matches exactly, so added,
+    removed or rewritten CSVs (whatever their mtime) always trigger a rebuild.
+    
+    Args:
+        processed_dir: Path to data/processed/
+    
+    Returns:
+        Merged DataFrame (empty if no metric CSVs exist).
+        Shared between calls - don't modify it in place.
+    
+    Example:
+        >>> merged = load_merged_metrics(Path('data/processed'))
+        >>> print(len(merged))
+        4300
+    """
+    processed_dir = Path(processed_dir)
+    signature = _metrics_signature(processed_dir)
+    return _load_merged_metrics_cached(str(processed_dir.resolve()), signature)
+
+
 def build_event_dataset(
     event_name: str,
     anchor_date: str,
@@ -167,8 +295,8 @@ def build_event_dataset(
     # window = build_event_window(anchor_date, days_before, days_after)
     # 
     # # Slice to window
-    # pre_start, pre_end = window['pre']
-    # crisis_start, crisis_end = window['crisis']
+    # pre_start, pre_end = window.pre
+    # crisis_start, crisis_end = window.crisis
     # 
     # # Get pre-crisis data
     # pre_df = slice_dataframe_by_window(merged_metrics, pre_start, pre_end)
@@ -291,7 +419,8 @@ def build_all_event_datasets(
     return event_paths
 
 
-# CLI interface
+# CLI interface (run as a module from the project root:
+#   python -m src.pipelines.build_event_dataset)
 if __name__ == "__main__":
     print("Event Dataset Builder Pipeline")
     print("\n📝 This pipeline:")
@@ -21,11 +21,9 @@ from pathlib import Path
 from typing import Dict, List
 import pandas as pd
 
-import sys
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from src.config import load_config, get_data_paths
-from src.utils.io import save_csv, load_csv
-from src.utils.math_stats import percent_change, pp_change, compare_periods
+from ..config import load_config, get_data_paths
+from ..utils.io import save_csv, load_csv
+from ..utils.math_stats import percent_change, pp_change, compare_periods
 
 
 def compute_event_summary_stats(
@@ -270,7 +268,8 @@ def export_latex_table(summary_df: pd.DataFrame, output_path: Path) -> Path:
     return None
 
 
-# CLI interface
+# CLI interface (run as a module from the project root:
+#   python -m src.pipelines.compute_summary_tables)
 if __name__ == "__main__":
     print("Summary Statistics Pipeline")
     print("\n📝 This pipeline:")
@@ -11,18 +11,17 @@ All plots use consistent styling from styles.py.
 """
 
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Union
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 
-import sys
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from src.plotting.styles import (
+from .styles import (
     apply_plot_style, format_date_axis, add_event_window_shading,
     add_halving_markers, save_figure, PRE_COLOR, CRISIS_COLOR
 )
-from src.utils.date_windows import build_event_window
+from ..utils.date_windows import build_event_window, EventWindow
 
 
 def plot_single_metric(
@@ -30,7 +29,7 @@ def plot_single_metric(
     metric_column: str,
     event_name: str,
     anchor_date: str,
-    window_dict: dict,
+    window_dict: EventWindow,
     output_dir: Path,
     title: str = None,
     ylabel: str = None,
@@ -44,7 +43,7 @@ def plot_single_metric(
         metric_column: Name of metric to plot
         event_name: Event identifier (e.g., 'cyprus_2013')
         anchor_date: Crisis anchor date (YYYY-MM-DD)
-        window_dict: Dict from build_event_window() with 'pre' and 'crisis' keys
+        window_dict: EventWindow from build_event_window()
         output_dir: Where to save figure
         title: Chart title (if None, auto-generates)
         ylabel: Y-axis label (if None, uses metric_column)
@@ -71,8 +70,8 @@ def plot_single_metric(
     add_event_window_shading(
         ax,
         anchor_date,
-        window_dict['pre'][0],
-        window_dict['crisis'][1],
+        window_dict.start,
+        window_dict.end,
         label=event_name.replace('_', ' ').title()
     )
     
@@ -114,7 +113,7 @@ def plot_multi_panel_event(
     metrics_dict: dict,
     event_name: str,
     anchor_date: str,
-    window_dict: dict,
+    window_dict: EventWindow,
     output_dir: Path,
     include_halvings: bool = False
 ) -> Path:
@@ -162,8 +161,8 @@ def plot_multi_panel_event(
         add_event_window_shading(
             ax,
             anchor_date,
-            window_dict['pre'][0],
-            window_dict['crisis'][1]
+            window_dict.start,
+            window_dict.end
         )
         
         # Labels
@@ -279,11 +278,12 @@ def plot_pre_vs_crisis_comparison(
 def plot_individual_crisis(
     df: pd.DataFrame,
     event_name: str,
-    anchor_date: str,
+    anchor_date: Union[str, np.datetime64],
     days_before: int,
     days_after: int,
     output_dir: Path,
-    title: str = None
+    title: str = None,
+    presliced: bool = False
 ) -> Path:
     """
     Create individual crisis figure showing all data points clearly visible.
@@ -291,11 +291,14 @@ def plot_individual_crisis(
     Args:
         df: DataFrame with all metrics and date column
         event_name: Event identifier (e.g., 'cyprus_2013')
-        anchor_date: Crisis anchor date (YYYY-MM-DD)
+        anchor_date: Crisis anchor date (YYYY-MM-DD string or np.datetime64)
         days_before: Days before crisis to show
         days_after: Days after crisis to show
         output_dir: Where to save figure
         title: Chart title (if None, auto-generates)
+        presliced: If True, df is already restricted to the event window
+                  (e.g., sliced with searchsorted by the caller) and the
+                  date filter is skipped
     
     Returns:
         Path to saved figure
@@ -307,7 +310,10 @@ def plot_individual_crisis(
     start_date = anchor - pd.Timedelta(days=days_before)
     end_date = anchor + pd.Timedelta(days=days_after)
     
-    event_data = df[(df['date'] >= start_date) & (df['date'] <= end_date)].copy()
+    if presliced:
+        event_data = df
+    else:
+        event_data = df[(df['date'] >= start_date) & (df['date'] <= end_date)].copy()
     
     if len(event_data) == 0:
         print(f"⚠️  No data found for {event_name} in window {start_date} to {end_date}")
@@ -321,8 +327,10 @@ def plot_individual_crisis(
         'Bitcoin Days Destroyed': 'bdd'
     }
     
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-    axes = axes.flatten()
+    # Reuse one figure across calls (cleared each time) instead of
+    # creating and tearing down a new one per event/window
+    fig = plt.figure(num='individual_crisis', figsize=(16, 12), clear=True)
+    axes = fig.subplots(2, 2).flatten()
     
     # Plot each metric
     for i, (metric_name, column) in enumerate(metrics.items()):
@@ -387,11 +395,10 @@ def plot_individual_crisis(
     
     plt.tight_layout()
     
-    # Save
+    # Save (tight_layout already fits the contents, so skip the extra
+    # render pass bbox_inches='tight' would cost)
     filename = f"fig_{event_name}_individual.png"
-    save_path = save_figure(fig, filename, output_dir)
-    
-    plt.close(fig)
+    save_path = save_figure(fig, filename, output_dir, bbox_inches=None)
     
     return Path(save_path)
 
@@ -469,7 +476,8 @@ def plot_all_events_overlay(
     return Path(save_path)
 
 
-# Example/test
+# Example/test (run as a module from the project root:
+#   python -m src.plotting.plot_event_windows)
 if __name__ == "__main__":
     print("Event Window Plotting Module")
     print("\n📊 Available plot functions:")
@@ -20,10 +20,15 @@ Example:
     Crisis period: 2013-03-16 to 2013-06-14 (91 days, inclusive of anchor)
 
 This allows us to compare on-chain behavior before vs. during crises.
+
+Windows are built with numpy datetime64[D] arithmetic: the full run of
+window dates is a single vectorized array rather than one Python/pandas
+object per day.
 """
 
-from datetime import datetime, timedelta
-from typing import Tuple, Dict
+from datetime import datetime
+from typing import Tuple, Dict, NamedTuple
+import numpy as np
 import pandas as pd
 
 
@@ -45,11 +50,36 @@ def parse_date(date_str: str) -> datetime:
     return datetime.strptime(date_str, "%Y-%m-%d")
 
 
+class EventWindow(NamedTuple):
+    """
+    Pre-crisis and crisis date ranges around an anchor date.
+    
+    Attributes:
+        pre: (start_date, end_date) of the pre-period as YYYY-MM-DD strings
+        crisis: (start_date, end_date) of the crisis period as YYYY-MM-DD strings
+        dates: datetime64[D] array of every day from pre start to crisis end
+               (use pd.DatetimeIndex(window.dates) if pandas is needed)
+    """
+    pre: Tuple[str, str]
+    crisis: Tuple[str, str]
+    dates: np.ndarray
+    
+    @property
+    def start(self) -> str:
+        """First day of the window (start of the pre-period)."""
+        return self.pre[0]
+    
+    @property
+    def end(self) -> str:
+        """Last day of the window (end of the crisis period)."""
+        return self.crisis[1]
+
+
 def build_event_window(
     anchor_date: str,
     days_before: int = 90,
     days_after: int = 90
-) -> Dict[str, Tuple[str, str]]:
+) -> EventWindow:
     """
     Build pre-crisis and crisis date ranges around an anchor date.
     
@@ -59,36 +89,31 @@ def build_event_window(
         days_after: Number of days after anchor (crisis period, inclusive)
     
     Returns:
-        Dictionary with keys 'pre' and 'crisis', each containing
-        (start_date, end_date) tuples as strings
+        EventWindow with 'pre' and 'crisis' (start_date, end_date) string
+        tuples and the full array of window dates
     
     Example:
         >>> window = build_event_window("2013-03-16", 90, 90)
-        >>> print(window['pre'])
+        >>> print(window.pre)
         ('2012-12-16', '2013-03-15')
-        >>> print(window['crisis'])
+        >>> print(window.crisis)
         ('2013-03-16', '2013-06-14')
+        >>> print(len(window.dates))
+        181
     """
-    anchor = parse_date(anchor_date)
+    anchor = np.datetime64(anchor_date, 'D')
     
-    # Pre-period: [anchor - days_before, anchor - 1 day]
-    pre_start = anchor - timedelta(days=days_before)
-    pre_end = anchor - timedelta(days=1)
+    # Every day from anchor - days_before to anchor + days_after (inclusive)
+    offsets = np.arange(-days_before, days_after + 1, dtype='int64')
+    dates = anchor + offsets.astype('timedelta64[D]')
     
+    # Pre-period: [anchor - days_before, anchor - 1 day]
     # Crisis period: [anchor, anchor + days_after]
-    crisis_start = anchor
-    crisis_end = anchor + timedelta(days=days_after)
-    
-    return {
-        'pre': (
-            pre_start.strftime("%Y-%m-%d"),
-            pre_end.strftime("%Y-%m-%d")
-        ),
-        'crisis': (
-            crisis_start.strftime("%Y-%m-%d"),
-            crisis_end.strftime("%Y-%m-%d")
-        )
-    }
+    return EventWindow(
+        pre=(str(anchor - days_before), str(anchor - 1)),
+        crisis=(str(anchor), str(anchor + days_after)),
+        dates=dates
+    )
 
 
 def label_period(date: pd.Timestamp, anchor_date: str) -> str:
@@ -196,7 +221,7 @@ def get_all_event_windows(
     events_dict: Dict[str, str],
     days_before: int = 90,
     days_after: int = 90
-) -> Dict[str, Dict[str, Tuple[str, str]]]:
+) -> Dict[str, EventWindow]:
     """
     Build event windows for multiple crises at once.
     
@@ -206,7 +231,7 @@ def get_all_event_windows(
         days_after: Crisis period length
     
     Returns:
-        Nested dict: {event_name: {pre: (start, end), crisis: (start, end)}}
+        Dict: {event_name: EventWindow}
     
     Example:
         >>> events = {
@@ -214,7 +239,7 @@ def get_all_event_windows(
         ...     'covid_cpi_peak_2022': '2022-06-01'
         ... }
         >>> windows = get_all_event_windows(events, 90, 90)
-        >>> print(windows['cyprus_2013']['crisis'])
+        >>> print(windows['cyprus_2013'].crisis)
         ('2013-03-16', '2013-06-14')
     """
     return {
@@ -0,0 +1,180 @@
+"""
+HTTP session helpers with an on-disk response cache.
+
+This module provides:
+- A shared SQLite-backed HTTP cache under data/cache/
+- Session construction for the API data source adapters
+- Conditional GETs (ETag / Last-Modified) for full-history endpoints
+
+Why cache?
+----------
+Historical daily values from public APIs never change, yet every run of
+01_fetch_data.py used to re-download the full history. With the cache,
+re-runs only hit the network once a cached response has expired.
+
+Requires the optional requests-cache package. Without it, build_session()
+returns a plain requests.Session and nothing is cached by the session;
+conditional_get() then keeps its own ETag/Last-Modified sidecar files so
+unchanged resources still come back as a cheap 304.
+
+Usage:
+    from src.utils.http_cache import build_session
+
+    session = build_session(expire_after=timedelta(days=1))
+    response = session.get(url, timeout=30)
+"""
+
+import hashlib
+import json
+import os
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+
+# requests-cache (optional dependency)
+try:
+    import requests_cache
+    HAS_REQUESTS_CACHE = True
+except ImportError:
+    HAS_REQUESTS_CACHE = False
+
+from .io import ensure_dir
+
+
+# Cache directory: <project root>/data/cache (this file is src/utils/http_cache.py)
+CACHE_DIR = Path(__file__).parent.parent.parent / "data" / "cache"
+
+# Response bodies + validators for conditional_get() without requests-cache
+CONDITIONAL_DIR = CACHE_DIR / "conditional"
+
+
+def build_session(
+    expire_after: timedelta = timedelta(days=1),
+    urls_expire_after: Optional[Dict[str, timedelta]] = None,
+    cache_name: str = "http",
+    pool_maxsize: int = 4,
+    cached: bool = True
+) -> requests.Session:
+    """
+    Build a requests session backed by the shared on-disk HTTP cache.
+
+    Args:
+        expire_after: Default lifetime of cached responses
+        urls_expire_after: Optional per-URL-pattern lifetimes
+                          (e.g., {'api.blockchair.com/bitcoin/stats': timedelta(minutes=10)})
+        cache_name: SQLite file name inside data/cache/ (without extension)
+        pool_maxsize: Keep-alive connections kept open per host, so repeated
+                      calls reuse TCP/TLS connections instead of reconnecting
+        cached: If False, return a plain pooled session even when
+                requests-cache is installed (for live data that must
+                never be served from cache)
+
+    Returns:
+        requests_cache.CachedSession if requests-cache is installed,
+        otherwise a plain requests.Session
+
+    Example:
+        >>> session = build_session()
+        >>> response = session.get('https://api.blockchain.info/charts/n-transactions')
+        >>> print(getattr(response, 'from_cache', False))
+        True
+
+    Note:
+        Only GET requests are cached.
+    """
+    if HAS_REQUESTS_CACHE and cached:
+        ensure_dir(CACHE_DIR)
+        session = requests_cache.CachedSession(
+            cache_name=str(CACHE_DIR / cache_name),
+            backend='sqlite',
+            expire_after=expire_after,
+            urls_expire_after=urls_expire_after,
+            allowable_methods=('GET',)
+        )
+    else:
+        session = requests.Session()
+
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    return session
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write bytes via a temp file + rename so readers never see partial files."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def conditional_get(
+    session: requests.Session,
+    url: str,
+    params: Optional[dict] = None,
+    timeout: float = 30
+) -> Tuple[bytes, bool]:
+    """
+    GET a URL, revalidating a previously downloaded copy instead of re-downloading it.
+
+    With requests-cache, the session already does this: once a cached
+    response expires it is revalidated with If-None-Match/If-Modified-Since.
+    With a plain session, the last body and its ETag/Last-Modified headers
+    are kept in data/cache/conditional/ and sent as validators; an HTTP 304
+    returns the stored body.
+
+    Args:
+        session: Session from build_session()
+        url: URL to fetch
+        params: Query parameters
+        timeout: Request timeout in seconds
+
+    Returns:
+        (body, from_cache): Response body bytes, and whether it was served
+        from a local copy rather than downloaded
+
+    Raises:
+        requests.RequestException: If the request fails
+
+    Example:
+        >>> body, from_cache = conditional_get(session, 'https://api.blockchain.info/charts/n-transactions',
+        ...                                    params={'timespan': 'all', 'format': 'json'})
+    """
+    if HAS_REQUESTS_CACHE and isinstance(session, requests_cache.CachedSession):
+        response = session.get(url, params=params, timeout=timeout)
+        response.raise_for_status()
+        return response.content, bool(getattr(response, 'from_cache', False))
+
+    key = hashlib.blake2b(
+        json.dumps([url, sorted((params or {}).items())]).encode(), digest_size=16
+    ).hexdigest()
+    body_path = CONDITIONAL_DIR / f"{key}.body"
+    meta_path = CONDITIONAL_DIR / f"{key}.json"
+
+    headers = {}
+    if body_path.exists() and meta_path.exists():
+        validators = json.loads(meta_path.read_text())
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+
+    response = session.get(url, params=params, headers=headers, timeout=timeout)
+
+    if response.status_code == 304 and headers:
+        return body_path.read_bytes(), True
+
+    response.raise_for_status()
+
+    validators = {
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+    }
+    if validators['etag'] or validators['last_modified']:
+        ensure_dir(CONDITIONAL_DIR)
+        _write_atomic(body_path, response.content)
+        _write_atomic(meta_path, json.dumps(validators).encode())
+
+    return response.content, False
@@ -2,19 +2,39 @@
 Input/output utilities for saving and loading data files.
 
 This module provides helpers for:
-- Saving DataFrames to CSV with consistent formatting
-- Loading CSV files with date parsing
+- Saving DataFrames to CSV with consistent formatting (pyarrow's C++ writer when possible)
+- Loading CSV files with date parsing (pyarrow's multithreaded reader when available)
 - Creating timestamped backups (optional)
 - Ensuring output directories exist
+- Parsing JSON API responses and encoding request bodies (orjson when available)
+- Appending records to JSON Lines logs (e.g. periodic snapshots)
+- Fingerprinting input files (for skipping unchanged recomputations)
 
 All data should flow through these helpers for consistency.
 """
 
+import hashlib
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 from datetime import datetime
 import pandas as pd
 
+# orjson (optional dependency, faster JSON parsing of API responses)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# pyarrow (optional dependency, much faster typed CSV parsing)
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 
 def ensure_dir(path: Path) -> None:
     """
@@ -29,6 +49,53 @@ def ensure_dir(path: Path) -> None:
     Path(path).mkdir(parents=True, exist_ok=True)
 
 
+def _arrow_csv_table(df: pd.DataFrame) -> Optional['pa.Table']:
+    """
+    Convert df to an Arrow table that pyarrow writes exactly like df.to_csv.
+    
+    Only integer/float columns and midnight-only dates (written as
+    YYYY-MM-DD) qualify; anything else (strings, bools, intraday timestamps,
+    whole-number floats) returns None so the caller uses pandas and values
+    read back with the same dtypes.
+    """
+    if not HAS_PYARROW or not df.columns.is_unique:
+        return None
+    
+    columns = {}
+    for name, col in df.items():
+        if not isinstance(name, str) or any(ch in name for ch in ',"\n\r'):
+            return None
+        if pd.api.types.is_datetime64_dtype(col.dtype):
+            if not (col.dropna() == col.dropna().dt.normalize()).all():
+                return None
+            columns[name] = pa.array(col, from_pandas=True).cast(pa.date32())
+        elif pd.api.types.is_integer_dtype(col.dtype):
+            columns[name] = pa.array(col, from_pandas=True)
+        elif pd.api.types.is_float_dtype(col.dtype):
+            # pyarrow writes 2.0 as "2", which would read back as an integer
+            # column; only hand over float columns that keep a fractional value
+            if not (col % 1 != 0).any():
+                return None
+            columns[name] = pa.array(col, from_pandas=True)
+        else:
+            return None
+    
+    return pa.table(columns)
+
+
+def _write_csv(df: pd.DataFrame, file_path: Path) -> None:
+    """Write df without its index, via pyarrow's C++ CSV writer when possible."""
+    table = _arrow_csv_table(df)
+    if table is None:
+        df.to_csv(file_path, index=False, encoding='utf-8')
+        return
+    
+    # pyarrow quotes header names, so write the (plain) header ourselves
+    with open(file_path, 'wb') as f:
+        f.write((','.join(table.column_names) + '\n').encode('utf-8'))
+        pa_csv.write_csv(table, f, pa_csv.WriteOptions(include_header=False, quoting_style='none'))
+
+
 def save_csv(
     df: pd.DataFrame,
     file_path: Path,
@@ -54,6 +121,8 @@ def save_csv(
         - Creates parent directories if they don't exist
         - Saves with index=False (cleaner CSVs)
         - Uses UTF-8 encoding
+        - Date + numeric frames are written by pyarrow (same output format,
+          much faster); other frames use df.to_csv
     """
     file_path = Path(file_path)
     
@@ -61,7 +130,7 @@ def save_csv(
     ensure_dir(file_path.parent)
     
     # Save main file
-    df.to_csv(file_path, index=False, encoding='utf-8')
+    _write_csv(df, file_path)
     print(f"✓ Saved {len(df)} rows to {file_path}")
     
     # Optional: Save timestamped backup
@@ -69,25 +138,70 @@ def save_csv(
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_name = f"{file_path.stem}_{timestamp}{file_path.suffix}"
         backup_path = file_path.parent / backup_name
-        df.to_csv(backup_path, index=False, encoding='utf-8')
+        _write_csv(df, backup_path)
         print(f"  ↳ Backup saved: {backup_path.name}")
     
     return file_path
 
 
+def _read_csv_arrow(
+    file_path: Path,
+    parse_dates: list,
+    columns: Optional[list]
+) -> 'pa.Table':
+    """
+    Read a CSV with pyarrow, typing its columns the way pd.read_csv would.
+    
+    Only the parse_dates columns become timestamps: columns pyarrow infers
+    as dates, times or timestamps on its own are read again as strings.
+    Empty and NA cells in string columns are nulls (NaN in pandas).
+    """
+    column_types = {col: pa.timestamp('ns') for col in parse_dates}
+    
+    def read() -> 'pa.Table':
+        return pa_csv.read_csv(
+            file_path,
+            convert_options=pa_csv.ConvertOptions(
+                column_types=column_types,
+                include_columns=columns,
+                strings_can_be_null=True
+            )
+        )
+    
+    table = read()
+    inferred_temporal = [
+        field.name for field in table.schema
+        if pa.types.is_temporal(field.type) and field.name not in column_types
+    ]
+    if inferred_temporal:
+        column_types.update((name, pa.string()) for name in inferred_temporal)
+        table = read()
+    
+    return table
+
+
 def load_csv(
     file_path: Path,
     parse_dates: Optional[list] = None,
-    date_column: str = 'date'
+    date_column: str = 'date',
+    float_dtype: Optional[str] = None,
+    columns: Optional[list] = None
 ) -> pd.DataFrame:
     """
     Load CSV file into DataFrame with date parsing.
     
+    Uses pyarrow's CSV reader when installed (parses typed numeric columns
+    several times faster than pandas and releases the GIL), and falls back
+    to pd.read_csv otherwise or if pyarrow can't parse the file.
+    
     Args:
         file_path: Path to CSV file
         parse_dates: List of column names to parse as dates
                     If None and date_column exists, parses date_column
         date_column: Default date column name
+        float_dtype: If set (e.g. 'float32'), cast all float columns to it
+        columns: If set, read only these columns, in this order (the other
+                 columns are skipped by the parser, not loaded and dropped)
     
     Returns:
         DataFrame with parsed dates
@@ -109,12 +223,78 @@ def load_csv(
     if parse_dates is None:
         parse_dates = [date_column]
     
-    df = pd.read_csv(file_path, parse_dates=parse_dates, encoding='utf-8')
+    df = None
+    if HAS_PYARROW:
+        try:
+            table = _read_csv_arrow(file_path, parse_dates, columns)
+            missing = set(parse_dates) - set(table.column_names)
+            if missing:
+                raise ValueError(f"Missing column provided to 'parse_dates': {', '.join(sorted(missing))}")
+            df = table.to_pandas()
+        except (pa.ArrowInvalid, pa.ArrowKeyError):
+            df = None  # Irregular file or missing column - let pandas deal with it (or raise)
+    
+    if df is None:
+        df = pd.read_csv(file_path, parse_dates=parse_dates, usecols=columns, encoding='utf-8')
+        if columns is not None:
+            df = df[columns]
+    
+    if float_dtype is not None:
+        float_cols = df.select_dtypes('float').columns
+        df[float_cols] = df[float_cols].astype(float_dtype)
+    
     print(f"✓ Loaded {len(df)} rows from {file_path}")
     
     return df
 
 
+def parse_json(raw: bytes):
+    """
+    Parse a JSON document (e.g. an API response body).
+    
+    Uses orjson when installed (several times faster than the stdlib
+    parser), json.loads otherwise.
+    
+    Args:
+        raw: JSON document as bytes or str
+    
+    Returns:
+        Parsed Python object
+    
+    Example:
+        >>> parse_json(response.content)['data']
+    """
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    
+    import json
+    return json.loads(raw)
+
+
+def encode_json(data) -> bytes:
+    """
+    Serialize an object to compact UTF-8 JSON bytes (e.g. a request body).
+    
+    Uses orjson when installed (several times faster than the stdlib
+    encoder), json.dumps otherwise.
+    
+    Args:
+        data: JSON-serializable object
+    
+    Returns:
+        JSON document as bytes
+    
+    Example:
+        >>> encode_json({'method': 'getblockcount', 'params': []})
+        b'{"method":"getblockcount","params":[]}'
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    
+    import json
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
 def save_json(data: dict, file_path: Path) -> Path:
     """
     Save dictionary to JSON file (for raw API responses).
@@ -142,6 +322,44 @@ def save_json(data: dict, file_path: Path) -> Path:
     return file_path
 
 
+def append_jsonl(record: dict, file_path: Union[str, Path]) -> Union[str, Path]:
+    """
+    Append one record as a line to a JSON Lines file.
+    
+    The line is serialized up front (orjson when installed) and written with
+    a single write() to an O_APPEND descriptor, so periodic jobs grow one
+    file instead of creating a new file per record, and each record lands
+    as a whole line.
+    
+    Args:
+        record: JSON-serializable dictionary
+        file_path: Output .jsonl path (created, with its directory, if missing)
+    
+    Returns:
+        file_path, unchanged (plain strings are used as-is, so frequent
+        callers can skip building Path objects)
+    
+    Example:
+        >>> append_jsonl({'timestamp': '2024-01-15T12:00:00'}, Path("data/raw/snapshots.jsonl"))
+    """
+    line = encode_json(record) + b"\n"
+    
+    flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+    try:
+        fd = os.open(file_path, flags, 0o644)
+    except FileNotFoundError:
+        # Only the first write into a new directory pays for the mkdir
+        ensure_dir(os.path.dirname(os.fspath(file_path)) or '.')
+        fd = os.open(file_path, flags, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+    
+    print(f"✓ Appended record to {file_path}")
+    return file_path
+
+
 def load_json(file_path: Path) -> dict:
     """
     Load JSON file into dictionary.
@@ -169,6 +387,30 @@ def load_json(file_path: Path) -> dict:
     return data
 
 
+def fingerprint(file_path: Path, chunk_size: int = 1 << 20) -> str:
+    """
+    Compute a content hash of a file (BLAKE2b, 128-bit).
+    
+    Args:
+        file_path: Path to file
+        chunk_size: Bytes read per chunk (keeps memory flat for large CSVs)
+    
+    Returns:
+        32-character hex digest; changes whenever the file content changes
+    
+    Example:
+        >>> fingerprint(Path("data/raw/blockchain_com_bdd.csv"))
+        '3f1c9a0e5b7d2e4f8a6c1b0d9e7f5a3c'
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    
+    return digest.hexdigest()
+
+
 def get_latest_file(directory: Path, pattern: str = "*.csv") -> Optional[Path]:
     """
     Get the most recently modified file matching a pattern.
@@ -4,13 +4,15 @@ Mathematical and statistical utilities for analysis.
 This module provides:
 - Percent change calculations
 - Percentile computations
-- Rolling averages
+- Rolling averages and z-scores
 - Basic descriptive statistics
+- Streaming (fixed-memory) quantile estimates
 
 All calculations use BTC-native units (no USD conversions).
 """
 
-from typing import Union
+import math
+from typing import Tuple, Union
 import pandas as pd
 import numpy as np
 
@@ -80,6 +82,14 @@ def pp_change(
     return round(pp, round_decimals)
 
 
+def _window_sums(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing sums over `window` positions (fewer at the start), via cumsum."""
+    cs = np.cumsum(values, dtype=np.float64)
+    sums = cs.copy()
+    sums[window:] -= cs[:-window]
+    return sums
+
+
 def rolling_mean(
     series: pd.Series,
     window: int = 30,
@@ -88,6 +98,12 @@ def rolling_mean(
     """
     Calculate rolling (moving) average.
     
+    Vectorized with cumulative sums of the values and of the valid counts
+    (no per-window state), on values centered near the series mean so the
+    running sum keeps its precision. Matches pandas' .rolling().mean()
+    (exactly for whole-number data such as tx counts, to float rounding
+    otherwise; NaNs skipped).
+    
     Args:
         series: Pandas Series to smooth
         window: Window size in periods (default: 30 days)
@@ -110,7 +126,99 @@ def rolling_mean(
         - Smooth noisy daily metrics (fees, tx counts)
         - 30-day MA is common for Bitcoin analysis
     """
-    return series.rolling(window=window, min_periods=min_periods).mean()
+    x = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = ~np.isnan(x)
+    
+    if valid.all():
+        # No gaps: window i holds min(i + 1, window) values
+        n = np.minimum(np.arange(1.0, len(x) + 1), window)
+        # A whole-number shift keeps integer counts exact (identical to pandas)
+        shift = np.round(x.mean()) if len(x) else 0.0
+        s1 = _window_sums(x - shift, window)
+    else:
+        n = _window_sums(valid.astype(np.float64), window)
+        shift = np.round(x[valid].mean()) if valid.any() else 0.0
+        s1 = _window_sums(np.where(valid, x - shift, 0.0), window)
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(n >= max(min_periods, 1), (s1 + shift * n) / n, np.nan)
+    
+    return pd.Series(mean, index=series.index, name=series.name)
+
+
+def rolling_mean_std(
+    series: Union[pd.Series, np.ndarray],
+    window: int = 30,
+    min_periods: int = 1
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate rolling mean and standard deviation together.
+    
+    Vectorized with cumulative sums (sum, sum of squares and count share
+    one pass each), instead of two separate pandas rolling passes. Values
+    are centered on the series mean first so the sum of squares keeps its
+    precision. Same results as pandas' .rolling().mean() / .std()
+    (ddof=1, NaNs skipped).
+    
+    Args:
+        series: Values (Series or array)
+        window: Window size in periods (default: 30 days)
+        min_periods: Minimum observations needed (default: 1; the std
+                     always needs at least 2)
+    
+    Returns:
+        (rolling_mean, rolling_std) as float64 arrays
+    
+    Example:
+        >>> mean, std = rolling_mean_std(pd.Series([1, 2, 3, 4, 5]), window=3)
+        >>> std
+        array([nan, 0.70710678, 1.        , 1.        , 1.        ])
+    """
+    x = np.asarray(series, dtype=np.float64)
+    valid = ~np.isnan(x)
+    shift = x[valid].mean() if valid.any() else 0.0
+    centered = np.where(valid, x - shift, 0.0)
+    
+    n = _window_sums(valid.astype(np.float64), window)
+    s1 = _window_sums(centered, window)
+    s2 = _window_sums(centered * centered, window)
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(n >= max(min_periods, 1), s1 / n + shift, np.nan)
+        var = np.maximum(s2 - s1 * s1 / n, 0.0) / (n - 1)
+        std = np.where(n >= max(min_periods, 2), np.sqrt(var), np.nan)
+    
+    return mean, std
+
+
+def rolling_zscore(
+    series: pd.Series,
+    window: int = 30,
+    min_periods: int = 1
+) -> Tuple[pd.Series, pd.Series, pd.Series]:
+    """
+    Calculate rolling mean, rolling std and z-score in one pass.
+    
+    Args:
+        series: Pandas Series (e.g. daily BDD)
+        window: Window size in periods (default: 30 days)
+        min_periods: Minimum observations needed (default: 1)
+    
+    Returns:
+        (mean, std, z) Series aligned with the input, where
+        z = (value - mean) / std (NaN where std is 0 or undefined)
+    
+    Use Case:
+        - Spike detection: z > 3 flags a day far above its recent range
+    """
+    mean, std = rolling_mean_std(series, window=window, min_periods=min_periods)
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        z = (np.asarray(series, dtype=np.float64) - mean) / std
+    z[std == 0] = np.nan
+    
+    index = series.index
+    return pd.Series(mean, index=index), pd.Series(std, index=index), pd.Series(z, index=index)
 
 
 def compute_percentiles(
@@ -120,6 +228,10 @@ def compute_percentiles(
     """
     Compute multiple percentiles from a series.
     
+    All percentiles come from one np.partition of the non-missing values
+    (partition_percentiles()), instead of one Series.quantile pass each;
+    same values (linear interpolation, NaNs skipped).
+    
     Args:
         series: Pandas Series of values
         percentiles: List of percentiles to compute (e.g., [50, 90])
@@ -137,7 +249,208 @@ def compute_percentiles(
         - Urgency fee rate (p90)
         - Spread = p90 - p50
     """
-    return {p: series.quantile(p / 100) for p in percentiles}
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return {p: np.nan for p in percentiles}
+    
+    quantiles = partition_percentiles(values, np.asarray(percentiles, dtype=np.float64) / 100)
+    return {p: q for p, q in zip(percentiles, quantiles)}
+
+
+def partition_percentiles(
+    values,
+    quantiles: tuple = (0.5, 0.9)
+) -> np.ndarray:
+    """
+    Compute a few quantiles with one np.partition (no full sort).
+    
+    Selects only the order statistics the quantiles need, in a single
+    introselect pass, then interpolates linearly between them: the same
+    values as np.percentile's default method, with less per-call overhead.
+    
+    Args:
+        values: Non-empty array-like of numbers
+        quantiles: Quantiles in [0, 1]
+    
+    Returns:
+        float64 array, one value per quantile
+    
+    Example:
+        >>> partition_percentiles([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+        array([5.5, 9.1])
+    """
+    values = np.asarray(values, dtype=np.float64)
+    pos = np.asarray(quantiles, dtype=np.float64) * (len(values) - 1)
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.minimum(lo + 1, len(values) - 1)
+    
+    selected = np.partition(values, np.unique(np.concatenate((lo, hi))))
+    return _lerp(selected[lo], selected[hi], pos - lo)
+
+
+def _lerp(below: np.ndarray, above: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """
+    np.percentile's linear interpolation between neighbouring order statistics.
+    
+    Interpolates from the nearer neighbour, so results are bit-identical to
+    np.percentile (a plain below + (above - below) * t can differ in the
+    last bit).
+    """
+    diff = above - below
+    return np.where(t >= 0.5, above - diff * (1 - t), below + diff * t)
+
+
+def sorted_group_quantiles(
+    values: np.ndarray,
+    starts: np.ndarray,
+    quantiles: list = [0.5, 0.9]
+) -> np.ndarray:
+    """
+    Compute quantiles of every group of an array sorted by (group, value).
+    
+    All groups are handled with a few vectorized gathers (no per-group
+    Python calls or re-sorting). Linear interpolation, bit-identical to
+    np.percentile on each group.
+    
+    Args:
+        values: Values sorted by group, then ascending within each group
+        starts: Index where each group begins (ascending, starts[0] == 0)
+        quantiles: Quantiles in [0, 1]
+    
+    Returns:
+        float64 array of shape (len(starts), len(quantiles))
+    
+    Example:
+        >>> sorted_group_quantiles(np.array([50., 100., 75.]), np.array([0, 2]), [0.5, 0.9])
+        array([[75., 95.],
+               [75., 75.]])
+    """
+    values = np.asarray(values, dtype=np.float64)
+    starts = np.asarray(starts, dtype=np.int64)
+    counts = np.diff(np.append(starts, len(values)))
+    
+    out = np.empty((len(starts), len(quantiles)))
+    for j, q in enumerate(quantiles):
+        # Position within each group first, as np.percentile computes it
+        # (adding the group offset before flooring would round the fraction)
+        pos = q * (counts - 1)
+        lo = np.floor(pos).astype(np.int64)
+        hi = np.minimum(lo + 1, counts - 1)
+        out[:, j] = _lerp(values[starts + lo], values[starts + hi], pos - lo)
+    
+    return out
+
+
+class QuantileSketch:
+    """
+    Streaming quantile estimate in fixed memory (log-bucketed histogram).
+    
+    Positive values are counted in buckets whose bounds grow geometrically,
+    so any quantile is returned within relative_error of the exact value
+    (the same guarantee as DDSketch). Memory is one int64 counter per bucket
+    (~900 for the defaults) no matter how many values are added, and
+    sketches merge by adding counters.
+    
+    Args:
+        relative_error: Maximum relative error of returned quantiles
+        min_value: Smallest positive value resolved (smaller ones share a bucket)
+        max_value: Largest value resolved (larger ones share a bucket)
+    
+    Example:
+        >>> sketch = QuantileSketch()
+        >>> sketch.update([50, 100, 75])
+        >>> round(sketch.quantile(0.5))  # exact median: 75
+        74
+    
+    Use Case:
+        - Daily median / p90 fee rates straight from a block scan, without
+          keeping every transaction of the day in memory
+    """
+    
+    def __init__(
+        self,
+        relative_error: float = 0.01,
+        min_value: float = 0.01,
+        max_value: float = 1e6
+    ):
+        self.gamma = (1 + relative_error) / (1 - relative_error)
+        self._log_gamma = math.log(self.gamma)
+        self._min_value = min_value
+        self._offset = math.ceil(math.log(min_value) / self._log_gamma)
+        n_buckets = math.ceil(math.log(max_value) / self._log_gamma) - self._offset + 1
+        self.counts = np.zeros(n_buckets, dtype=np.int64)
+        self.zero_count = 0  # Values <= 0 (e.g. zero-fee transactions)
+    
+    @property
+    def count(self) -> int:
+        """Number of values added."""
+        return int(self.counts.sum()) + self.zero_count
+    
+    def update(self, values) -> None:
+        """
+        Add values to the sketch.
+        
+        Args:
+            values: Array-like of numbers
+        """
+        values = np.asarray(values, dtype=np.float64)
+        positive = values[values > 0]
+        self.zero_count += len(values) - len(positive)
+        
+        # Bucket i holds (gamma^(i-1), gamma^i]
+        buckets = np.ceil(np.log(np.maximum(positive, self._min_value)) / self._log_gamma)
+        buckets = np.clip(buckets.astype(np.int64) - self._offset, 0, len(self.counts) - 1)
+        self.counts += np.bincount(buckets, minlength=len(self.counts))
+    
+    def merge(self, other: 'QuantileSketch') -> None:
+        """Add another sketch's values (built with the same parameters)."""
+        self.counts += other.counts
+        self.zero_count += other.zero_count
+    
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the counters compactly (only non-empty buckets).
+        
+        Restore with QuantileSketch.from_bytes() and the same parameters.
+        """
+        buckets = np.flatnonzero(self.counts)
+        return np.concatenate(([self.zero_count], buckets, self.counts[buckets])).astype(np.int64).tobytes()
+    
+    @classmethod
+    def from_bytes(cls, data: bytes, **params) -> 'QuantileSketch':
+        """
+        Rebuild a sketch serialized by to_bytes().
+        
+        Args:
+            data: Bytes from to_bytes()
+            **params: Same constructor arguments the sketch was built with
+        """
+        sketch = cls(**params)
+        values = np.frombuffer(data, dtype=np.int64)
+        n_buckets = (len(values) - 1) // 2
+        sketch.zero_count = int(values[0])
+        sketch.counts[values[1:1 + n_buckets]] = values[1 + n_buckets:]
+        return sketch
+    
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the q-quantile (0 <= q <= 1).
+        
+        Returns:
+            Estimated value, or NaN if the sketch is empty
+        """
+        total = self.count
+        if total == 0:
+            return np.nan
+        
+        # Nearest-rank quantile, then the value that bounds its bucket's error
+        rank = q * (total - 1)
+        if rank < self.zero_count:
+            return 0.0
+        
+        bucket = int(np.searchsorted(np.cumsum(self.counts), rank - self.zero_count, side='right'))
+        return 2 * self.gamma ** (bucket + self._offset) / (self.gamma + 1)
 
 
 def urgency_spread(p90: float, p50: float) -> float: